@@ -1,13 +1,15 @@
 import os
+import sys
 import time
-import torch
-from faster_whisper import WhisperModel
 from datetime import datetime
 import logging
-from multiprocessing import Pool, cpu_count
-import numpy as np
+from multiprocessing import cpu_count
 import re
 
+# 공용 STT 워커 풀 (fastapi/STT_Model/Voice_Input_API/stt_pool.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "fastapi", "STT_Model", "Voice_Input_API"))
+from stt_pool import STTWorkerPool
+
 def setup_logging():
     """로깅 설정"""
     log_dir = "Logs"
@@ -23,38 +25,20 @@ def setup_logging():
         ]
     )
 
-def setup_gpu():
-    """GPU 사용 가능 여부 확인 및 설정"""
-    if torch.cuda.is_available():
-        logging.info(f"GPU 사용 가능: {torch.cuda.get_device_name(0)}")
-        return "cuda", "float16"
-    else:
-        logging.info("GPU 사용 불가능 - CPU 모드로 실행")
-        return "cpu", "int8"
-
-def load_model():
-    """모델 로딩"""
-    start_time = time.time()
-    device, compute_type = setup_gpu()
-    model = WhisperModel("base", device=device, compute_type=compute_type)
-    load_time = time.time() - start_time
-    logging.info(f"모델 로딩 완료 (소요 시간: {load_time:.2f}초)")
-    return model
-
-def process_single_file(file_path):
-    """단일 파일 처리 (각 프로세스에서 실행)"""
+def process_single_file(file_path, transcription):
+    """단일 파일 전사 결과 정리 (모델은 워커 풀의 각 프로세스에서 한 번만 로딩)"""
     try:
-        device, compute_type = setup_gpu()
-        model = WhisperModel("base", device=device, compute_type=compute_type)
-        
-        segments, info = model.transcribe(file_path, beam_size=5)
+        if isinstance(transcription, Exception):
+            raise transcription
+        segments, info = transcription
         
         # 한국어가 아닌 경우 처리 중단
-        if info.language != 'ko':
+        if info['language'] != 'ko':
             return {
                 'file': file_path,
                 'success': False,
-                'error': f"지원하지 않는 언어 감지: {info.language} (확률: {info.language_probability:.2f})"
+                'language': info['language'],
+                'error': f"지원하지 않는 언어 감지: {info['language']} (확률: {info['language_probability']:.2f})"
             }
         
         results = []
@@ -79,8 +63,8 @@ def process_single_file(file_path):
         return {
             'file': file_path,
             'success': True,
-            'language': info.language,
-            'language_probability': info.language_probability,
+            'language': info['language'],
+            'language_probability': info['language_probability'],
             'segments': results
         }
     except Exception as e:
@@ -100,98 +84,42 @@ def find_audio_files(folder):
     ]
     return audio_files
 
-def detect_language(model, file_path):
-    """파일의 언어 감지"""
-    try:
-        segments, info = model.transcribe(file_path, beam_size=5)
-        return {
-            'file': file_path,
-            'is_korean': info.language == 'ko',
-            'language': info.language,
-            'probability': info.language_probability
-        }
-    except Exception as e:
-        return {
-            'file': file_path,
-            'is_korean': False,
-            'error': str(e)
-        }
-
 def process_files(audio_files):
     """파일 병렬 처리"""
     n_processes = min(4, cpu_count())
     logging.info(f"병렬 처리 프로세스 수: {n_processes}")
     
-    # 언어 감지를 위한 모델 로드
-    device, compute_type = setup_gpu()
-    model = WhisperModel("base", device=device, compute_type=compute_type)
-    
-    # 먼저 한국어 파일 필터링
-    logging.info("\n한국어 파일 필터링 시작...")
-    korean_files = []
-    non_korean_files = []
-    
-    for file in audio_files:
-        result = detect_language(model, file)
-        if result['is_korean']:
-            korean_files.append(file)
-            logging.info(f"한국어 파일 감지: {os.path.basename(file)}")
-        else:
-            non_korean_files.append({
-                'file': file,
-                'language': result.get('language', 'unknown'),
-                'probability': result.get('probability', 0)
-            })
-            logging.info(f"비한국어 파일 제외: {os.path.basename(file)}")
-    
-    logging.info(f"\n총 {len(audio_files)}개 중 한국어 파일: {len(korean_files)}개")
-    logging.info(f"비한국어 파일: {len(non_korean_files)}개")
-    
-    if not korean_files:
-        logging.warning("처리할 한국어 파일이 없습니다.")
-        return 0
-    
     successful = 0
     failed = 0
+    non_korean = 0
     error_files = []
     
     try:
-        with Pool(processes=n_processes) as pool:
-            results = []
-            for batch in np.array_split(korean_files, n_processes):
-                for file in batch:
-                    results.append(pool.apply_async(process_single_file, (file,)))
-            
-            # 결과 수집
-            for result in results:
-                try:
-                    data = result.get(timeout=300)
-                    if data['success'] and len(data['segments']) > 0:
-                        successful += 1
-                        logging.info(f"\n[변환 성공] 파일: {os.path.basename(data['file'])}")
-                        logging.info("="*50)
-                        logging.info("한국어 음성-텍스트 변환 결과:")
-                        for segment in data['segments']:
-                            logging.info(f"[{segment['start']:.1f}초 ~ {segment['end']:.1f}초] {segment['text']}")
-                        logging.info("="*50)
-                    else:
-                        failed += 1
-                        error_files.append({
-                            'file': os.path.basename(data['file']),
-                            'error': data.get('error', '한국어 텍스트 없음')
-                        })
-                        logging.error(f"[실패] 파일: {os.path.basename(data['file'])} - {data.get('error', '한국어 텍스트 없음')}")
-                        
-                except Exception as e:
+        # 언어 감지와 변환을 한 번의 전사로 처리 (language=None: 자동 감지)
+        with STTWorkerPool("base", workers=n_processes, options={"language": None}) as pool:
+            for file, transcription in pool.map(audio_files, timeout=300):
+                data = process_single_file(file, transcription)
+                if data['success'] and len(data['segments']) > 0:
+                    successful += 1
+                    logging.info(f"\n[변환 성공] 파일: {os.path.basename(data['file'])}")
+                    logging.info("="*50)
+                    logging.info("한국어 음성-텍스트 변환 결과:")
+                    for segment in data['segments']:
+                        logging.info(f"[{segment['start']:.1f}초 ~ {segment['end']:.1f}초] {segment['text']}")
+                    logging.info("="*50)
+                elif data.get('language', 'ko') != 'ko':
+                    non_korean += 1
+                    logging.info(f"비한국어 파일 제외: {os.path.basename(data['file'])}")
+                else:
                     failed += 1
                     error_files.append({
-                        'file': 'Unknown',
-                        'error': str(e)
+                        'file': os.path.basename(data['file']),
+                        'error': data.get('error', '한국어 텍스트 없음')
                     })
-                    logging.error(f"처리 중 예외 발생: {str(e)}")
+                    logging.error(f"[실패] 파일: {os.path.basename(data['file'])} - {data.get('error', '한국어 텍스트 없음')}")
             
-            pool.close()
-            pool.join()
+            for worker_id, stats in pool.utilisation().items():
+                logging.info(f"워커 {worker_id}: {stats['jobs']}건, 가동률 {stats['utilisation']:.1%}")
             
     except Exception as e:
         logging.error(f"프로세스 풀 실행 중 치명적 오류: {str(e)}")
@@ -200,7 +128,8 @@ def process_files(audio_files):
         logging.info("\n" + "="*50)
         logging.info("처리 완료 요약")
         logging.info("="*50)
-        logging.info(f"총 처리된 한국어 파일: {len(korean_files)}개")
+        logging.info(f"총 처리된 한국어 파일: {successful + failed}개")
+        logging.info(f"비한국어 파일: {non_korean}개")
         logging.info(f"변환 성공: {successful}개")
         logging.info(f"변환 실패: {failed}개")
         logging.info("="*50)
@@ -1,14 +1,16 @@
 import os
+import sys
 import time
-import torch
-from faster_whisper import WhisperModel
 from datetime import datetime
 import logging
-from multiprocessing import Pool, cpu_count
-import numpy as np
+from multiprocessing import cpu_count
 import re
 import json
 
+# 공용 STT 워커 풀 (fastapi/STT_Model/Voice_Input_API/stt_pool.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "fastapi", "STT_Model", "Voice_Input_API"))
+from stt_pool import STTWorkerPool
+
 def setup_logging():
     log_dir = "Logs"
     os.makedirs(log_dir, exist_ok=True)
@@ -23,30 +25,11 @@ def setup_logging():
         ]
     )
 
-def setup_gpu():
-    if torch.cuda.is_available():
-        logging.info(f"GPU 사용 가능: {torch.cuda.get_device_name(0)}")
-        return "cuda", "float16"
-    else:
-        logging.info("GPU 사용 불가능 - CPU 모드로 실행")
-        return "cpu", "int8"
-
-def process_single_file(file_path, output_dir):
+def process_single_file(file_path, transcription, output_dir):
+    """워커 풀 전사 결과 저장 (모델은 워커마다 한 번만 로딩)"""
     try:
-        logging.info(f"\n시작: {os.path.basename(file_path)} 처리 중...")
-        device, compute_type = setup_gpu()
-        
-        # 모델 로딩 시간 제한
-        start_time = time.time()
-        model = WhisperModel("base", device=device, compute_type=compute_type)
-        if time.time() - start_time > 10:  # 10초로 수정
-            raise TimeoutError("모델 로딩 시간 초과 (10초)")
-        
-        # 음성 변환 시간 제한
-        start_time = time.time()
-        segments, info = model.transcribe(file_path, beam_size=5)
-        if time.time() - start_time > 10:  # 10초로 수정
-            raise TimeoutError("음성 변환 시간 초과 (10초)")
+        logging.info(f"\n시작: {os.path.basename(file_path)} 결과 정리 중...")
+        segments, info = transcription
         
         results = []
         korean_pattern = re.compile('[가-힣]')
@@ -96,48 +79,28 @@ def process_files(audio_files, output_dir):
     failed = 0
     
     try:
-        with Pool(processes=n_processes) as pool:
-            batch_size = min(len(audio_files), n_processes)  # 배치 크기 축소
-            
-            for i in range(0, len(audio_files), batch_size):
-                batch = audio_files[i:i+batch_size]
-                async_results = []
-                
-                # 배치 작업 제출
-                for file in batch:
-                    logging.info(f"작업 추가: {os.path.basename(file)}")
-                    async_results.append(
-                        pool.apply_async(process_single_file, (file, output_dir))
-                    )
-                
-                # 배치 결과 수집 (타임아웃 적용)
-                for idx, async_result in enumerate(async_results):
-                    try:
-                        success, segment_count = async_result.get(timeout=30)  # 타임아웃 30초로 증가
-                        if success:
-                            successful += 1
-                        else:
-                            failed += 1
-                    except Exception as e:
+        # language=None: 기존과 같이 언어 자동 감지
+        with STTWorkerPool("base", workers=n_processes, options={"language": None}) as pool:
+            futures = [(file, pool.submit(file)) for file in audio_files]
+            for completed, (file, future) in enumerate(futures, 1):
+                try:
+                    success, segment_count = process_single_file(file, future.result(timeout=300), output_dir)
+                    if success:
+                        successful += 1
+                    else:
                         failed += 1
-                        logging.error(f"처리 실패: {str(e)}")
-                    finally:
-                        # 진행률 계산 및 로깅
-                        completed = i + idx + 1
-                        total = len(audio_files)
-                        progress = (completed / total) * 100
-                        logging.info(f"진행률: {completed}/{total} ({progress:.1f}%)")
-                        
-                        if completed >= total:
-                            logging.info("모든 파일 처리 완료")
-                            pool.terminate()  # 모든 작업 완료 시 풀 강제 종료
-                            return successful, failed
-                
-                # 배치 처리 완료 후 메모리 정리
-                del async_results
+                except Exception as e:
+                    failed += 1
+                    logging.error(f"처리 실패 ({os.path.basename(file)}): {str(e)}")
+                finally:
+                    # 진행률 계산 및 로깅
+                    total = len(audio_files)
+                    progress = (completed / total) * 100
+                    logging.info(f"진행률: {completed}/{total} ({progress:.1f}%)")
             
-            pool.close()
-            pool.join()
+            logging.info("모든 파일 처리 완료")
+            for worker_id, stats in pool.utilisation().items():
+                logging.info(f"워커 {worker_id}: {stats['jobs']}건, 가동률 {stats['utilisation']:.1%}")
     
     except Exception as e:
         logging.error(f"프로세스 풀 실행 중 오류: {str(e)}")
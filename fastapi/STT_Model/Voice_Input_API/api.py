@@ -1,10 +1,18 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException, Form
 from fastapi.middleware.cors import CORSMiddleware
-import logging
+from fastapi.concurrency import run_in_threadpool
 import os
+import asyncio
+import logging
 from model_loader import load_model
 from audio_processor import process_audio_file
+from audio_decoder import decode_audio_bytes, SAMPLE_RATE
 from qa_processor import KoreanQAProcessor
+from inference_executor import run_inference, shutdown_executor
+from stt_scheduler import BatchScheduler, SchedulerBusy, REQUEST_TIMEOUT
+from stt_pool import STTWorkerPool, POOL_WORKERS
+from tiered_transcriber import TieredTranscriber, FAST_MODEL_SIZE
+from vad import trim_audio, vad_stats, VAD_METHOD
 import uvicorn
 
 '''
@@ -34,9 +42,55 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 모델 전역 초기화
-model = load_model()
-qa_processor = KoreanQAProcessor()
+# 모델 전역 객체 (spawn 워커가 이 모듈을 다시 import해도 모델을 로딩하지 않도록 startup에서 초기화)
+model = None
+qa_processor = None
+scheduler = None
+stt_pool = None
+tiered = None
+
+@app.on_event("startup")
+async def init_models():
+    """STT 모델 초기화 (여러 번 호출해도 한 번만 실행)
+
+    /api로 mount된 하위 앱의 startup 이벤트는 실행되지 않으므로 fastapi/main.py의 startup에서도 호출한다.
+    """
+    global model, qa_processor, scheduler, stt_pool, tiered
+    if qa_processor is not None:
+        return
+    qa_processor = KoreanQAProcessor()
+    if POOL_WORKERS > 0:
+        # 여러 워커 프로세스가 각자 모델을 로딩 (STT_POOL_WORKERS)
+        stt_pool = STTWorkerPool(workers=POOL_WORKERS)
+        return
+    model = load_model()
+    # 짧은 답변은 작은 모델로 먼저 인식 (STT_FAST_MODEL을 비우면 사용하지 않음)
+    if FAST_MODEL_SIZE:
+        tiered = TieredTranscriber(load_model(FAST_MODEL_SIZE), vad_filter=VAD_METHOD == "none")
+    # 동시 요청을 묶어서 처리하는 STT 스케줄러 (STT_BATCHING=0이면 요청별 처리)
+    if os.environ.get("STT_BATCHING", "1") != "0":
+        scheduler = BatchScheduler(model)
+        scheduler.start()
+
+@app.on_event("shutdown")
+async def close_models():
+    global model, qa_processor, scheduler, stt_pool, tiered
+    if scheduler is not None:
+        await scheduler.stop()
+    if stt_pool is not None:
+        await run_in_threadpool(stt_pool.close)
+    shutdown_executor()
+    model = qa_processor = scheduler = stt_pool = tiered = None
+
+@app.get("/stt/stats")
+async def stt_stats():
+    if stt_pool is not None:
+        return {"workers": stt_pool.utilisation(), "vad": vad_stats()}
+    return {
+        "scheduler": scheduler.report() if scheduler is not None else None,
+        "tiered": tiered.report() if tiered is not None else None,
+        "vad": vad_stats(),
+    }
 
 @app.post("/process-voice")
 async def process_voice(
@@ -50,17 +104,30 @@ async def process_voice(
     logging.info(f"Received voice request - Question: {question}, Type: {question_type}")
     logging.info(f"Audio file size: {audio.size} bytes")
     
-    # 임시 파일로 저장
-    temp_file = f"temp_{question_type}.wav"
     try:
-        # 임시 파일로 저장
+        # 임시 파일 없이 메모리에서 16 kHz 모노 float32 배열로 변환 (요청마다 독립된 버퍼)
         content = await audio.read()
-        with open(temp_file, "wb") as f:
-            f.write(content)
-        logging.info(f"Saved temporary file: {temp_file}")
+        samples = await run_in_threadpool(decode_audio_bytes, content)
+        logging.info(f"Decoded audio: {len(samples) / SAMPLE_RATE:.2f}s")
+        
+        # 앞뒤 무음 제거, 음성이 없으면 모델을 실행하지 않고 바로 반환
+        samples, vad_info = await run_in_threadpool(trim_audio, samples)
+        if len(samples) == 0:
+            logging.info(f"No speech detected, skipped {vad_info['skipped_seconds']:.2f}s")
+            return {"error": "음성이 인식되지 않았습니다"}
         
         # 오디오 처리
-        segments, info = process_audio_file(model, temp_file)
+        segments, info = None, None
+        if stt_pool is not None:
+            segments, info = await stt_pool.transcribe_async(samples, timeout=REQUEST_TIMEOUT)
+        elif tiered is not None:
+            # 짧은 답변 빠른 경로 (신뢰도가 낮으면 None -> large-v3)
+            segments, info = await run_inference(tiered.fast_transcribe, samples, question_type)
+        if segments is None and stt_pool is None:
+            if scheduler is not None:
+                segments, info = await scheduler.submit(samples)
+            else:
+                segments, info = await run_inference(process_audio_file, model, samples, f"upload:{question_type}")
         if segments is None:
             logging.error("Audio processing failed")
             return {"error": "음성 처리 실패"}
@@ -75,7 +142,7 @@ async def process_voice(
         logging.info(f"Extracted text: {answer_text}")
         
         # QA 처리
-        processed_answer = qa_processor.get_answer(question, answer_text, question_type)
+        processed_answer = await run_inference(qa_processor.get_answer, question, answer_text, question_type)
         if not processed_answer:
             return {"error": "답변을 처리할 수 없습니다"}
             
@@ -86,14 +153,15 @@ async def process_voice(
             "raw_text": answer_text,
             "processed_answer": processed_answer
         }
+    except SchedulerBusy as e:
+        logging.warning(f"STT 요청 거절: {str(e)}")
+        raise HTTPException(status_code=503, detail="음성 인식 요청이 많아 잠시 후 다시 시도해 주세요")
+    except asyncio.TimeoutError:
+        logging.warning("STT 요청 제한 시간 초과")
+        raise HTTPException(status_code=504, detail="음성 인식 시간이 초과되었습니다")
     except Exception as e:
         logging.error(f"Error processing voice: {str(e)}")
         return {"error": str(e), "success": False}
-    finally:
-        # 임시 파일 삭제
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
-            logging.info(f"Removed temporary file: {temp_file}")
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
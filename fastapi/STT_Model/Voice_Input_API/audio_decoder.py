@@ -0,0 +1,75 @@
+import io
+import struct
+import logging
+import numpy as np
+
+SAMPLE_RATE = 16000  # Whisper 입력 샘플링 레이트
+
+# WAV 포맷 코드
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+def _parse_wav(data):
+    """RIFF/WAVE 헤더 파싱 -> (포맷, 채널 수, 샘플링 레이트, 샘플 비트 수, data 청크 시작, 길이) 또는 None"""
+    if len(data) < 12 or data[0:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return None
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        chunk_size = struct.unpack_from("<I", data, offset + 4)[0]
+        body = offset + 8
+        if chunk_id == b"fmt ":
+            audio_format, channels, rate = struct.unpack_from("<HHI", data, body)
+            bits = struct.unpack_from("<H", data, body + 14)[0]
+            if audio_format == WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40:
+                # 확장 포맷은 SubFormat GUID 앞 2바이트가 실제 포맷 코드
+                audio_format = struct.unpack_from("<H", data, body + 24)[0]
+            fmt = (audio_format, channels, rate, bits)
+        elif chunk_id == b"data" and fmt is not None:
+            # 녹음 중단 등으로 크기가 잘못 기록된 경우 실제 남은 바이트까지만 사용
+            return (*fmt, body, min(chunk_size, len(data) - body))
+        offset = body + chunk_size + (chunk_size & 1)
+    return None
+
+def _decode_wav(data):
+    """16 kHz PCM16 / float32 WAV -> float32 배열 (지원하지 않는 형식이면 None)
+
+    업로드 바이트를 np.frombuffer로 복사 없이 읽고 float32 변환 한 번만 수행한다.
+    """
+    header = _parse_wav(data)
+    if header is None:
+        return None
+    audio_format, channels, rate, bits, start, length = header
+    if rate != SAMPLE_RATE or channels < 1:
+        return None
+    if audio_format == WAVE_FORMAT_PCM and bits == 16:
+        dtype, scale = np.dtype("<i2"), 1 / 32768.0
+    elif audio_format == WAVE_FORMAT_IEEE_FLOAT and bits == 32:
+        dtype, scale = np.dtype("<f4"), None
+    else:
+        return None
+
+    frame_size = dtype.itemsize * channels
+    samples = np.frombuffer(data, dtype=dtype, count=length // frame_size * channels, offset=start)
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1, dtype=np.float32)
+    if scale is not None:
+        return np.multiply(samples, np.float32(scale), dtype=np.float32)
+    return samples.astype(np.float32, copy=False)
+
+def _decode_with_av(data):
+    """기타 형식(webm, mp3, 다른 샘플링 레이트 WAV 등)은 faster_whisper 디코더(PyAV)로 변환"""
+    from faster_whisper.audio import decode_audio
+    return decode_audio(io.BytesIO(data), sampling_rate=SAMPLE_RATE)
+
+def decode_audio_bytes(data):
+    """업로드된 오디오 바이트 -> 16 kHz 모노 float32 배열 (임시 파일 없이 메모리에서 처리)"""
+    if not data:
+        raise ValueError("빈 오디오 파일입니다")
+    samples = _decode_wav(data)
+    if samples is None:
+        logging.info("PCM WAV가 아니므로 디코더로 변환")
+        samples = _decode_with_av(data)
+    return samples
@@ -2,15 +2,16 @@ import time
 import logging
 from faster_whisper import WhisperModel
 
-def process_audio_file(model, file_path):
-    """오디오 파일 처리"""
+def process_audio_file(model, audio, name=None):
+    """오디오 처리 (파일 경로 또는 16 kHz 모노 float32 배열)"""
+    name = name or (audio if isinstance(audio, str) else "memory")
     start_time = time.time()
     try:
         # language='ko' 파라미터 추가하여 한국어만 인식하도록 설정
-        segments, info = model.transcribe(file_path, beam_size=5, language='ko')
+        segments, info = model.transcribe(audio, beam_size=5, language='ko')
         process_time = time.time() - start_time
         
-        logging.info(f"\n[{file_path}] 처리 결과:")
+        logging.info(f"\n[{name}] 처리 결과:")
         logging.info(f"파일 처리 시간: {process_time:.2f}초")
         logging.info(f"언어: 한국어")
         
@@ -20,5 +21,5 @@ def process_audio_file(model, file_path):
             logging.info(f"[{segment.start:.2f}s -> {segment.end:.2f}s] {segment.text}")
         return segments, info
     except Exception as e:
-        logging.error(f"오류 발생 ({file_path}): {str(e)}")
+        logging.error(f"오류 발생 ({name}): {str(e)}")
         return None, None
\ No newline at end of file
@@ -0,0 +1,28 @@
+import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# STT/QA 모델 추론 전용 스레드 수와 대기 가능한 최대 요청 수
+INFERENCE_WORKERS = int(os.environ.get("STT_INFERENCE_WORKERS", "1"))
+INFERENCE_QUEUE_SIZE = int(os.environ.get("STT_INFERENCE_QUEUE_SIZE", "16"))
+
+_executor = None
+_slots = None
+
+async def run_inference(func, *args, **kwargs):
+    """Whisper 등 무거운 모델 호출을 이벤트 루프 밖의 제한된 스레드 풀에서 실행"""
+    global _executor, _slots
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=INFERENCE_WORKERS, thread_name_prefix="stt")
+    if _slots is None:
+        _slots = asyncio.Semaphore(INFERENCE_QUEUE_SIZE)
+    async with _slots:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_executor, lambda: func(*args, **kwargs))
+
+def shutdown_executor():
+    """스레드 풀 종료 (앱 shutdown에서 호출, 다시 초기화하면 새로 생성)"""
+    global _executor, _slots
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+    _executor = _slots = None
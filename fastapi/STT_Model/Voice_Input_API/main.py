@@ -4,6 +4,8 @@ from logging_setup import setup_logging
 from model_loader import load_model
 from audio_recorder import record_audio
 from audio_processor import process_audio_file
+from audio_decoder import decode_audio_bytes
+from vad import trim_audio
 from qa_processor import KoreanQAProcessor
 
 def get_voice_answer(model, question, q_type):
@@ -15,7 +17,14 @@ def get_voice_answer(model, question, q_type):
         logging.error("녹음이 취소되었습니다.")
         return None
         
-    segments, info = process_audio_file(model, audio_filename)
+    # 녹음 앞뒤 무음 제거
+    with open(audio_filename, "rb") as f:
+        samples, vad_info = trim_audio(decode_audio_bytes(f.read()))
+    if len(samples) == 0:
+        logging.error("음성이 인식되지 않았습니다")
+        return None
+    
+    segments, info = process_audio_file(model, samples, audio_filename)
     
     if segments is None:
         logging.error("STT 변환 실패")
@@ -3,11 +3,11 @@ import logging
 from faster_whisper import WhisperModel
 from gpu_setup import setup_gpu
 
-def load_model():
+def load_model(model_size="large-v3"):
     """모델 로딩"""
     start_time = time.time()
     device, compute_type = setup_gpu()
-    model = WhisperModel("large-v3", device=device, compute_type=compute_type)
+    model = WhisperModel(model_size, device=device, compute_type=compute_type)
     load_time = time.time() - start_time
-    logging.info(f"모델 로딩 완료 (소요 시간: {load_time:.2f}초)")
+    logging.info(f"{model_size} 모델 로딩 완료 (소요 시간: {load_time:.2f}초)")
     return model
\ No newline at end of file
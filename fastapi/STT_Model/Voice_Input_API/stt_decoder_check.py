@@ -0,0 +1,114 @@
+"""
+업로드 디코딩 동시성 격리 확인 + 디코딩 지연 시간 비교
+
+1. 같은 question_type의 서로 다른 업로드를 동시에 디코딩해도 각자 자기 오디오만 받는지,
+   작업 폴더에 temp_*.wav가 생기지 않는지 확인 (--url을 주면 실행 중인 API에 동시에 요청해
+   순서대로 보낸 결과와 같은지도 확인)
+2. 기존 방식(temp WAV 저장 후 파일 디코딩)과 decode_audio_bytes의 길이별 지연 시간 비교
+
+    python stt_decoder_check.py
+    python stt_decoder_check.py --url http://127.0.0.1:8000/process-voice --audio a.wav b.wav c.wav
+"""
+import io
+import os
+import glob
+import time
+import wave
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from audio_decoder import decode_audio_bytes, SAMPLE_RATE
+
+QUESTION_TYPE = "age"
+
+def make_wav(seconds, frequency):
+    """주파수가 서로 다른 PCM16 모노 WAV 바이트 (요청 구분용)"""
+    t = np.arange(int(seconds * SAMPLE_RATE), dtype=np.float32) / SAMPLE_RATE
+    pcm = (0.3 * np.sin(2 * np.pi * frequency * t) * 32767).astype("<i2")
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as file:
+        file.setnchannels(1)
+        file.setsampwidth(2)
+        file.setframerate(SAMPLE_RATE)
+        file.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+def check_isolation(n_requests, workers):
+    payloads = [make_wav(1 + i % 3, 200 + 40 * i) for i in range(n_requests)]
+    expected = [decode_audio_bytes(payload) for payload in payloads]
+    before = set(glob.glob("temp_*.wav"))
+
+    # API와 같이 스레드 풀에서 동시에 디코딩
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(decode_audio_bytes, payloads))
+
+    for i, (samples, reference) in enumerate(zip(results, expected)):
+        assert np.array_equal(samples, reference), f"요청 {i}: 다른 요청의 오디오가 섞였습니다"
+    assert set(glob.glob("temp_*.wav")) == before, "임시 WAV 파일이 생성되었습니다"
+    print(f"디코딩 격리: 동시 {workers}개 스레드, 요청 {n_requests}건 모두 자기 오디오 반환")
+
+def check_api_isolation(url, audio_paths, repeat):
+    """실행 중인 API에 같은 question_type으로 동시에 보내 순차 결과와 비교"""
+    import requests
+
+    def post(path):
+        with open(path, "rb") as file:
+            response = requests.post(url, files={"audio": (os.path.basename(path), file)},
+                                     data={"question": "나이가 어떻게 되세요?", "question_type": QUESTION_TYPE},
+                                     timeout=300)
+        response.raise_for_status()
+        return response.json().get("raw_text")
+
+    expected = {path: post(path) for path in audio_paths}
+    jobs = audio_paths * repeat
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        results = list(executor.map(post, jobs))
+    mismatches = [(path, expected[path], text) for path, text in zip(jobs, results) if text != expected[path]]
+    assert not mismatches, mismatches
+    print(f"API 격리: question_type={QUESTION_TYPE} 동시 요청 {len(jobs)}건 모두 순차 결과와 일치")
+
+def decode_via_temp_file(payload):
+    """기존 방식: temp_{question_type}.wav로 저장한 뒤 파일 경로로 디코딩"""
+    from faster_whisper.audio import decode_audio
+    path = f"temp_{QUESTION_TYPE}.wav"
+    with open(path, "wb") as file:
+        file.write(payload)
+    try:
+        return decode_audio(path, sampling_rate=SAMPLE_RATE)
+    finally:
+        os.remove(path)
+
+def bench_latency(durations, repeat):
+    print(f"\n{'seconds':>7} {'temp file(ms)':>14} {'in-memory(ms)':>14}")
+    for seconds in durations:
+        payload = make_wav(seconds, 440)
+        timings = []
+        for decode in (decode_via_temp_file, decode_audio_bytes):
+            decode(payload)
+            start_time = time.perf_counter()
+            for _ in range(repeat):
+                decode(payload)
+            timings.append((time.perf_counter() - start_time) / repeat * 1000)
+        print(f"{seconds:>7} {timings[0]:>14.2f} {timings[1]:>14.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="업로드 디코딩 격리 확인 및 지연 시간 비교")
+    parser.add_argument("--requests", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--durations", type=float, nargs="+", default=[3, 10, 30])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--url", help="실행 중인 /process-voice 주소 (API 격리 확인)")
+    parser.add_argument("--audio", nargs="*", default=[], help="API 격리 확인에 쓸 서로 다른 녹음 파일")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    check_isolation(args.requests, args.workers)
+    if args.url and args.audio:
+        check_api_isolation(args.url, args.audio, repeat=3)
+    bench_latency(args.durations, args.repeat)
+
+if __name__ == "__main__":
+    main()
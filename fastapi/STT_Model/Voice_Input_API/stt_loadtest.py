@@ -0,0 +1,67 @@
+"""
+STT 배치 스케줄러 부하 테스트 (배치 크기별 처리량, CPU)
+
+    python stt_loadtest.py --audio sample.wav --requests 32 --batch-sizes 1 2 4 8
+"""
+import time
+import asyncio
+import argparse
+import logging
+
+import numpy as np
+
+from model_loader import load_model
+from audio_decoder import decode_audio_bytes, SAMPLE_RATE
+from stt_scheduler import BatchScheduler
+
+async def run_load(model, samples, batch_size, n_requests, concurrency, max_wait_ms):
+    scheduler = BatchScheduler(model, max_batch_size=batch_size, max_wait_ms=max_wait_ms,
+                               max_queue_size=max(n_requests, 1), timeout=600)
+    scheduler.start()
+    slots = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with slots:
+            start_time = time.time()
+            await scheduler.submit(samples)
+            latencies.append(time.time() - start_time)
+
+    start_time = time.time()
+    await asyncio.gather(*[one() for _ in range(n_requests)])
+    elapsed = time.time() - start_time
+    await scheduler.stop()
+    return {
+        "batch_size": batch_size,
+        "throughput": n_requests / elapsed,
+        "p50": float(np.percentile(latencies, 50)),
+        "p95": float(np.percentile(latencies, 95)),
+        "batches": scheduler.report()["batch_sizes"],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="STT 배치 스케줄러 부하 테스트")
+    parser.add_argument("--audio", help="테스트할 오디오 파일 (없으면 3초 440Hz 톤 합성)")
+    parser.add_argument("--requests", type=int, default=32)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--max-wait-ms", type=float, default=10)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    if args.audio:
+        with open(args.audio, "rb") as file:
+            samples = decode_audio_bytes(file.read())
+    else:
+        t = np.arange(3 * SAMPLE_RATE, dtype=np.float32) / SAMPLE_RATE
+        samples = (0.1 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+    model = load_model()
+    print(f"오디오 {len(samples) / SAMPLE_RATE:.1f}초, 요청 {args.requests}건, 동시 {args.concurrency}건")
+    print(f"{'batch':>5} {'req/s':>8} {'p50(s)':>8} {'p95(s)':>8}  배치 분포")
+    for batch_size in args.batch_sizes:
+        result = asyncio.run(run_load(model, samples, batch_size, args.requests, args.concurrency, args.max_wait_ms))
+        print(f"{result['batch_size']:>5} {result['throughput']:>8.2f} {result['p50']:>8.2f} {result['p95']:>8.2f}  {result['batches']}")
+
+if __name__ == "__main__":
+    main()
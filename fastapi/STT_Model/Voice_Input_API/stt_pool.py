@@ -0,0 +1,178 @@
+import os
+import time
+import queue
+import asyncio
+import logging
+import itertools
+import threading
+import multiprocessing
+from collections import namedtuple
+from concurrent.futures import Future
+
+from faster_whisper import WhisperModel
+
+from stt_scheduler import SchedulerBusy
+
+# 워커 프로세스 수 (0이면 풀을 쓰지 않음) / 대기열 한도
+POOL_WORKERS = int(os.environ.get("STT_POOL_WORKERS", "0"))
+POOL_QUEUE_SIZE = int(os.environ.get("STT_POOL_QUEUE_SIZE", "64"))
+
+DEFAULT_OPTIONS = {"beam_size": 5, "language": "ko"}
+
+# 프로세스 간 전달 가능한 세그먼트 (faster_whisper Segment와 같은 필드명)
+Segment = namedtuple("Segment", "start end text")
+
+def _worker_main(worker_id, model_size, device, compute_type, cpu_threads, num_workers, jobs, results):
+    """워커 프로세스: 모델을 한 번만 로딩하고 대기열의 작업을 계속 처리"""
+    if device is None:
+        from gpu_setup import setup_gpu
+        device, compute_type = setup_gpu()
+    start_time = time.time()
+    model = WhisperModel(model_size, device=device, compute_type=compute_type,
+                         cpu_threads=cpu_threads, num_workers=num_workers)
+    results.put(("ready", worker_id, os.getpid(), time.time() - start_time))
+
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        job_id, audio, options = job
+        results.put(("start", worker_id, job_id))
+        start_time = time.time()
+        try:
+            segments, info = model.transcribe(audio, **options)
+            segments = [Segment(segment.start, segment.end, segment.text) for segment in segments]
+            info = {
+                "language": info.language,
+                "language_probability": info.language_probability,
+                "duration": info.duration,
+            }
+            results.put(("done", worker_id, job_id, (segments, info), None, time.time() - start_time))
+        except Exception as e:
+            results.put(("done", worker_id, job_id, None, f"{type(e).__name__}: {str(e)}", time.time() - start_time))
+
+class STTWorkerPool:
+    """모델을 한 번씩 로딩한 N개의 STT 워커 프로세스 + 공유 작업 대기열
+
+    API에서는 transcribe_async, 배치 스크립트에서는 submit / map을 사용한다.
+    CPU에서는 cpu_threads * workers가 코어 수를 넘지 않도록 기본값을 나눈다.
+    """
+
+    def __init__(self, model_size="large-v3", workers=POOL_WORKERS or 2, cpu_threads=None, num_workers=1,
+                 device=None, compute_type=None, max_queue_size=POOL_QUEUE_SIZE, options=None):
+        self.options = {**DEFAULT_OPTIONS, **(options or {})}
+        cpu_threads = cpu_threads or max(1, (os.cpu_count() or 1) // workers)
+        # CTranslate2/torch는 fork 이후 안전하지 않으므로 spawn 사용
+        context = multiprocessing.get_context("spawn")
+        self._jobs = context.Queue(maxsize=max_queue_size)
+        self._results = context.Queue()
+        self._futures = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._started_at = time.time()
+        self._workers = {}
+        self._processes = []
+        for worker_id in range(workers):
+            process = context.Process(
+                target=_worker_main,
+                args=(worker_id, model_size, device, compute_type, cpu_threads, num_workers, self._jobs, self._results),
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+            self._workers[worker_id] = {"pid": process.pid, "state": "loading", "jobs": 0, "busy_seconds": 0.0, "load_seconds": None}
+        self._collector = threading.Thread(target=self._collect, name="stt-pool-results", daemon=True)
+        self._collector.start()
+        logging.info(f"STT 워커 풀 시작: {workers}개 프로세스, 프로세스당 cpu_threads={cpu_threads}, num_workers={num_workers}")
+
+    def _collect(self):
+        while True:
+            message = self._results.get()
+            if message is None:
+                break
+            kind, worker_id = message[0], message[1]
+            stats = self._workers[worker_id]
+            if kind == "ready":
+                stats.update(pid=message[2], load_seconds=round(message[3], 2), state="idle")
+                logging.info(f"STT 워커 {worker_id} 모델 로딩 완료 (소요 시간: {message[3]:.2f}초)")
+            elif kind == "start":
+                stats["state"] = "busy"
+            elif kind == "done":
+                _, _, job_id, result, error, seconds = message
+                stats["state"] = "idle"
+                stats["jobs"] += 1
+                stats["busy_seconds"] += seconds
+                with self._lock:
+                    future = self._futures.pop(job_id, None)
+                if future is None or future.done():
+                    continue
+                if error:
+                    future.set_exception(RuntimeError(error))
+                else:
+                    future.set_result(result)
+
+    def submit(self, audio, block=True, **options):
+        """오디오(파일 경로 또는 16 kHz float32 배열) 전사 작업 추가 -> Future[(segments, info)]
+
+        block=False이면 대기열이 가득 찼을 때 SchedulerBusy
+        """
+        job_id = next(self._ids)
+        future = Future()
+        with self._lock:
+            self._futures[job_id] = future
+        try:
+            self._jobs.put((job_id, audio, {**self.options, **options}), block=block)
+        except queue.Full:
+            with self._lock:
+                self._futures.pop(job_id, None)
+            raise SchedulerBusy("STT 워커 풀 대기열이 가득 찼습니다")
+        return future
+
+    def transcribe(self, audio, timeout=None, **options):
+        return self.submit(audio, **options).result(timeout)
+
+    async def transcribe_async(self, audio, timeout=None, **options):
+        future = asyncio.wrap_future(self.submit(audio, block=False, **options))
+        return await asyncio.wait_for(future, timeout)
+
+    def map(self, audios, timeout=None, **options):
+        """여러 파일을 모두 대기열에 넣고 입력 순서대로 (오디오, 결과 또는 예외) 반환"""
+        futures = [(audio, self.submit(audio, **options)) for audio in audios]
+        for audio, future in futures:
+            try:
+                yield audio, future.result(timeout)
+            except Exception as e:
+                yield audio, e
+
+    def utilisation(self):
+        """워커별 처리 건수, 작업 시간, 가동률 (작업 시간 / 풀 가동 시간)"""
+        uptime = time.time() - self._started_at
+        return {
+            worker_id: {
+                **stats,
+                "busy_seconds": round(stats["busy_seconds"], 2),
+                "utilisation": round(stats["busy_seconds"] / uptime, 4) if uptime else 0.0,
+                "alive": process.is_alive(),
+            }
+            for (worker_id, stats), process in zip(self._workers.items(), self._processes)
+        }
+
+    def close(self):
+        for _ in self._processes:
+            self._jobs.put(None)
+        for process in self._processes:
+            process.join(timeout=30)
+            if process.is_alive():
+                process.terminate()
+        self._results.put(None)
+        self._collector.join(timeout=5)
+        with self._lock:
+            for future in self._futures.values():
+                future.cancel()
+            self._futures.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,197 @@
+import os
+import time
+import zlib
+import asyncio
+import logging
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from faster_whisper.audio import pad_or_trim
+from faster_whisper.tokenizer import Tokenizer
+
+from audio_decoder import SAMPLE_RATE
+from audio_processor import process_audio_file
+
+# 배치 크기 / 배치를 모으는 최대 대기 시간 / 대기열 한도 / 요청별 기본 제한 시간
+MAX_BATCH_SIZE = int(os.environ.get("STT_MAX_BATCH_SIZE", "8"))
+MAX_WAIT_MS = float(os.environ.get("STT_MAX_WAIT_MS", "10"))
+MAX_QUEUE_SIZE = int(os.environ.get("STT_MAX_QUEUE_SIZE", "32"))
+REQUEST_TIMEOUT = float(os.environ.get("STT_REQUEST_TIMEOUT", "30"))
+
+# Whisper 한 번의 입력 창 (30초) 이하만 묶어서 처리
+MAX_BATCH_SECONDS = 30
+
+# faster_whisper transcribe 기본값과 같은 기준
+# 무음 확률이 높고 로그 확률이 낮으면 결과를 버리고, 로그 확률이 낮거나 반복이 심하면
+# 온도 fallback이 있는 process_audio_file로 다시 인식
+NO_SPEECH_THRESHOLD = 0.6
+LOG_PROB_THRESHOLD = -1.0
+COMPRESSION_RATIO_THRESHOLD = 2.4
+
+# faster_whisper Segment와 같은 이름의 필드만 가진 결과
+BatchSegment = namedtuple("BatchSegment", "start end text avg_logprob no_speech_prob")
+
+def compression_ratio(text):
+    """텍스트 zlib 압축률 (같은 말이 반복되는 환청일수록 큼)"""
+    data = text.encode("utf-8")
+    return len(data) / len(zlib.compress(data)) if data else 0.0
+
+class SchedulerBusy(Exception):
+    """대기열이 가득 차 요청을 받을 수 없음"""
+
+class BatchScheduler:
+    """여러 요청의 오디오를 몇 ms 동안 모아 한 번에 인코딩/디코딩하는 STT 스케줄러
+
+    30초 이하 클립은 멜 특성을 쌓아 encode/generate를 배치로 한 번 실행하고,
+    그보다 긴 클립은 기존 process_audio_file로 하나씩 처리한다.
+    """
+
+    def __init__(self, model, max_batch_size=MAX_BATCH_SIZE, max_wait_ms=MAX_WAIT_MS,
+                 max_queue_size=MAX_QUEUE_SIZE, timeout=REQUEST_TIMEOUT, beam_size=5, language="ko"):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.max_queue_size = max_queue_size
+        self.timeout = timeout
+        self.beam_size = beam_size
+        self.tokenizer = Tokenizer(model.hf_tokenizer, model.model.is_multilingual, task="transcribe", language=language)
+        self._queue = None
+        self._task = None
+        # 모델 호출은 전용 스레드 하나에서만 실행 (배치가 곧 병렬 처리 단위)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stt-batch")
+        self.stats = {"requests": 0, "batches": 0, "rejected": 0, "expired": 0, "long_clips": 0,
+                      "no_speech": 0, "fallbacks": 0}
+        self.batch_sizes = Counter()
+
+    def start(self):
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._executor.shutdown(wait=False)
+
+    async def submit(self, samples, timeout=None):
+        """16 kHz float32 배열 전사 -> (segments, info)
+
+        대기열이 가득 차면 SchedulerBusy, 제한 시간을 넘기면 asyncio.TimeoutError
+        """
+        self.start()
+        timeout = timeout or self.timeout
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        try:
+            self._queue.put_nowait((samples, loop.time() + timeout, future))
+        except asyncio.QueueFull:
+            self.stats["rejected"] += 1
+            raise SchedulerBusy(f"STT 대기열이 가득 찼습니다 ({self.max_queue_size})")
+        self.stats["requests"] += 1
+        return await asyncio.wait_for(future, timeout)
+
+    async def _collect(self):
+        """첫 요청 이후 max_wait 동안 또는 배치가 찰 때까지 요청 수집"""
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        until = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = until - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            now = loop.time()
+            live = []
+            for samples, deadline, future in batch:
+                # 제한 시간이 지나 이미 취소된 요청은 모델에 넣지 않음
+                if future.done() or deadline <= now:
+                    self.stats["expired"] += 1
+                    continue
+                live.append((samples, future))
+            if not live:
+                continue
+
+            short = [(samples, future) for samples, future in live if len(samples) <= MAX_BATCH_SECONDS * SAMPLE_RATE]
+            long = [(samples, future) for samples, future in live if len(samples) > MAX_BATCH_SECONDS * SAMPLE_RATE]
+            if short:
+                await self._dispatch(loop, self.transcribe_batch, short)
+            for samples, future in long:
+                self.stats["long_clips"] += 1
+                await self._dispatch(loop, lambda items: [process_audio_file(self.model, items[0][0])], [(samples, future)])
+
+    async def _dispatch(self, loop, func, items):
+        try:
+            results = await loop.run_in_executor(self._executor, func, items)
+        except Exception as e:
+            logging.error(f"STT 배치 처리 실패 ({len(items)}건): {str(e)}")
+            results = [(None, None)] * len(items)
+        for (_, future), result in zip(items, results):
+            if not future.done():
+                future.set_result(result)
+
+    def transcribe_batch(self, items):
+        """30초 이하 클립 여러 개를 한 번에 전사 -> [(segments, info)]"""
+        start_time = time.time()
+        features = np.stack([
+            pad_or_trim(self.model.feature_extractor(samples)) for samples, _ in items
+        ])
+        encoder_output = self.model.encode(features)
+        prompt = list(self.tokenizer.sot_sequence) + [self.tokenizer.no_timestamps]
+        results = self.model.model.generate(
+            encoder_output,
+            [prompt] * len(items),
+            beam_size=self.beam_size,
+            return_scores=True,
+            return_no_speech_prob=True,
+        )
+
+        outputs = []
+        for (samples, _), result in zip(items, results):
+            tokens = [token for token in result.sequences_ids[0] if token < self.tokenizer.eot]
+            # faster_whisper와 같은 방식의 평균 로그 확률 (length_penalty=1)
+            avg_logprob = result.scores[0] * len(tokens) / (len(tokens) + 1)
+            text = self.tokenizer.decode(tokens).strip()
+
+            if result.no_speech_prob > NO_SPEECH_THRESHOLD and avg_logprob < LOG_PROB_THRESHOLD:
+                # 무음으로 판단 (환청 텍스트를 돌려주지 않음)
+                self.stats["no_speech"] += 1
+                outputs.append(([], None))
+                continue
+            if avg_logprob < LOG_PROB_THRESHOLD or compression_ratio(text) > COMPRESSION_RATIO_THRESHOLD:
+                # 신뢰도가 낮으면 배치 결과 대신 온도 fallback이 있는 개별 인식 사용
+                self.stats["fallbacks"] += 1
+                logging.info(f"STT 배치 결과 신뢰도 낮음 (avg_logprob={avg_logprob:.3f}), 개별 인식으로 재시도")
+                segments, info = process_audio_file(self.model, samples, "batch-fallback")
+                if segments is not None:
+                    outputs.append((segments, info))
+                    continue
+
+            segments = [BatchSegment(0.0, len(samples) / SAMPLE_RATE, text, avg_logprob, result.no_speech_prob)] if text else []
+            outputs.append((segments, None))
+
+        self.stats["batches"] += 1
+        self.batch_sizes[len(items)] += 1
+        logging.info(f"STT 배치 {len(items)}건 처리 시간: {time.time() - start_time:.2f}초")
+        return outputs
+
+    def report(self):
+        return {
+            **self.stats,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "batch_sizes": dict(sorted(self.batch_sizes.items())),
+        }
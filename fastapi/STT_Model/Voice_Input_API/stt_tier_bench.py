@@ -0,0 +1,61 @@
+"""
+질문 유형별 빠른 경로 / large-v3 CPU 지연 시간 비교
+
+녹음 파일 이름은 "<question_type>_*.wav" 형식 (예: age_01.wav, smoke_03.wav)
+
+    python stt_tier_bench.py --fixtures Recorded_audio
+"""
+import os
+import time
+import argparse
+import logging
+from collections import defaultdict
+
+import numpy as np
+
+from model_loader import load_model
+from audio_decoder import decode_audio_bytes
+from audio_processor import process_audio_file
+from tiered_transcriber import TieredTranscriber, FAST_MODEL_SIZE
+
+def load_fixtures(folder):
+    fixtures = defaultdict(list)
+    for filename in sorted(os.listdir(folder)):
+        if not filename.endswith((".wav", ".mp3", ".webm")) or "_" not in filename:
+            continue
+        with open(os.path.join(folder, filename), "rb") as file:
+            fixtures[filename.split("_", 1)[0]].append((filename, decode_audio_bytes(file.read())))
+    return fixtures
+
+def main():
+    parser = argparse.ArgumentParser(description="질문 유형별 STT 지연 시간 비교")
+    parser.add_argument("--fixtures", required=True, help="<question_type>_*.wav 녹음 폴더")
+    parser.add_argument("--fast-model", default=FAST_MODEL_SIZE or "base")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    fixtures = load_fixtures(args.fixtures)
+    full_model = load_model()
+    tiered = TieredTranscriber(load_model(args.fast_model))
+
+    print(f"{'type':<12} {'n':>3} {'full(s)':>8} {'tiered(s)':>10} {'fast':>5} {'escal':>6}")
+    for question_type, items in fixtures.items():
+        full_times, tiered_times = [], []
+        fast = escalated = 0
+        for name, samples in items:
+            start_time = time.time()
+            process_audio_file(full_model, samples, name)
+            full_times.append(time.time() - start_time)
+
+            start_time = time.time()
+            segments, _ = tiered.fast_transcribe(samples, question_type)
+            if segments is None:
+                escalated += 1
+                process_audio_file(full_model, samples, name)
+            else:
+                fast += 1
+            tiered_times.append(time.time() - start_time)
+        print(f"{question_type:<12} {len(items):>3} {np.mean(full_times):>8.2f} {np.mean(tiered_times):>10.2f} {fast:>5} {escalated:>6}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import os
+import time
+import logging
+from collections import defaultdict
+
+from audio_decoder import SAMPLE_RATE
+
+# 빠른 경로 모델 / 빠른 경로를 적용할 최대 길이 (초)
+FAST_MODEL_SIZE = os.environ.get("STT_FAST_MODEL", "base")
+SHORT_CLIP_SECONDS = float(os.environ.get("STT_SHORT_CLIP_SECONDS", "8"))
+
+# 이 기준을 벗어나면 신뢰도가 낮다고 보고 large-v3로 다시 인식
+MIN_AVG_LOGPROB = float(os.environ.get("STT_MIN_AVG_LOGPROB", "-0.7"))
+MAX_NO_SPEECH_PROB = float(os.environ.get("STT_MAX_NO_SPEECH_PROB", "0.6"))
+
+# 질문 유형별 initial_prompt (qa_processor.get_answer가 기대하는 답변 어휘)
+# 모델이 프롬프트를 그대로 받아 적을 수 있으므로 구체적인 값이나 사람 이름 없이 단위와 답변 형태만 넣음
+_YES_NO_PROMPT = "네, 예, 맞아요, 아니요, 아니오, 합니다, 안 합니다, 마십니다, 안 마십니다."
+QUESTION_PROMPTS = {
+    "name": "이름, 성함, 제 이름은",
+    "age": "나이, 살, 세",
+    "sex": "남자, 여자, 남성, 여성",
+    "weight": "몸무게, 킬로그램, kg",
+    "height": "키, 센티미터, cm",
+    "sleepTime": "수면 시간, 시간, 시간 반",
+    "heartRate": "심박수, 맥박, 회, bpm",
+    "drink": _YES_NO_PROMPT,
+    "smoke": _YES_NO_PROMPT,
+    "fatigue": _YES_NO_PROMPT,
+    "cholesterol": _YES_NO_PROMPT,
+    "walking": "매우 많이, 많이, 보통, 조금, 거의 안 걷습니다.",
+    "systolicBP": "혈압, 수축기, 이완기, 최고, 최저, 에",
+    "diastolicBP": "혈압, 수축기, 이완기, 최고, 최저, 에",
+}
+
+class TieredTranscriber:
+    """짧은 온보딩 답변용 빠른 경로
+
+    짧은 클립은 작은 모델 + greedy 디코딩 + VAD + 질문 유형별 initial_prompt로 먼저 인식하고,
+    평균 로그 확률이나 무음 확률이 기준을 벗어나면 None을 반환해 large-v3로 넘긴다.
+    """
+
+    def __init__(self, model, short_clip_seconds=SHORT_CLIP_SECONDS,
+                 min_avg_logprob=MIN_AVG_LOGPROB, max_no_speech_prob=MAX_NO_SPEECH_PROB, vad_filter=True):
+        self.model = model
+        self.vad_filter = vad_filter  # 입력이 이미 vad.trim_audio를 거쳤다면 False
+        self.short_clip_seconds = short_clip_seconds
+        self.min_avg_logprob = min_avg_logprob
+        self.max_no_speech_prob = max_no_speech_prob
+        self.stats = defaultdict(lambda: {"fast": 0, "escalated": 0, "skipped": 0, "fast_seconds": 0.0})
+
+    def is_confident(self, segments):
+        return bool(segments) and all(
+            segment.avg_logprob >= self.min_avg_logprob and segment.no_speech_prob <= self.max_no_speech_prob
+            for segment in segments
+        )
+
+    def fast_transcribe(self, samples, question_type=None):
+        """빠른 경로 인식 -> (segments, info), 긴 클립이거나 신뢰도가 낮으면 (None, None)"""
+        stats = self.stats[question_type or "unknown"]
+        if len(samples) > self.short_clip_seconds * SAMPLE_RATE:
+            stats["skipped"] += 1
+            return None, None
+
+        start_time = time.time()
+        segments, info = self.model.transcribe(
+            samples,
+            language="ko",
+            beam_size=1,
+            initial_prompt=QUESTION_PROMPTS.get(question_type),
+            vad_filter=self.vad_filter,
+            condition_on_previous_text=False,
+            without_timestamps=True,
+        )
+        segments = list(segments)
+        elapsed = time.time() - start_time
+        stats["fast_seconds"] += elapsed
+
+        if not self.is_confident(segments):
+            stats["escalated"] += 1
+            scores = [(round(s.avg_logprob, 3), round(s.no_speech_prob, 3)) for s in segments]
+            logging.info(f"[{question_type}] 빠른 경로 신뢰도 낮음 {scores}, large-v3로 재인식")
+            return None, None
+
+        stats["fast"] += 1
+        logging.info(f"[{question_type}] 빠른 경로 처리 시간: {elapsed:.2f}초")
+        return segments, info
+
+    def report(self):
+        report = {}
+        for question_type, stats in self.stats.items():
+            tried = stats["fast"] + stats["escalated"]
+            report[question_type] = {
+                **stats,
+                "fast_seconds": round(stats["fast_seconds"], 2),
+                "avg_fast_seconds": round(stats["fast_seconds"] / tried, 3) if tried else 0.0,
+            }
+        return report
@@ -0,0 +1,112 @@
+import os
+import logging
+import threading
+
+import numpy as np
+
+from audio_decoder import SAMPLE_RATE
+
+# 음성 구간 검출 방식: energy (NumPy) / silero (faster_whisper 내장 모델) / none
+VAD_METHOD = os.environ.get("STT_VAD", "energy")
+
+FRAME_MS = 30
+THRESHOLD_DB = -45       # 이보다 작은 프레임은 항상 무음
+NOISE_MARGIN_DB = 12     # 배경 잡음(하위 10% 프레임) 대비 이만큼 커야 음성
+MIN_SPEECH_MS = 150
+MIN_SILENCE_MS = 300     # 이보다 짧은 무음은 음성 구간에 포함
+PADDING_MS = 200         # 음성 구간 앞뒤 여유
+
+_stats = {"requests": 0, "rejected_silent": 0, "total_seconds": 0.0, "skipped_seconds": 0.0}
+_lock = threading.Lock()
+
+def frame_energy_db(samples, frame_size):
+    """프레임별 RMS 에너지 (dBFS)"""
+    n_frames = len(samples) // frame_size
+    frames = samples[:n_frames * frame_size].reshape(n_frames, frame_size)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+    return 20 * np.log10(rms + 1e-10)
+
+def energy_vad(samples, frame_ms=FRAME_MS, threshold_db=THRESHOLD_DB, margin_db=NOISE_MARGIN_DB,
+               min_speech_ms=MIN_SPEECH_MS, min_silence_ms=MIN_SILENCE_MS, padding_ms=PADDING_MS):
+    """에너지 기반 음성 구간 검출 -> [(시작 샘플, 끝 샘플)]"""
+    frame_size = SAMPLE_RATE * frame_ms // 1000
+    db = frame_energy_db(samples, frame_size)
+    if len(db) == 0:
+        return []
+
+    # 잡음 기준 임계값 (처음부터 끝까지 말한 클립에서도 음성이 남도록 최대값 - 20dB로 상한)
+    threshold = max(threshold_db, min(np.percentile(db, 10) + margin_db, db.max() - 20))
+    voiced = db > threshold
+    edges = np.diff(np.concatenate(([0], voiced.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    min_silence = min_silence_ms // frame_ms
+    min_speech = min_speech_ms // frame_ms
+    padding = padding_ms // frame_ms * frame_size
+    segments = []
+    for start, end in zip(starts, ends):
+        if segments and start - segments[-1][1] < min_silence:
+            segments[-1][1] = end
+        else:
+            segments.append([start, end])
+
+    return [
+        (max(0, start * frame_size - padding), min(len(samples), end * frame_size + padding))
+        for start, end in segments if end - start >= min_speech
+    ]
+
+def silero_vad(samples):
+    """faster_whisper 내장 Silero VAD -> [(시작 샘플, 끝 샘플)]"""
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+    options = VadOptions(min_silence_duration_ms=MIN_SILENCE_MS, speech_pad_ms=PADDING_MS)
+    return [(chunk["start"], chunk["end"]) for chunk in get_speech_timestamps(samples, options)]
+
+def detect_speech(samples, method=VAD_METHOD):
+    if method == "silero":
+        try:
+            return silero_vad(samples)
+        except Exception as e:
+            logging.warning(f"Silero VAD 사용 불가, 에너지 기반으로 대체: {str(e)}")
+    return energy_vad(samples)
+
+def trim_audio(samples, method=VAD_METHOD):
+    """음성 구간만 이어 붙인 배열과 구간 정보 -> (samples, info)
+
+    음성이 없으면 빈 배열을 반환한다.
+    """
+    duration = len(samples) / SAMPLE_RATE
+    if method == "none":
+        return samples, {"duration": duration, "speech_seconds": duration, "skipped_seconds": 0.0, "segments": 1}
+
+    segments = detect_speech(samples, method)
+    if len(segments) == 1 and segments[0] == (0, len(samples)):
+        trimmed = samples
+    elif segments:
+        trimmed = np.concatenate([samples[start:end] for start, end in segments])
+    else:
+        trimmed = samples[:0]
+
+    speech_seconds = len(trimmed) / SAMPLE_RATE
+    info = {
+        "duration": round(duration, 2),
+        "speech_seconds": round(speech_seconds, 2),
+        "skipped_seconds": round(duration - speech_seconds, 2),
+        "segments": len(segments),
+    }
+    with _lock:
+        _stats["requests"] += 1
+        _stats["total_seconds"] += duration
+        _stats["skipped_seconds"] += duration - speech_seconds
+        if not segments:
+            _stats["rejected_silent"] += 1
+    logging.info(f"VAD({method}): {duration:.2f}초 중 {speech_seconds:.2f}초 음성, {info['skipped_seconds']:.2f}초 제외")
+    return trimmed, info
+
+def vad_stats():
+    with _lock:
+        return {
+            **_stats,
+            "total_seconds": round(_stats["total_seconds"], 2),
+            "skipped_seconds": round(_stats["skipped_seconds"], 2),
+        }
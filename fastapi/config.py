@@ -1,6 +1,10 @@
-from sqlalchemy import create_engine
+import os
+import time
+import threading
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 
 # MySQL 연결 정보
 USERNAME = "admin"         # MySQL 사용자 이름
@@ -9,9 +13,85 @@ HOST = "lg-db.c5aywgymgt2p.ap-northeast-2.rds.amazonaws.com"  # RDS 호스트 
 PORT = "3306"                      # MySQL 포트 (기본값: 3306)
 DATABASE_NAME = "LG"    # 데이터베이스 이름
 
-SQLALCHEMY_DATABASE_URL = f"mysql+pymysql://{USERNAME}:{PASSWORD}@{HOST}:{PORT}/{DATABASE_NAME}"
+# DATABASE_URL 환경 변수가 있으면 우선 사용 (예: 로컬 테스트용 sqlite:///./local.db)
+SQLALCHEMY_DATABASE_URL = os.environ.get(
+    "DATABASE_URL",
+    f"mysql+pymysql://{USERNAME}:{PASSWORD}@{HOST}:{PORT}/{DATABASE_NAME}",
+)
+
+# 커넥션 풀 설정
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "10"))          # 유지할 커넥션 수
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "20"))    # 최대 추가 커넥션 수
+DB_POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", "30"))    # 커넥션 대기 시간(초)
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "1800"))  # RDS 유휴 연결 끊김 전에 재생성(초)
+
+# 커넥션 풀 지표
+_pool_stats = {"checkouts": 0, "connects": 0, "wait_count": 0, "wait_total": 0.0, "wait_max": 0.0}
+_pool_stats_lock = threading.Lock()
+
+def _record_wait(seconds):
+    with _pool_stats_lock:
+        _pool_stats["wait_count"] += 1
+        _pool_stats["wait_total"] += seconds
+        _pool_stats["wait_max"] = max(_pool_stats["wait_max"], seconds)
+
+class TimedQueuePool(QueuePool):
+    """풀에서 커넥션을 꺼낼 때까지 기다린 시간을 기록하는 QueuePool
+
+    세션은 처음 쿼리를 실행할 때 커넥션을 꺼내므로, 캐시 적중이나 스트리밍처럼
+    요청 세션을 쓰지 않는 요청은 풀을 건드리지 않는다.
+    """
+
+    def _do_get(self):
+        start_time = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            _record_wait(time.perf_counter() - start_time)
 
 # SQLAlchemy 설정
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+if SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
+    engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+else:
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        poolclass=TimedQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+    )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
+
+@event.listens_for(engine, "connect")
+def _on_connect(dbapi_connection, connection_record):
+    with _pool_stats_lock:
+        _pool_stats["connects"] += 1
+
+@event.listens_for(engine, "checkout")
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    with _pool_stats_lock:
+        _pool_stats["checkouts"] += 1
+
+def pool_status():
+    """풀 크기 산정을 위한 현재 상태와 누적 지표"""
+    pool = engine.pool
+    status = {"pool": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        if hasattr(pool, name):
+            status[name] = getattr(pool, name)()
+    with _pool_stats_lock:
+        stats = dict(_pool_stats)
+    stats["wait_avg"] = stats["wait_total"] / stats["wait_count"] if stats["wait_count"] else 0.0
+    status.update(stats)
+    return status
+
+# 데이터베이스 세션 생성 (모든 라우터가 Depends(get_db)로 공유)
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -0,0 +1,180 @@
+"""
+전체 가입자 위험도 야간 재계산 작업
+
+USER/DETAIL을 user_id 순서로 청크 단위 조회 -> 프로세스 풀에서 다섯 개 모델 예측
+-> RISK 테이블에 일괄 upsert. 청크마다 결과와 함께 RISK_JOB 체크포인트를 커밋하므로
+중간에 중단되어도 다시 실행하면 마지막으로 커밋된 청크 다음부터 이어서 처리한다.
+
+    cd fastapi && python -m jobs.rescore --chunk-size 1000 --workers 4
+"""
+import os
+import sys
+import time
+import logging
+import argparse
+from collections import deque
+from datetime import datetime
+from multiprocessing import Pool, cpu_count
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select
+from sqlalchemy.dialects import mysql, sqlite
+from config import SessionLocal, engine, Base
+from models import User, RiskScore, RiskJob
+from services.features import MODEL_COLUMNS
+from services.profile import load_users_with_latest_details
+from services.risk import features_from_profile, missing_features, load_risk_models, score_records
+
+JOB_NAME = "nightly_rescore"
+DEFAULT_CHUNK_SIZE = 1000
+
+def read_chunks(db, after_user_id, chunk_size):
+    """user_id 키셋 기준 청크 -> (마지막 user_id, [(user_id, detail_id, 특성 dict)])"""
+    last_user_id = after_user_id
+    while True:
+        user_ids = db.execute(
+            select(User.user_id)
+            .where(User.user_id > last_user_id)
+            .order_by(User.user_id)
+            .limit(chunk_size)
+        ).scalars().all()
+        if not user_ids:
+            return
+        profiles = load_users_with_latest_details(db, user_ids)
+        rows = []
+        for user_id in user_ids:
+            user, detail = profiles.get(user_id, (None, None))
+            if user is None or detail is None:
+                continue
+            features = features_from_profile(user, detail)
+            missing = missing_features(features)
+            if missing:
+                # 필수 값이 빈 사용자는 상세 정보가 없는 사용자처럼 건너뜀 (청크 전체가 실패하지 않도록)
+                logging.warning(f"user_id={user_id} 필수 값 없음, 건너뜀: {', '.join(missing)}")
+                continue
+            rows.append((user_id, detail.detail_id, features))
+        last_user_id = user_ids[-1]
+        db.expunge_all()  # 청크마다 세션의 ORM 객체 해제
+        yield last_user_id, rows
+
+def init_worker():
+    """워커 프로세스마다 모델을 한 번만 로딩"""
+    load_risk_models()
+
+def score_rows(rows):
+    """청크 전체를 한 번에 예측하고, 실패하면 한 행씩 예측해 실패한 사용자만 제외 -> [(행, 결과)]"""
+    try:
+        return list(zip(rows, score_records([features for _, _, features in rows])))
+    except Exception as e:
+        logging.warning(f"청크 예측 실패, 행 단위로 재시도: {str(e)}")
+
+    scored = []
+    for row in rows:
+        try:
+            scored.append((row, score_records([row[2]])[0]))
+        except Exception as e:
+            logging.error(f"user_id={row[0]} 예측 실패, 건너뜀: {str(e)}")
+    return scored
+
+def score_chunk(rows):
+    """워커에서 실행: 한 청크 예측 -> RISK 테이블 행 리스트"""
+    scored_at = datetime.now()
+    values = []
+    for (user_id, detail_id, _), result in score_rows(rows):
+        value = {"user_id": user_id, "detail_id": detail_id, "scored_at": scored_at}
+        for name in MODEL_COLUMNS:
+            risk = result["risks"].get(name)
+            value[f"{name}_risk"] = bool(risk) if risk is not None else None
+            value[f"{name}_prob"] = result["probabilities"].get(name)
+        values.append(value)
+    return values
+
+def upsert_scores(db, values):
+    """RISK 테이블 일괄 upsert (MySQL / SQLite)"""
+    if not values:
+        return
+    update_columns = [key for key in values[0] if key != "user_id"]
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        statement = mysql.insert(RiskScore).values(values)
+        statement = statement.on_duplicate_key_update({key: statement.inserted[key] for key in update_columns})
+    elif dialect == "sqlite":
+        statement = sqlite.insert(RiskScore).values(values)
+        statement = statement.on_conflict_do_update(
+            index_elements=["user_id"], set_={key: statement.excluded[key] for key in update_columns}
+        )
+    else:
+        raise RuntimeError(f"지원하지 않는 DB: {dialect}")
+    db.execute(statement)
+
+def start_job(db, restart=False):
+    """체크포인트 조회 -> 이어서 시작할 user_id"""
+    job = db.get(RiskJob, JOB_NAME)
+    now = datetime.now()
+    if job is None:
+        job = RiskJob(job_name=JOB_NAME)
+        db.add(job)
+    if job.last_user_id is None or job.finished or restart:
+        job.last_user_id = 0
+        job.started_at = now
+        logging.info("위험도 재계산 새로 시작")
+    else:
+        logging.info(f"마지막 체크포인트(user_id={job.last_user_id})부터 이어서 시작")
+    job.finished = False
+    job.updated_at = now
+    db.commit()
+    return job.last_user_id
+
+def commit_chunk(db, values, last_user_id):
+    """청크 결과와 체크포인트를 한 트랜잭션으로 커밋"""
+    upsert_scores(db, values)
+    job = db.get(RiskJob, JOB_NAME)
+    job.last_user_id = last_user_id
+    job.updated_at = datetime.now()
+    db.commit()
+
+def run(chunk_size=DEFAULT_CHUNK_SIZE, workers=None, restart=False):
+    start_time = time.time()
+    Base.metadata.create_all(bind=engine, tables=[RiskScore.__table__, RiskJob.__table__])
+    workers = workers or cpu_count()
+    read_db = SessionLocal()
+    write_db = SessionLocal()
+    scored = 0
+    try:
+        after_user_id = start_job(write_db, restart)
+        with Pool(processes=workers, initializer=init_worker) as pool:
+            # 순서대로 커밋해야 체크포인트가 의미 있으므로 제출 순서대로 결과를 기다림
+            pending = deque()
+            for last_user_id, rows in read_chunks(read_db, after_user_id, chunk_size):
+                pending.append((last_user_id, pool.apply_async(score_chunk, (rows,))))
+                if len(pending) >= workers * 2:
+                    scored += finish_oldest(write_db, pending)
+            while pending:
+                scored += finish_oldest(write_db, pending)
+
+        job = write_db.get(RiskJob, JOB_NAME)
+        job.finished = True
+        job.updated_at = datetime.now()
+        write_db.commit()
+        logging.info(f"위험도 재계산 완료: {scored}명 (소요 시간: {time.time() - start_time:.1f}초)")
+    finally:
+        read_db.close()
+        write_db.close()
+    return scored
+
+def finish_oldest(db, pending):
+    last_user_id, result = pending.popleft()
+    values = result.get()
+    commit_chunk(db, values, last_user_id)
+    logging.info(f"청크 커밋: user_id <= {last_user_id}, {len(values)}명")
+    return len(values)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description="전체 가입자 위험도 재계산")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터 실행")
+    args = parser.parse_args()
+    run(args.chunk_size, args.workers, args.restart)
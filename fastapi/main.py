@@ -2,20 +2,64 @@ from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
-from config import engine, Base
-from routers import user, detail
-from STT_Model.Voice_Input_API.api import app as api_app
+from config import engine, Base, pool_status
+from serializers import FastJSONResponse
+from migrations import ensure_indexes
+from services.profile_cache import profile_cache
+from services.youtube import cache_stats
+from services.risk import load_risk_models
+from routers import user, detail, profile, risk
+from services.encoder import warm_up
+from services.query_vectors import precompute_query_embeddings, precompute_query_tfidf
+from services.tfidf_model import get_tfidf_model
+from services.youtube_client import close_client
+from services.executor import shutdown_executor
+from STT_Model.Voice_Input_API.api import app as api_app, init_models as init_stt_models, close_models as close_stt_models
 import uvicorn
 
-app = FastAPI()
+app = FastAPI(default_response_class=FastJSONResponse)
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
+ensure_indexes(engine)
 
 # Include routers
 app.include_router(user.router)
 app.include_router(detail.router)
-app.mount("/api", api_app)  # api_app을 /api 경로에 마운트
+app.include_router(profile.router)
+app.include_router(risk.router)
+
+# 운영 지표 (/api 마운트보다 먼저 등록해야 가려지지 않음)
+# DB 커넥션 풀 상태
+@app.get("/api/db/pool_status")
+async def db_pool_status():
+    return pool_status()
+
+# 캐시 적중률
+@app.get("/api/cache_stats")
+async def get_cache_stats():
+    return {"profile": profile_cache.report(), "youtube": cache_stats()}
+
+app.mount("/api", api_app)  # api_app을 /api 경로에 마운트 (하위 앱의 startup/shutdown은 실행되지 않음)
+
+# 요청 전에 모델 미리 로딩 (위험도 모델, 추천용 문장 인코더 / 쿼리 벡터, STT)
+@app.on_event("startup")
+async def load_models():
+    load_risk_models()
+    warm_up()
+    precompute_query_embeddings()
+    tfidf_model = get_tfidf_model()
+    if tfidf_model is not None:
+        precompute_query_tfidf(tfidf_model)
+    # 마운트된 STT 앱의 모델 / 스케줄러 / 워커 풀
+    await init_stt_models()
+
+# YouTube API 커넥션 풀, STT 모델 / 워커, 추론 스레드 풀 정리
+@app.on_event("shutdown")
+async def close_resources():
+    await close_client()
+    await close_stt_models()
+    shutdown_executor()
 
 # Serve static files
 app.mount(
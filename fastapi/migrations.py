@@ -0,0 +1,17 @@
+import logging
+from config import engine, Base
+import models  # 모델 테이블을 Base.metadata에 등록
+
+def ensure_indexes(bind=engine):
+    """기존 테이블에 모델에 선언된 인덱스 중 없는 것만 생성
+
+    create_all은 이미 있는 테이블의 인덱스를 추가하지 않으므로 시작 시 함께 실행한다.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+            logging.info(f"인덱스 확인 완료: {index.name}")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    ensure_indexes()
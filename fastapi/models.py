@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Boolean, Index, DateTime
 from sqlalchemy.orm import relationship
 from config import Base
 
@@ -36,6 +36,11 @@ class Detail(Base):
 
     user = relationship("User", back_populates="details")
 
+    # 사용자별 최신 상세 정보 조회용 (user_id 단독 조회도 이 인덱스를 사용)
+    __table_args__ = (
+        Index("ix_DETAIL_user_id_detail_id", user_id, detail_id.desc()),
+    )
+
 class Video(Base):
     __tablename__ = "VIDEO"
 
@@ -55,3 +60,29 @@ class TV(Base):
     user_id = Column(Integer, ForeignKey("USER.user_id"))
 
     user = relationship("User", back_populates="tvs")
+
+class RiskScore(Base):
+    __tablename__ = "RISK"
+
+    user_id = Column(Integer, ForeignKey("USER.user_id"), primary_key=True)
+    detail_id = Column(Integer)  # 예측에 사용한 상세 정보 (상세 정보는 삭제될 수 있으므로 FK 없이 기록만)
+    sleep_risk = Column(Boolean)
+    sleep_prob = Column(Float)
+    cardio_risk = Column(Boolean)
+    cardio_prob = Column(Float)
+    diabetes_risk = Column(Boolean)
+    diabetes_prob = Column(Float)
+    liver_risk = Column(Boolean)
+    liver_prob = Column(Float)
+    lung_risk = Column(Boolean)
+    lung_prob = Column(Float)
+    scored_at = Column(DateTime)
+
+class RiskJob(Base):
+    __tablename__ = "RISK_JOB"
+
+    job_name = Column(String(50), primary_key=True)
+    last_user_id = Column(Integer)    # 마지막으로 커밋된 청크의 user_id
+    finished = Column(Boolean)
+    started_at = Column(DateTime)
+    updated_at = Column(DateTime)
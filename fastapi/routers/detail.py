@@ -1,22 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, Form
+from fastapi import APIRouter, Depends, HTTPException, Form, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from fastapi.responses import JSONResponse
-from config import SessionLocal
+from config import get_db
 from models import Detail
+from services.detail_query import latest_detail
+from serializers import FastJSONResponse
+from services.user_req import DetailCreate
+from services.bulk import parse_rows, bulk_insert
+from services.profile_cache import profile_cache
+from services.profile import detail_to_dict
 
 router = APIRouter()
 
-# 데이터베이스 세션 생성
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# 동기 SQLAlchemy를 사용하므로 핸들러는 def로 선언해 FastAPI 스레드 풀에서 실행
 
 # 상세 정보 저장 API
 @router.post("/api/details")
-async def save_detail(
+def save_detail(
     user_id: int = Form(...),
     systolic_bp: int = Form(...),
     diastolic_bp: int = Form(...),
@@ -24,9 +24,9 @@ async def save_detail(
     daily_steps: int = Form(...),
     cholesterol_status: bool = Form(...),
     daily_sleep: float = Form(...),
-    hypertension_status: bool = Form(...)
+    hypertension_status: bool = Form(...),
+    db: Session = Depends(get_db)
 ):
-    db = next(get_db())
     new_detail = Detail(
         user_id=user_id,
         systolic_bp=systolic_bp,
@@ -40,33 +40,45 @@ async def save_detail(
     db.add(new_detail)
     db.commit()
     db.refresh(new_detail)
+    profile_cache.invalidate_user(user_id)
 
-    return JSONResponse({"message": "Detail data saved successfully", "detail_id": new_detail.detail_id})
+    return FastJSONResponse({"message": "Detail data saved successfully", "detail_id": new_detail.detail_id})
 
-# 특정 사용자 상세 정보 조회 API
+# 특정 사용자 최신 상세 정보 조회 API
 @router.get("/api/details/{user_id}")
-async def get_detail(user_id: int, db: Session = Depends(get_db)):
-    detail = db.query(Detail).filter(Detail.user_id == user_id).first()
-    if not detail:
+def get_detail(user_id: int, db: Session = Depends(get_db)):
+    detail_data = profile_cache.get_or_load("detail", user_id, lambda: load_detail(db, user_id))
+    if not detail_data:
         raise HTTPException(status_code=404, detail="Detail not found")
-    detail_data = {
-        "detail_id": detail.detail_id,
-        "systolic_bp": detail.systolic_bp,
-        "diastolic_bp": detail.diastolic_bp,
-        "heart_rate": detail.heart_rate,
-        "daily_steps": detail.daily_steps,
-        "cholesterol_status": detail.cholesterol_status,
-        "daily_sleep": detail.daily_sleep,
-        "hypertension_status": detail.hypertension_status
-    }
-    return JSONResponse(detail_data)
+    return FastJSONResponse(detail_data)
+
+def load_detail(db, user_id):
+    detail = latest_detail(db, user_id)
+    return detail_to_dict(detail) if detail else None
 
-# 상세 정보 삭제 API
+# 최신 상세 정보 삭제 API
 @router.delete("/api/details/{user_id}")
-async def delete_detail(user_id: int, db: Session = Depends(get_db)):
-    detail = db.query(Detail).filter(Detail.user_id == user_id).first()
+def delete_detail(user_id: int, db: Session = Depends(get_db)):
+    detail = latest_detail(db, user_id)
     if not detail:
         raise HTTPException(status_code=404, detail="Detail not found")
     db.delete(detail)
     db.commit()
+    profile_cache.invalidate_user(user_id)
     return {"message": "Detail deleted successfully"}
+
+# 상세 정보 대량 등록 API (JSON 배열 또는 NDJSON)
+@router.post("/api/details:bulk")
+async def save_details_bulk(request: Request, db: Session = Depends(get_db)):
+    try:
+        rows = parse_rows(await request.body(), request.headers.get("content-type"))
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="JSON 배열 또는 NDJSON 형식이어야 합니다")
+    if not isinstance(rows, list):
+        raise HTTPException(status_code=400, detail="JSON 배열 또는 NDJSON 형식이어야 합니다")
+
+    result = await run_in_threadpool(bulk_insert, db, Detail, DetailCreate, rows)
+    # 실제로 삽입된 행(스키마 검증을 통과해 user_id가 정수)의 사용자만 캐시 무효화
+    for user_id in {rows[i]["user_id"] for i, detail_id in enumerate(result["ids"]) if detail_id is not None}:
+        profile_cache.invalidate_user(int(user_id))
+    return FastJSONResponse(result)
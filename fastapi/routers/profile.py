@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from config import get_db
+from serializers import FastJSONResponse
+from services.profile import load_profile
+from services.profile_cache import profile_cache
+
+router = APIRouter()
+
+# 사용자 + 최신 상세 정보 통합 조회 API
+@router.get("/api/profile/{user_id}")
+def get_profile(user_id: int, db: Session = Depends(get_db)):
+    profile = profile_cache.get_or_load("profile", user_id, lambda: load_profile(db, user_id))
+    if not profile:
+        raise HTTPException(status_code=404, detail="User not found")
+    return FastJSONResponse(profile)
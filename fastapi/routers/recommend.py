@@ -1,33 +1,34 @@
 #이거 일단 스킵하자
 
 from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from serializers import FastJSONResponse
 from sqlalchemy.orm import Session
 from services.recommendation import recommend_videos
-from config import SessionLocal
-from models import User, Detail
+from config import get_db
+from services.profile import load_user_with_latest_detail
+from services.risk import RISK_CATEGORIES
+from models import RiskScore
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.get("/api/recommendations")
 async def get_recommendations(user_id: int, db: Session = Depends(get_db)):
-    # 사용자 데이터 조회
-    user = db.query(User).filter(User.user_id == user_id).first()
-    detail = db.query(Detail).filter(Detail.user_id == user_id).first()
+    # 사용자 데이터 조회 (동기 DB 호출은 스레드 풀에서 실행)
+    user, detail = await run_in_threadpool(load_user_with_latest_detail, db, user_id)
 
     if not user or not detail:
-        return JSONResponse({"error": "User or Detail not found"}, status_code=404)
+        return FastJSONResponse({"error": "User or Detail not found"}, status_code=404)
+
+    # 추천 카테고리 결정: 야간 재계산(jobs/rescore.py) 결과가 있으면 모델 예측을 사용
+    score = await run_in_threadpool(db.get, RiskScore, user_id)
+    if score is not None:
+        categories = [category for name, category in RISK_CATEGORIES.items() if getattr(score, f"{name}_risk")]
+        recommendations = await recommend_videos(categories)
+        return FastJSONResponse({"recommendations": recommendations})
 
-    # 추천 카테고리 결정
     categories = []
-    if detail.fatigue_status:
+    if user.fatigue_status:
         categories.append("수면장애")
     if detail.hypertension_status:
         categories.append("심혈관질환")
@@ -35,5 +36,5 @@ async def get_recommendations(user_id: int, db: Session = Depends(get_db)):
         categories.append("당뇨")
 
     # 추천 비디오 생성
-    recommendations = recommend_videos(categories)
-    return JSONResponse({"recommendations": recommendations})
+    recommendations = await recommend_videos(categories)
+    return FastJSONResponse({"recommendations": recommendations})
@@ -0,0 +1,78 @@
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from config import get_db
+from serializers import FastJSONResponse
+from services.user_req import RiskRequest
+from services.profile import load_users_with_latest_details
+from services.risk import score_records, features_from_profile, missing_features, model_status, reload_risk_models
+from services.executor import run_inference
+
+router = APIRouter()
+
+MAX_BATCH_SIZE = 1000
+MISSING_FIELDS_ERROR = "예측에 필요한 값이 비어 있습니다"
+
+def resolve_records(db, requests):
+    """요청 -> (특성 dict 또는 None, 오류 메시지 또는 None) 리스트"""
+    profiles = load_users_with_latest_details(
+        db, [request.user_id for request in requests if request.features is None and request.user_id is not None]
+    )
+    resolved = []
+    for request in requests:
+        if request.features is not None:
+            features = request.features
+            resolved.append((features.model_dump() if hasattr(features, "model_dump") else features.dict(), None))
+        elif request.user_id is None:
+            resolved.append((None, "user_id 또는 features가 필요합니다"))
+        else:
+            user, detail = profiles.get(request.user_id, (None, None))
+            if user is None or detail is None:
+                resolved.append((None, "User or Detail not found"))
+            else:
+                features = features_from_profile(user, detail)
+                missing = missing_features(features)
+                if missing:
+                    resolved.append((None, f"{MISSING_FIELDS_ERROR}: {', '.join(missing)}"))
+                else:
+                    resolved.append((features, None))
+    return resolved
+
+async def score_requests(db, requests):
+    resolved = await run_in_threadpool(resolve_records, db, requests)
+    scores = iter(await run_inference(score_records, [features for features, error in resolved if error is None]))
+    return [{"error": error} if error else next(scores) for _, error in resolved]
+
+# 단일 사용자 위험도 예측 API
+@router.post("/api/risk")
+async def score_risk(request: RiskRequest, db: Session = Depends(get_db)):
+    result = (await score_requests(db, [request]))[0]
+    if "error" in result:
+        if result["error"].startswith(MISSING_FIELDS_ERROR):
+            status_code = 422
+        else:
+            status_code = 404 if request.user_id is not None else 400
+        raise HTTPException(status_code=status_code, detail=result["error"])
+    return FastJSONResponse({"user_id": request.user_id, **result})
+
+# 여러 사용자 위험도 예측 API (실패한 항목은 error로 표시)
+@router.post("/api/risk:batch")
+async def score_risk_batch(requests: List[RiskRequest], db: Session = Depends(get_db)):
+    if len(requests) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"한 번에 최대 {MAX_BATCH_SIZE}명까지 예측할 수 있습니다")
+    results = await score_requests(db, requests)
+    return FastJSONResponse({
+        "results": [{"user_id": request.user_id, **result} for request, result in zip(requests, results)]
+    })
+
+# 모델 버전 및 로딩 지표 조회 API
+@router.get("/api/risk/models")
+def get_risk_models_status():
+    return FastJSONResponse(model_status())
+
+# 레지스트리에서 바뀐 모델만 다시 로딩 (프로세스 재시작 없이 교체)
+@router.post("/api/risk/models:reload")
+async def reload_models():
+    changed = await run_in_threadpool(reload_risk_models)
+    return FastJSONResponse({"reloaded": changed, "models": model_status()})
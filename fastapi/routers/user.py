@@ -1,22 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException, Form
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Form, Request, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from fastapi.responses import JSONResponse
-from config import SessionLocal
+from fastapi.responses import StreamingResponse
+from config import get_db, SessionLocal
 from models import User
+from serializers import FastJSONResponse, dumps, model_columns
+from services.user_req import UserCreate
+from services.bulk import parse_rows, bulk_insert
+from services.profile_cache import profile_cache
+from services.profile import user_to_dict
 
 router = APIRouter()
 
-# 데이터베이스 세션 생성
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+STREAM_BATCH_SIZE = 1000
+
+# 목록 조회는 ORM 객체 대신 필요한 컬럼만 조회
+USER_COLUMNS = [getattr(User, attr.key) for attr in model_columns(User)]
+
+# 동기 SQLAlchemy를 사용하므로 핸들러는 def로 선언해 FastAPI 스레드 풀에서 실행
 
 # 사용자 데이터 저장 API
 @router.post("/api/users")
-async def save_user(
+def save_user(
     name: str = Form(...),
     age: int = Form(...),
     gender: bool = Form(...),
@@ -26,9 +35,9 @@ async def save_user(
     drinking_status: bool = Form(...),
     smoking_status: bool = Form(...),
     obesity_status: bool = Form(...),
-    fatigue_status: bool = Form(...)
+    fatigue_status: bool = Form(...),
+    db: Session = Depends(get_db)
 ):
-    db = next(get_db())
     new_user = User(
         name=name,
         age=age,
@@ -44,48 +53,62 @@ async def save_user(
     db.add(new_user)
     db.commit()
     db.refresh(new_user)
+    profile_cache.invalidate_user(new_user.user_id)
 
-    return JSONResponse({"message": "User data saved successfully", "user_id": new_user.user_id})
+    return FastJSONResponse({"message": "User data saved successfully", "user_id": new_user.user_id})
 
 # 특정 사용자 데이터 조회 API
 @router.get("/api/users/{user_id}")
-async def get_user(user_id: int, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.user_id == user_id).first()
-    if not user:
+def get_user(user_id: int, db: Session = Depends(get_db)):
+    user_data = profile_cache.get_or_load("user", user_id, lambda: load_user(db, user_id))
+    if not user_data:
         raise HTTPException(status_code=404, detail="User not found")
-    user_data = {
-        "user_id": user.user_id,
-        "name": user.name,
-        "age": user.age,
-        "gender": user.gender,
-        "weight": user.weight,
-        "height": user.height,
-        "bmi": user.bmi,
-        "drinking_status": user.drinking_status,
-        "smoking_status": user.smoking_status,
-        "obesity_status": user.obesity_status,
-        "fatigue_status": user.fatigue_status
-    }
-    return JSONResponse(user_data)
+    return FastJSONResponse(user_data)
 
-# 모든 사용자 데이터 조회 API
+def load_user(db, user_id):
+    user = db.query(User).filter(User.user_id == user_id).first()
+    return user_to_dict(user) if user else None
+
+# 모든 사용자 데이터 조회 API (user_id 기준 커서 페이지네이션)
 @router.get("/api/users")
-async def get_all_users(db: Session = Depends(get_db)):
-    users = db.query(User).all()
-    user_list = [
-        {
-            "user_id": user.user_id,
-            "name": user.name,
-            "age": user.age,
-            "gender": user.gender,
-            "weight": user.weight,
-            "height": user.height,
-            "bmi": user.bmi,
-            "drinking_status": user.drinking_status,
-            "smoking_status": user.smoking_status,
-            "obesity_status": user.obesity_status,
-            "fatigue_status": user.fatigue_status
-        }
-        for user in users
-    ]
-    return JSONResponse({"users": user_list})
+def get_all_users(
+    after: Optional[int] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    stream: bool = False,
+    db: Session = Depends(get_db)
+):
+    if stream:
+        # 요청 세션은 응답 전송 전에 닫힐 수 있으므로 스트리밍은 별도 세션 사용
+        return StreamingResponse(stream_users(after), media_type="application/x-ndjson")
+
+    query = select(*USER_COLUMNS).order_by(User.user_id).limit(limit)
+    if after is not None:
+        query = query.where(User.user_id > after)
+    user_list = [dict(row._mapping) for row in db.execute(query)]
+    next_cursor = user_list[-1]["user_id"] if len(user_list) == limit else None
+    return FastJSONResponse({"users": user_list, "next_cursor": next_cursor})
+
+def stream_users(after=None):
+    """사용자 행을 가져오는 대로 한 줄씩 NDJSON으로 전송"""
+    query = select(*USER_COLUMNS).order_by(User.user_id).execution_options(yield_per=STREAM_BATCH_SIZE)
+    if after is not None:
+        query = query.where(User.user_id > after)
+    db = SessionLocal()
+    try:
+        for row in db.execute(query):
+            yield dumps(dict(row._mapping)) + b"\n"
+    finally:
+        db.close()
+
+# 사용자 대량 등록 API (JSON 배열 또는 NDJSON)
+@router.post("/api/users:bulk")
+async def save_users_bulk(request: Request, db: Session = Depends(get_db)):
+    try:
+        rows = parse_rows(await request.body(), request.headers.get("content-type"))
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="JSON 배열 또는 NDJSON 형식이어야 합니다")
+    if not isinstance(rows, list):
+        raise HTTPException(status_code=400, detail="JSON 배열 또는 NDJSON 형식이어야 합니다")
+
+    result = await run_in_threadpool(bulk_insert, db, User, UserCreate, rows)
+    return FastJSONResponse(result)
@@ -1,6 +1,7 @@
 from fastapi import APIRouter
-from fastapi.responses import FileResponse, JSONResponse
-from services.youtube import get_video_details
+from fastapi.responses import FileResponse
+from serializers import FastJSONResponse
+from services.youtube import get_video_details, cache_stats
 
 router = APIRouter()
 
@@ -10,7 +11,11 @@ async def video_details_page(video_id: str):
 
 @router.get("/api/video_details/{video_id}")
 async def video_details_api(video_id: str):
-    video_data = get_video_details(video_id)
+    video_data = await get_video_details(video_id)
     if not video_data:
-        return JSONResponse({"error": "영상 정보를 찾을 수 없습니다."}, status_code=404)
-    return JSONResponse({"video": video_data})
+        return FastJSONResponse({"error": "영상 정보를 찾을 수 없습니다."}, status_code=404)
+    return FastJSONResponse({"video": video_data})
+
+@router.get("/api/youtube/cache_stats")
+async def youtube_cache_stats():
+    return FastJSONResponse(cache_stats())
@@ -0,0 +1,65 @@
+"""
+사용자 등록 처리량 비교 (행 단위 commit + refresh vs bulk_insert 청크 삽입, rows/s)
+
+기본은 SQLite 임시 DB, DATABASE_URL을 지정하면 그 DB에서 측정한다. fastapi 디렉터리에서 실행:
+
+    python -m scripts.bench_bulk --rows 5000
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='bench_bulk_'), 'bench.db')}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import engine, Base, SessionLocal
+from models import User
+from services.bulk import bulk_insert
+from services.user_req import UserCreate
+
+def make_rows(n):
+    return [
+        {"name": f"bench{i}", "age": 20 + i % 60, "gender": bool(i % 2), "weight": 60.0 + i % 30,
+         "height": 160.0 + i % 30, "bmi": 22.0, "drinking_status": False, "smoking_status": bool(i % 3 == 0),
+         "obesity_status": False, "fatigue_status": bool(i % 5 == 0)}
+        for i in range(n)
+    ]
+
+def single_row(db, rows):
+    """기존 POST /api/users 경로: 행마다 add / commit / refresh"""
+    ids = []
+    for row in rows:
+        user = User(**row)
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        ids.append(user.user_id)
+    return ids
+
+def bulk(db, rows):
+    return bulk_insert(db, User, UserCreate, rows)["ids"]
+
+def main():
+    parser = argparse.ArgumentParser(description="단건 / 대량 등록 rows/s 비교")
+    parser.add_argument("--rows", type=int, default=5000)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    rows = make_rows(args.rows)
+    print(f"{'path':<8} {'rows':>6} {'seconds':>8} {'rows/s':>9}")
+    for label, insert_rows in (("single", single_row), ("bulk", bulk)):
+        db = SessionLocal()
+        try:
+            start_time = time.perf_counter()
+            ids = insert_rows(db, rows)
+            elapsed = time.perf_counter() - start_time
+        finally:
+            db.close()
+        assert len(ids) == len(rows) and None not in ids
+        print(f"{label:<8} {len(rows):>6} {elapsed:>8.2f} {len(rows) / elapsed:>9.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+동시 요청 수별 처리량 측정 (스레드 풀 offload vs 이벤트 루프에서 직접 DB 호출)
+
+SQLite 임시 DB에 쿼리마다 --db-latency-ms 만큼 지연을 넣어 RDS 왕복 시간을 흉내 내고,
+GET /api/users (def 핸들러, 스레드 풀 실행)와 같은 쿼리를 async def 안에서 바로 실행하는
+기존 방식 엔드포인트의 초당 요청 수를 비교한다. fastapi 디렉터리에서 실행:
+
+    python -m scripts.bench_concurrency --requests 200 --concurrency 1 4 16 32
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+
+import httpx
+import numpy as np
+
+_workdir = tempfile.mkdtemp(prefix="bench_concurrency_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_workdir, 'bench.db')}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI, Depends
+from sqlalchemy import event, select, insert
+from sqlalchemy.orm import Session
+from config import engine, Base, SessionLocal, get_db
+from models import User
+from routers import user
+from serializers import FastJSONResponse
+
+N_USERS = 1000
+
+def create_app():
+    app = FastAPI()
+    app.include_router(user.router)
+
+    # 기존 방식: async def 핸들러에서 동기 SQLAlchemy 호출 (이벤트 루프를 막음)
+    @app.get("/blocking/users")
+    async def blocking_users(limit: int = 100, db: Session = Depends(get_db)):
+        query = select(*user.USER_COLUMNS).order_by(User.user_id).limit(limit)
+        return FastJSONResponse({"users": [dict(row._mapping) for row in db.execute(query)]})
+
+    return app
+
+def seed():
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        db.execute(insert(User), [
+            {"name": f"user{i}", "age": 20 + i % 60, "gender": bool(i % 2), "weight": 60.0, "height": 170.0,
+             "bmi": 20.8, "drinking_status": False, "smoking_status": False, "obesity_status": False,
+             "fatigue_status": False}
+            for i in range(N_USERS)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+async def run_level(client, path, n_requests, concurrency):
+    slots = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with slots:
+            start_time = time.perf_counter()
+            response = await client.get(path)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start_time)
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*[one() for _ in range(n_requests)])
+    return n_requests / (time.perf_counter() - start_time), float(np.percentile(latencies, 50)) * 1000
+
+async def run(args):
+    transport = httpx.ASGITransport(app=create_app())
+    results = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for label, path in (("threadpool", "/api/users?limit=100"), ("blocking", "/blocking/users?limit=100")):
+            for concurrency in args.concurrency:
+                throughput, p50 = await run_level(client, path, args.requests, concurrency)
+                results.append((label, concurrency, throughput, p50))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 요청 수별 처리량 측정")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 32])
+    parser.add_argument("--db-latency-ms", type=float, default=5.0, help="쿼리마다 넣을 지연 (RDS 왕복 시간)")
+    args = parser.parse_args()
+
+    seed()
+    delay = args.db_latency_ms / 1000
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _simulate_latency(*_):
+        time.sleep(delay)
+
+    print(f"{'mode':<11} {'in-flight':>9} {'req/s':>8} {'p50(ms)':>8}")
+    for label, concurrency, throughput, p50 in asyncio.run(run(args)):
+        print(f"{label:<11} {concurrency:>9} {throughput:>8.1f} {p50:>8.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+recommend_videos 지연 시간 측정 (YouTube 대역 서버 사용, p50 / p99)
+
+요청마다 SentenceTransformer를 새로 만드는 기존 방식(per-call)과
+공유 인코더(shared)를 비교한다. fastapi 디렉터리에서 실행:
+
+    python -m scripts.bench_recommend --requests 50
+"""
+import os
+import sys
+import time
+import asyncio
+import logging
+import argparse
+import tempfile
+import threading
+
+import numpy as np
+
+PORT = 8091
+# 카탈로그 / TF-IDF / 임베딩 캐시를 비워 둔 상태에서 YouTube 경로만 측정 (서비스 모듈 import 전에 설정)
+_workdir = tempfile.mkdtemp(prefix="bench_recommend_")
+os.environ["YOUTUBE_API_BASE_URL"] = f"http://127.0.0.1:{PORT}/youtube/v3"
+os.environ["VIDEO_CATALOG_DIR"] = os.path.join(_workdir, "catalog")
+os.environ["TFIDF_MODEL_PATH"] = os.path.join(_workdir, "tfidf", "tfidf.json")
+os.environ["EMBEDDING_CACHE_DIR"] = os.path.join(_workdir, "embeddings")
+os.environ.pop("YOUTUBE_CACHE_DB", None)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.youtube_stub import make_server, DEFAULT_FIXTURE_PATH
+from services.youtube_client import close_client
+from services.recommendation import recommend_videos
+from services.encoder import clear_encoders, warm_up
+
+CATEGORIES = ["수면장애", "심혈관질환"]
+
+async def measure(n_requests, per_call):
+    latencies = []
+    for _ in range(n_requests):
+        if per_call:
+            # 기존 방식: 요청마다 모델 생성
+            clear_encoders()
+        start_time = time.perf_counter()
+        await recommend_videos(CATEGORIES)
+        latencies.append(time.perf_counter() - start_time)
+    return latencies
+
+async def run(n_requests):
+    results = {}
+    results["per-call"] = await measure(n_requests, per_call=True)
+    warm_up()
+    results["shared"] = await measure(n_requests, per_call=False)
+    await close_client()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="recommend_videos p50/p99 측정")
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURE_PATH)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    server = make_server(args.fixtures, port=PORT)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        results = asyncio.run(run(args.requests))
+    finally:
+        server.shutdown()
+
+    print(f"{'mode':<9} {'n':>4} {'p50(ms)':>9} {'p99(ms)':>9}")
+    for mode, latencies in results.items():
+        latencies = np.asarray(latencies) * 1000
+        print(f"{mode:<9} {len(latencies):>4} {np.percentile(latencies, 50):>9.1f} {np.percentile(latencies, 99):>9.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+위험도 예측 처리량 (users/s): 사용자마다 score_records 호출 vs 배치 한 번 호출
+
+APP.PY-LEGACY(또는 모델 레지스트리)의 모델을 그대로 사용한다. fastapi 디렉터리에서 실행:
+
+    python -m scripts.bench_risk --users 1000 --batch-sizes 1 10 100 1000
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.risk import load_risk_models, model_status, score_records
+
+def make_records(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        {
+            "age": rng.randint(20, 80), "gender": rng.randint(0, 1), "height": rng.uniform(150, 190),
+            "weight": rng.uniform(45, 110), "alco": rng.randint(0, 1), "smoke": rng.randint(0, 1),
+            "sleep_duration": rng.uniform(4, 9), "tired": rng.randint(0, 1), "systolic": rng.randint(100, 170),
+            "diastolic": rng.randint(60, 110), "daily_steps": rng.randint(1000, 12000), "col": rng.randint(0, 1),
+        }
+        for _ in range(n)
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description="위험도 예측 users/s 측정")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    args = parser.parse_args()
+
+    load_risk_models()
+    for name, status in model_status().items():
+        print(f"{name:<9} version={status['version']} compiled={status['compiled']} error={status['error']}")
+
+    records = make_records(args.users)
+    score_records(records[:1])
+    print(f"\n{'batch':>6} {'users':>6} {'seconds':>8} {'users/s':>9}")
+    for batch_size in args.batch_sizes:
+        start_time = time.perf_counter()
+        for start in range(0, len(records), batch_size):
+            score_records(records[start:start + batch_size])
+        elapsed = time.perf_counter() - start_time
+        print(f"{batch_size:>6} {len(records):>6} {elapsed:>8.3f} {len(records) / elapsed:>9.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+User 10,000행 직렬화 비교
+
+old: 필드별로 직접 만든 dict + JSONResponse (표준 json)
+new: row_mapper로 생성한 변환 함수 + FastJSONResponse (orjson, 없으면 표준 json)
+
+DB 없이 메모리의 User 객체로 측정한다. fastapi 디렉터리에서 실행:
+
+    python -m scripts.bench_serialization --rows 10000 --repeat 20
+"""
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.responses import JSONResponse
+from models import User
+from serializers import FastJSONResponse, orjson
+from services.profile import user_to_dict
+
+def make_users(n):
+    return [
+        User(user_id=i, name=f"사용자{i}", age=20 + i % 60, gender=bool(i % 2), weight=60.5, height=170.2, bmi=20.9,
+             drinking_status=False, smoking_status=bool(i % 3 == 0), obesity_status=False, fatigue_status=True)
+        for i in range(n)
+    ]
+
+def old_path(users):
+    user_list = [
+        {
+            "user_id": user.user_id,
+            "name": user.name,
+            "age": user.age,
+            "gender": user.gender,
+            "weight": user.weight,
+            "height": user.height,
+            "bmi": user.bmi,
+            "drinking_status": user.drinking_status,
+            "smoking_status": user.smoking_status,
+            "obesity_status": user.obesity_status,
+            "fatigue_status": user.fatigue_status
+        }
+        for user in users
+    ]
+    return JSONResponse(user_list).body
+
+def new_path(users):
+    return FastJSONResponse([user_to_dict(user) for user in users]).body
+
+def main():
+    parser = argparse.ArgumentParser(description="User 행 직렬화 비교")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    users = make_users(args.rows)
+    print(f"encoder: {'orjson' if orjson is not None else 'json (orjson 미설치)'}")
+    print(f"{'path':<5} {'ms/call':>8} {'bytes':>9}")
+    for label, serialize in (("old", old_path), ("new", new_path)):
+        serialize(users)
+        start_time = time.perf_counter()
+        for _ in range(args.repeat):
+            body = serialize(users)
+        elapsed = (time.perf_counter() - start_time) / args.repeat
+        print(f"{label:<5} {elapsed * 1000:>8.2f} {len(body):>9}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+고정 카탈로그(fixtures/youtube_fixture.json) 추천 확인
+
+1. set_catalog로 교체한 카탈로그만으로 recommend_videos가 YouTube 호출 없이 결과를 내는지
+2. 다른 프로세스가 카탈로그를 다시 저장하면 get_catalog가 새 카탈로그를 읽는지
+
+fastapi 디렉터리에서 실행:
+
+    python -m scripts.check_catalog
+"""
+import os
+import sys
+import json
+import asyncio
+import logging
+import tempfile
+
+_workdir = tempfile.mkdtemp(prefix="check_catalog_")
+# 닫힌 포트로 설정해 YouTube 경로로 빠지면 바로 실패하게 함 (서비스 모듈 import 전에 설정)
+os.environ["YOUTUBE_API_BASE_URL"] = "http://127.0.0.1:9/youtube/v3"
+os.environ["VIDEO_CATALOG_DIR"] = os.path.join(_workdir, "catalog")
+os.environ["TFIDF_MODEL_PATH"] = os.path.join(_workdir, "tfidf", "tfidf.json")
+os.environ["EMBEDDING_CACHE_DIR"] = os.path.join(_workdir, "embeddings")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import catalog as catalog_module
+from services.catalog import Catalog, get_catalog, set_catalog, video_text
+from services.encoder import get_encoder
+from services.tfidf_model import update_tfidf_model
+from services.youtube_stub import DEFAULT_FIXTURE_PATH
+from services.recommendation import recommend_videos
+
+def build_catalog(videos):
+    texts = [video_text(video) for video in videos]
+    update_tfidf_model(texts, [video["id"] for video in videos])
+    return Catalog(videos, get_encoder().encode(texts))
+
+def check_fixture_recommendations(videos):
+    set_catalog(build_catalog(videos))
+    recommendations = asyncio.run(recommend_videos(["수면장애"]))
+    assert len(recommendations) == len(videos), recommendations
+    assert recommendations[0]["link"].endswith("stub0001"), recommendations
+    print(f"고정 카탈로그 추천: {[r['link'].rsplit('=', 1)[1] for r in recommendations]}")
+
+def check_reload(videos):
+    catalog_module.RELOAD_CHECK_SECONDS = 0
+    catalog_dir = catalog_module.DEFAULT_CATALOG_DIR
+    build_catalog(videos[:2]).save(catalog_dir)
+    assert len(get_catalog()) == 2
+
+    # 수집 프로세스가 다시 저장한 상황 (같은 시각으로 찍히지 않도록 수정 시각을 앞으로 옮김)
+    build_catalog(videos).save(catalog_dir)
+    path = os.path.join(catalog_dir, "videos.json")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert len(get_catalog()) == len(videos)
+    print(f"카탈로그 다시 읽기: 2개 -> {len(videos)}개")
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+    with open(DEFAULT_FIXTURE_PATH, "r", encoding="utf-8") as f:
+        videos = list(json.load(f)["videos"].values())
+    check_fixture_recommendations(videos)
+    check_reload(videos)
+    print("OK")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+최신 상세 정보 조회가 ix_DETAIL_user_id_detail_id 인덱스를 쓰는지 EXPLAIN으로 확인하고 조회 시간 측정
+
+SQLite 임시 DB에 DETAIL 행을 채운 뒤 latest_detail / load_users_with_latest_details가
+실제로 실행하는 SQL을 가로채 EXPLAIN QUERY PLAN을 확인한다. fastapi 디렉터리에서 실행:
+
+    python -m scripts.check_detail_index --rows 1000000
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='check_detail_index_'), 'bench.db')}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, insert, text
+from config import engine, Base, SessionLocal
+from models import User, Detail
+from migrations import ensure_indexes
+from services.detail_query import latest_detail
+from services.profile import load_users_with_latest_details
+
+INDEX_NAME = "ix_DETAIL_user_id_detail_id"
+CHUNK_SIZE = 50000
+
+def seed(n_users, n_rows):
+    Base.metadata.create_all(bind=engine)
+    ensure_indexes()
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"user_id": i, "name": f"user{i}"} for i in range(1, n_users + 1)])
+        for start in range(0, n_rows, CHUNK_SIZE):
+            conn.execute(insert(Detail), [
+                {"user_id": random.randint(1, n_users), "systolic_bp": 120, "diastolic_bp": 80, "heart_rate": 70,
+                 "daily_steps": 5000, "cholesterol_status": False, "daily_sleep": 7.0, "hypertension_status": False}
+                for _ in range(start, min(start + CHUNK_SIZE, n_rows))
+            ])
+        conn.execute(text("ANALYZE"))
+
+def capture_queries(func):
+    """func 실행 중 DETAIL을 조회한 SQL과 파라미터 -> [(sql, params)], 소요 시간"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if "DETAIL" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        start_time = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start_time
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return statements, elapsed
+
+def explain(statement, parameters):
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return [row[-1] for row in rows]
+
+def check(label, func):
+    db = SessionLocal()
+    try:
+        statements, elapsed = capture_queries(lambda: func(db))
+    finally:
+        db.close()
+    assert statements, f"{label}: DETAIL 조회가 실행되지 않았습니다"
+    plan = explain(*statements[0])
+    print(f"[{label}] {elapsed * 1000:.2f}ms")
+    for line in plan:
+        print(f"    {line}")
+    assert any(INDEX_NAME in line for line in plan), f"{label}: {INDEX_NAME}를 사용하지 않습니다"
+    assert not any(line.startswith("SCAN") and "DETAIL" in line and "INDEX" not in line for line in plan), \
+        f"{label}: DETAIL 전체 스캔"
+
+def main():
+    parser = argparse.ArgumentParser(description="DETAIL 인덱스 사용 확인")
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    seed(args.users, args.rows)
+    print(f"DETAIL {args.rows}행 생성 ({time.perf_counter() - start_time:.1f}초)")
+
+    user_ids = random.sample(range(1, args.users + 1), 100)
+    check("latest_detail", lambda db: latest_detail(db, user_ids[0]))
+    check("load_users_with_latest_details", lambda db: load_users_with_latest_details(db, user_ids))
+    print("OK")
+
+if __name__ == "__main__":
+    main()
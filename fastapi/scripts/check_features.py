@@ -0,0 +1,90 @@
+"""
+services.features 벡터 연산과 레거시 스칼라 함수(APP.PY-LEGACY/app.py) 결과 비교
+
+app.py는 import 시 모델을 로딩하므로 calculate_bmi_category / calculate_hypertension만
+ast로 꺼내 실행한다. BMI 18.5 / 25 / 30, 수축기 139 / 140, 이완기 89 / 90 경계와 NaN을 확인한다.
+fastapi 디렉터리에서 실행:
+
+    python -m scripts.check_features
+"""
+import os
+import sys
+import ast
+import itertools
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.features import bmi_category, hypertension, columns_from_records, add_derived_columns
+
+LEGACY_APP = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "APP.PY-LEGACY", "app.py"
+)
+LEGACY_FUNCTIONS = ("calculate_bmi_category", "calculate_hypertension")
+
+def load_legacy_functions(path=LEGACY_APP):
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    nodes = [node for node in tree.body if isinstance(node, ast.FunctionDef) and node.name in LEGACY_FUNCTIONS]
+    namespace = {}
+    exec(compile(ast.Module(body=nodes, type_ignores=[]), path, "exec"), namespace)
+    return namespace["calculate_bmi_category"], namespace["calculate_hypertension"]
+
+def around(value):
+    """경계값과 float64 기준 바로 아래 / 위 값"""
+    return [np.nextafter(value, -np.inf), value, np.nextafter(value, np.inf)]
+
+def bmi_grid():
+    # 키 200cm이면 (키/100)^2 = 4.0이므로 BMI가 정확히 경계값이 되는 몸무게를 만들 수 있음
+    pairs = [(200.0, weight) for bmi in (18.5, 25.0, 30.0) for weight in around(bmi * 4)]
+    pairs += [(170.0, weight) for weight in np.arange(40.0, 100.0, 0.1)]
+    pairs += [(np.nan, 70.0), (170.0, np.nan), (np.nan, np.nan)]
+    return pairs
+
+def blood_pressure_grid():
+    systolic = [120.0, 139.0, *around(140.0), 141.0, np.nan]
+    diastolic = [80.0, 89.0, *around(90.0), 91.0, np.nan]
+    return list(itertools.product(systolic, diastolic))
+
+def check_bmi(legacy):
+    pairs = bmi_grid()
+    heights, weights = np.array(pairs).T
+    expected = np.array([legacy(height, weight) for height, weight in pairs])
+    actual = bmi_category(heights, weights)
+    mismatches = np.flatnonzero(actual != expected)
+    assert not len(mismatches), [(pairs[i], int(expected[i]), int(actual[i])) for i in mismatches]
+    print(f"bmi_category: {len(pairs)}개 일치")
+
+def check_hypertension(legacy):
+    pairs = blood_pressure_grid()
+    systolic, diastolic = np.array(pairs).T
+    expected = np.array([legacy(s, d) for s, d in pairs])
+    actual = hypertension(systolic, diastolic)
+    mismatches = np.flatnonzero(actual != expected)
+    assert not len(mismatches), [(pairs[i], int(expected[i]), int(actual[i])) for i in mismatches]
+    print(f"hypertension: {len(pairs)}개 일치")
+
+def check_pipeline(legacy_bmi, legacy_hypertension):
+    """요청 dict -> columns_from_records -> add_derived_columns 결과도 같은지"""
+    records = [
+        {"age": 40, "gender": 1, "height": height, "weight": weight, "alco": 0, "smoke": 0, "sleep_duration": 7.0,
+         "tired": 0, "systolic": systolic, "diastolic": diastolic, "daily_steps": 5000, "col": 0}
+        for (height, weight), (systolic, diastolic) in zip(bmi_grid(), itertools.cycle(blood_pressure_grid()))
+    ]
+    columns = add_derived_columns(columns_from_records(records))
+    expected_bmi = [legacy_bmi(record["height"], record["weight"]) for record in records]
+    expected_hyper = [legacy_hypertension(record["systolic"], record["diastolic"]) for record in records]
+    assert np.array_equal(columns["BMI Encoded"], expected_bmi)
+    assert np.array_equal(columns["Hyper"], expected_hyper)
+    print(f"파생 컬럼: {len(records)}행 일치")
+
+def main():
+    legacy_bmi, legacy_hypertension = load_legacy_functions()
+    check_bmi(legacy_bmi)
+    check_hypertension(legacy_hypertension)
+    check_pipeline(legacy_bmi, legacy_hypertension)
+    print("OK")
+
+if __name__ == "__main__":
+    main()
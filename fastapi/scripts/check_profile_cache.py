@@ -0,0 +1,103 @@
+"""
+프로필 캐시 확인 (dict 기반 가짜 저장소 사용)
+
+1. 두 번째 조회는 loader를 부르지 않고 캐시에서 반환하는지
+2. invalidate_user가 user / detail / profile 항목을 모두 지우는지
+3. loader가 DB를 읽는 동안 수정이 커밋되고 무효화되면, 읽어 둔 이전 값을 캐시에 저장하지 않는지
+
+fastapi 디렉터리에서 실행:
+
+    python -m scripts.check_profile_cache
+"""
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.profile_cache import CacheBackend, ProfileCache
+
+class DictBackend(CacheBackend):
+    """만료 없는 dict 저장소 (저장 / 삭제 호출 기록)"""
+
+    def __init__(self):
+        self.data = {}
+        self.sets = []
+        self.deletes = []
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value):
+        self.sets.append(key)
+        self.data[key] = value
+
+    def delete(self, key):
+        self.deletes.append(key)
+        self.data.pop(key, None)
+
+def check_read_through():
+    backend = DictBackend()
+    cache = ProfileCache(backend)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"user_id": 1, "name": "user1"}
+
+    assert cache.get_or_load("user", 1, loader) == {"user_id": 1, "name": "user1"}
+    assert cache.get_or_load("user", 1, loader) == {"user_id": 1, "name": "user1"}
+    assert len(calls) == 1, "두 번째 조회에서 loader를 다시 호출했습니다"
+    assert cache.get_or_load("user", 2, lambda: None) is None and "user:2" not in backend.data
+    assert cache.stats["hits"] == 1 and cache.stats["misses"] == 2
+    print("read-through: 두 번째 조회 캐시 적중, None은 저장하지 않음")
+
+def check_invalidate_user():
+    backend = DictBackend()
+    cache = ProfileCache(backend)
+    for kind in ("user", "detail", "profile"):
+        cache.get_or_load(kind, 1, lambda: {"kind": kind})
+    cache.get_or_load("user", 2, lambda: {"kind": "user"})
+    cache.invalidate_user(1)
+    assert set(backend.data) == {"user:2"}, backend.data
+    print("invalidate_user: user / detail / profile 항목 삭제")
+
+def check_stale_fill():
+    backend = DictBackend()
+    cache = ProfileCache(backend)
+    db = {"daily_sleep": 6.0}
+    loaded = threading.Event()
+    committed = threading.Event()
+
+    def slow_loader():
+        value = dict(db)  # 수정 전 값을 읽음
+        loaded.set()
+        committed.wait(timeout=5)
+        return value
+
+    def save_detail():
+        loaded.wait(timeout=5)
+        db["daily_sleep"] = 8.0
+        cache.invalidate_user(1)
+        committed.set()
+
+    reader = threading.Thread(target=lambda: cache.get_or_load("detail", 1, slow_loader))
+    writer = threading.Thread(target=save_detail)
+    reader.start()
+    writer.start()
+    reader.join()
+    writer.join()
+
+    assert "detail:1" not in backend.data, f"수정 전 값이 캐시에 남았습니다: {backend.data}"
+    assert cache.stats["stale_skips"] == 1
+    assert cache.get_or_load("detail", 1, lambda: dict(db)) == {"daily_sleep": 8.0}
+    print("무효화 경쟁: 읽는 중 무효화된 값은 저장하지 않고 다음 조회에서 새 값을 읽음")
+
+def main():
+    check_read_through()
+    check_invalidate_user()
+    check_stale_fill()
+    print("OK")
+
+if __name__ == "__main__":
+    main()
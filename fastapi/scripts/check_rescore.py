@@ -0,0 +1,105 @@
+"""
+야간 위험도 재계산 작업 재개 확인 (SQLite 임시 DB)
+
+필수 값이 빈 사용자와 상세 정보가 없는 사용자를 섞어 채운 뒤, 청크 두 개만 커밋하고
+중단된 상황을 만든 다음 jobs.rescore.run으로 이어서 실행해 다음을 확인한다.
+
+- 이어서 실행할 때 마지막으로 커밋된 청크 다음부터 시작하는지
+- 완전한 프로필을 가진 사용자는 모두 한 번씩 RISK에 기록되는지
+- 불완전한 사용자 때문에 청크가 실패하지 않는지
+
+fastapi 디렉터리에서 실행:
+
+    python -m scripts.check_rescore --users 5000 --chunk-size 500
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='check_rescore_'), 'rescore.db')}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert, select, func
+from config import engine, Base, SessionLocal
+from models import User, Detail, RiskScore, RiskJob
+from jobs import rescore
+from services.risk import load_risk_models
+
+def seed(n_users):
+    """사용자 n명: 7번째마다 상세 정보 없음, 11번째마다 수면 시간 NULL -> 완전한 사용자 수"""
+    Base.metadata.create_all(bind=engine)
+    complete = 0
+    users, details = [], []
+    for user_id in range(1, n_users + 1):
+        users.append({"user_id": user_id, "name": f"user{user_id}", "age": 20 + user_id % 60, "gender": bool(user_id % 2),
+                      "weight": 50.0 + user_id % 40, "height": 155.0 + user_id % 35, "bmi": 22.0,
+                      "drinking_status": False, "smoking_status": bool(user_id % 3 == 0), "obesity_status": False,
+                      "fatigue_status": bool(user_id % 5 == 0)})
+        if user_id % 7 == 0:
+            continue
+        daily_sleep = None if user_id % 11 == 0 else 4.0 + user_id % 5
+        details.append({"user_id": user_id, "systolic_bp": 100 + user_id % 70, "diastolic_bp": 60 + user_id % 40,
+                        "heart_rate": 70, "daily_steps": 1000 + user_id % 10000, "cholesterol_status": bool(user_id % 4 == 0),
+                        "daily_sleep": daily_sleep, "hypertension_status": False})
+        complete += daily_sleep is not None
+    with engine.begin() as conn:
+        conn.execute(insert(User), users)
+        conn.execute(insert(Detail), details)
+    return complete
+
+def interrupted_run(chunk_size, n_chunks):
+    """청크 n개만 커밋하고 중단된 실행 -> 마지막으로 커밋된 user_id"""
+    Base.metadata.create_all(bind=engine, tables=[RiskScore.__table__, RiskJob.__table__])
+    read_db, write_db = SessionLocal(), SessionLocal()
+    try:
+        after_user_id = rescore.start_job(write_db)
+        for i, (last_user_id, rows) in enumerate(rescore.read_chunks(read_db, after_user_id, chunk_size)):
+            rescore.commit_chunk(write_db, rescore.score_chunk(rows), last_user_id)
+            if i + 1 == n_chunks:
+                return last_user_id
+    finally:
+        read_db.close()
+        write_db.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="위험도 재계산 재개 확인")
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    complete = seed(args.users)
+    load_risk_models()
+    checkpoint = interrupted_run(args.chunk_size, n_chunks=2)
+
+    db = SessionLocal()
+    try:
+        job = db.get(RiskJob, rescore.JOB_NAME)
+        assert job.last_user_id == checkpoint and not job.finished
+        scored_before = db.scalar(select(func.count()).select_from(RiskScore))
+    finally:
+        db.close()
+    print(f"중단: user_id <= {checkpoint}까지 커밋, {scored_before}명 기록")
+
+    start_time = time.time()
+    scored_after = rescore.run(args.chunk_size, args.workers)
+    elapsed = time.time() - start_time
+
+    db = SessionLocal()
+    try:
+        total = db.scalar(select(func.count()).select_from(RiskScore))
+        job = db.get(RiskJob, rescore.JOB_NAME)
+    finally:
+        db.close()
+
+    assert job.finished, "작업이 완료로 기록되지 않았습니다"
+    assert total == complete, f"RISK {total}행, 완전한 프로필 {complete}명"
+    # 체크포인트 이전 사용자를 다시 계산했다면 두 실행의 합이 전체보다 커짐
+    assert scored_before + scored_after == complete, "체크포인트 이전 사용자를 다시 계산했거나 누락했습니다"
+    print(f"재개: {scored_after}명 추가 ({scored_after / elapsed:.0f}명/초), 총 {total}명 = 완전한 프로필 {complete}명")
+    print("OK")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import json
+import datetime
+from operator import attrgetter
+from sqlalchemy import inspect
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 사용
+    orjson = None
+
+def _default(obj):
+    # numpy 스칼라/배열
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if isinstance(obj, (datetime.date, datetime.datetime)):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def dumps(content):
+    """객체 -> JSON bytes (가능하면 orjson)"""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답 (없으면 표준 json으로 대체)"""
+
+    def render(self, content):
+        return dumps(content)
+
+def model_columns(model, exclude=()):
+    """모델 컬럼 속성 목록 (models.py 선언 순서)"""
+    return [attr for attr in inspect(model).column_attrs if attr.key not in exclude]
+
+_mappers = {}
+
+def row_mapper(model, exclude=()):
+    """모델별 ORM 객체 -> dict 변환 함수 (컬럼 메타데이터로 한 번만 생성)"""
+    key = (model, tuple(exclude))
+    mapper = _mappers.get(key)
+    if mapper is None:
+        keys = tuple(attr.key for attr in model_columns(model, exclude))
+        getter = attrgetter(*keys)
+        if len(keys) == 1:
+            mapper = lambda obj: {keys[0]: getter(obj)}
+        else:
+            mapper = lambda obj: dict(zip(keys, getter(obj)))
+        _mappers[key] = mapper
+    return mapper
@@ -0,0 +1,88 @@
+import json
+import logging
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+
+BULK_CHUNK_SIZE = 500
+
+def parse_rows(body, content_type):
+    """요청 본문 -> 행 리스트 (JSON 배열 또는 NDJSON)"""
+    text = body.decode("utf-8")
+    if "ndjson" in (content_type or "") or not text.lstrip().startswith("["):
+        rows = []
+        for line in text.splitlines():
+            line = line.strip()
+            if line:
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    rows.append(e)
+        return rows
+    return json.loads(text)
+
+def validate_rows(rows, schema):
+    """스키마 검증 -> (유효한 (행 번호, dict) 리스트, 오류 리스트)"""
+    valid, errors = [], []
+    for i, row in enumerate(rows):
+        if isinstance(row, Exception):
+            errors.append({"row": i, "error": f"JSON 파싱 실패: {row}"})
+            continue
+        if not isinstance(row, dict):
+            errors.append({"row": i, "error": "객체가 아닙니다"})
+            continue
+        try:
+            item = schema(**row)
+        except ValidationError as e:
+            errors.append({"row": i, "error": [{"loc": list(err["loc"]), "msg": err["msg"]} for err in e.errors()]})
+            continue
+        valid.append((i, item.model_dump() if hasattr(item, "model_dump") else item.dict()))
+    return valid, errors
+
+def insert_chunk(db, model, values):
+    """청크 삽입 -> 생성된 기본 키 리스트 (입력 순서)
+
+    RETURNING을 지원하는 DB(SQLite, PostgreSQL)는 insert().returning으로 한 번에 삽입하고,
+    MySQL은 다중 행 INSERT의 auto_increment 값이 연속이라는 보장이 없으므로
+    (innodb_autoinc_lock_mode=2) 같은 트랜잭션 안에서 한 행씩 삽입해 각 행의 키를 받는다.
+    """
+    primary_key = model.__mapper__.primary_key[0]
+    dialect = db.get_bind().dialect
+    if getattr(dialect, "insert_executemany_returning_sort_by_parameter_order", False):
+        result = db.execute(insert(model).returning(primary_key, sort_by_parameter_order=True), values)
+        return list(result.scalars())
+    return [db.execute(insert(model).values(**row)).inserted_primary_key[0] for row in values]
+
+def bulk_insert(db, model, schema, rows, chunk_size=BULK_CHUNK_SIZE):
+    """청크 단위 삽입 (실패한 청크만 한 행씩 다시 시도해 오류 행을 골라냄)
+
+    ids는 입력 행 순서대로 생성된 기본 키 (실패한 행은 None)
+    """
+    valid, errors = validate_rows(rows, schema)
+    ids = [None] * len(rows)
+    inserted = 0
+    for start in range(0, len(valid), chunk_size):
+        chunk = valid[start:start + chunk_size]
+        try:
+            chunk_ids = insert_chunk(db, model, [values for _, values in chunk])
+            db.commit()
+            for (i, _), new_id in zip(chunk, chunk_ids):
+                ids[i] = new_id
+            inserted += len(chunk)
+            continue
+        except SQLAlchemyError as e:
+            db.rollback()
+            logging.warning(f"청크 삽입 실패, 행 단위로 재시도: {str(e)}")
+
+        for i, values in chunk:
+            try:
+                result = db.execute(insert(model).values(**values))
+                db.commit()
+                ids[i] = result.inserted_primary_key[0]
+                inserted += 1
+            except SQLAlchemyError as e:
+                db.rollback()
+                errors.append({"row": i, "error": str(e.orig) if getattr(e, "orig", None) else str(e)})
+
+    errors.sort(key=lambda error: error["row"])
+    return {"received": len(rows), "inserted": inserted, "failed": len(errors), "ids": ids, "errors": errors}
@@ -0,0 +1,230 @@
+import os
+import json
+import time
+import logging
+import asyncio
+import argparse
+import threading
+
+import numpy as np
+
+from services.keywords import YOUTUBE_SEARCH_KEYWORDS
+
+DEFAULT_CATALOG_DIR = os.environ.get(
+    "VIDEO_CATALOG_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "cache", "catalog"),
+)
+IVF_THRESHOLD = 5000  # 이 개수 이상이면 IVF 인덱스 사용
+
+def normalize(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+class BruteForceIndex:
+    """정규화된 벡터 전체와 내적하는 정확한 최근접 탐색"""
+
+    def __init__(self, vectors):
+        self.vectors = normalize(vectors)
+
+    def search(self, query, k):
+        scores = self.vectors @ normalize(query)
+        k = min(k, len(scores))
+        if k == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return top, scores[top]
+
+class IVFIndex:
+    """k-means 군집별로 나눠 일부 군집만 탐색하는 근사 최근접 탐색"""
+
+    def __init__(self, vectors, n_lists=None, n_probe=8, n_iter=10, seed=0):
+        self.vectors = normalize(vectors)
+        n_lists = n_lists or max(1, int(np.sqrt(len(self.vectors))))
+        self.n_probe = n_probe
+        rng = np.random.default_rng(seed)
+        self.centroids = self.vectors[rng.choice(len(self.vectors), n_lists, replace=False)]
+        for _ in range(n_iter):
+            assign = np.argmax(self.vectors @ self.centroids.T, axis=1)
+            for c in range(n_lists):
+                members = self.vectors[assign == c]
+                if len(members):
+                    self.centroids[c] = members.mean(axis=0)
+            self.centroids = normalize(self.centroids)
+        assign = np.argmax(self.vectors @ self.centroids.T, axis=1)
+        self.lists = [np.flatnonzero(assign == c) for c in range(n_lists)]
+
+    def search(self, query, k):
+        query = normalize(query)
+        probe = np.argsort(-(self.centroids @ query))[:self.n_probe]
+        candidates = np.concatenate([self.lists[c] for c in probe])
+        scores = self.vectors[candidates] @ query
+        k = min(k, len(scores))
+        if k == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return candidates[top], scores[top]
+
+def build_index(vectors, ivf_threshold=IVF_THRESHOLD):
+    if len(vectors) >= ivf_threshold:
+        return IVFIndex(vectors)
+    return BruteForceIndex(vectors)
+
+class Catalog:
+    """로컬 영상 카탈로그 (videos.json + embeddings.npy)"""
+
+    def __init__(self, videos, embeddings, ivf_threshold=IVF_THRESHOLD):
+        self.videos = videos
+        self.embeddings = normalize(embeddings)
+        self.index = build_index(self.embeddings, ivf_threshold)
+        self._tfidf_matrix = None
+        self._tfidf_version = None
+
+    @classmethod
+    def load(cls, catalog_dir=DEFAULT_CATALOG_DIR, **kwargs):
+        with open(os.path.join(catalog_dir, "videos.json"), "r", encoding="utf-8") as f:
+            videos = json.load(f)
+        embeddings = np.load(os.path.join(catalog_dir, "embeddings.npy"), mmap_mode="r")
+        return cls(videos, embeddings, **kwargs)
+
+    def save(self, catalog_dir=DEFAULT_CATALOG_DIR):
+        """임베딩 -> videos.json 순서로 교체 (videos.json 수정 시각이 바뀌면 API가 다시 읽음)"""
+        os.makedirs(catalog_dir, exist_ok=True)
+        tmp_embeddings = os.path.join(catalog_dir, "embeddings.tmp.npy")
+        np.save(tmp_embeddings, self.embeddings)
+        os.replace(tmp_embeddings, os.path.join(catalog_dir, "embeddings.npy"))
+        tmp_videos = os.path.join(catalog_dir, "videos.json.tmp")
+        with open(tmp_videos, "w", encoding="utf-8") as f:
+            json.dump(self.videos, f, ensure_ascii=False)
+        os.replace(tmp_videos, os.path.join(catalog_dir, "videos.json"))
+
+    def nearest(self, query_embedding, k=10):
+        """쿼리 임베딩과 가까운 영상 k개 -> (행 번호, 유사도)"""
+        return self.index.search(query_embedding, k)
+
+    def search(self, query_embedding, k=10):
+        """쿼리 임베딩과 가까운 영상 k개 -> (영상 리스트, 유사도)"""
+        rows, scores = self.nearest(query_embedding, k)
+        return [self.videos[i] for i in rows], scores
+
+    def tfidf_rows(self, model, rows):
+        """카탈로그 TF-IDF 행렬 중 일부 행 (모델이 바뀌면 다시 계산)"""
+        if self._tfidf_version != model.version:
+            self._tfidf_matrix = model.transform([video_text(video) for video in self.videos])
+            self._tfidf_version = model.version
+        return self._tfidf_matrix[rows]
+
+    def __len__(self):
+        return len(self.videos)
+
+def video_text(video):
+    return video["snippet"]["title"] + " " + video["snippet"]["description"]
+
+async def ingest_catalog(catalog_dir=DEFAULT_CATALOG_DIR):
+    """모든 검색 키워드로 YouTube를 조회해 카탈로그를 새로 만듦"""
+    from services.youtube import search_youtube_videos, get_videos
+    from services.encoder import get_encoder
+    from services.similarity import encode_videos
+    from services.tfidf_model import update_tfidf_model
+
+    start_time = time.time()
+    # 키워드별 검색은 동시에, 상세 정보는 50개 단위 배치로 조회
+    search_results = await asyncio.gather(*[
+        search_youtube_videos(search_keywords) for search_keywords in YOUTUBE_SEARCH_KEYWORDS.values()
+    ])
+    video_ids = list(dict.fromkeys(item["id"]["videoId"] for items in search_results for item in items))
+    videos = {}
+    for video in await get_videos(video_ids):
+        videos[video["id"]] = {
+            "id": video["id"],
+            "snippet": {
+                "title": video["snippet"]["title"],
+                "description": video["snippet"]["description"],
+                "thumbnails": video["snippet"]["thumbnails"],
+            },
+            "statistics": video.get("statistics", {}),
+        }
+
+    videos = list(videos.values())
+    if not videos:
+        logging.warning("카탈로그에 저장할 영상이 없습니다.")
+        return None
+    texts = [video_text(video) for video in videos]
+    video_ids = [video["id"] for video in videos]
+    embeddings = encode_videos(get_encoder(), texts, video_ids)
+    update_tfidf_model(texts, video_ids)
+    catalog = Catalog(videos, embeddings)
+    catalog.save(catalog_dir)
+    logging.info(f"카탈로그 저장 완료: {len(videos)}개 영상 (소요 시간: {time.time() - start_time:.2f}초)")
+    return catalog
+
+RELOAD_CHECK_SECONDS = 5  # 디스크의 카탈로그가 바뀌었는지 확인하는 주기
+
+_catalog = None
+_catalog_mtime = None
+_checked_at = 0.0
+_catalog_lock = threading.Lock()
+
+def _catalog_file_mtime(catalog_dir):
+    try:
+        return os.stat(os.path.join(catalog_dir, "videos.json")).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+def get_catalog(catalog_dir=DEFAULT_CATALOG_DIR):
+    """로컬 카탈로그 반환 (없으면 None)
+
+    별도 프로세스(--interval 수집)가 카탈로그를 다시 저장하면 videos.json 수정 시각으로 감지해 다시 읽는다.
+    """
+    global _catalog, _catalog_mtime, _checked_at
+    now = time.monotonic()
+    if now - _checked_at < RELOAD_CHECK_SECONDS:
+        return _catalog
+
+    with _catalog_lock:
+        _checked_at = now
+        mtime = _catalog_file_mtime(catalog_dir)
+        if mtime is not None and mtime != _catalog_mtime:
+            try:
+                _catalog = Catalog.load(catalog_dir)
+                _catalog_mtime = mtime
+                logging.info(f"카탈로그 로딩 완료: {len(_catalog)}개 영상")
+            except Exception as e:
+                # 읽기에 실패하면 기존 카탈로그를 계속 사용
+                logging.error(f"카탈로그 로딩 실패: {str(e)}")
+    return _catalog
+
+def set_catalog(catalog, catalog_dir=DEFAULT_CATALOG_DIR):
+    """카탈로그 교체 (재수집 후 또는 테스트용 고정 카탈로그)
+
+    디스크의 카탈로그가 그 뒤에 다시 바뀌기 전까지는 교체한 카탈로그를 사용한다.
+    """
+    global _catalog, _catalog_mtime, _checked_at
+    with _catalog_lock:
+        _catalog = catalog
+        _catalog_mtime = _catalog_file_mtime(catalog_dir)
+        _checked_at = time.monotonic()
+
+async def run_periodic_ingest(interval_seconds, catalog_dir=DEFAULT_CATALOG_DIR):
+    while True:
+        try:
+            catalog = await ingest_catalog(catalog_dir)
+            if catalog is not None:
+                set_catalog(catalog, catalog_dir)
+        except Exception as e:
+            logging.error(f"카탈로그 수집 실패: {str(e)}")
+        await asyncio.sleep(interval_seconds)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description="YouTube 영상 카탈로그 수집")
+    parser.add_argument("--dir", default=DEFAULT_CATALOG_DIR)
+    parser.add_argument("--interval", type=int, default=0, help="반복 주기(초), 0이면 한 번만 실행")
+    args = parser.parse_args()
+    if args.interval > 0:
+        asyncio.run(run_periodic_ingest(args.interval, args.dir))
+    else:
+        asyncio.run(ingest_catalog(args.dir))
@@ -0,0 +1,340 @@
+"""
+트리 앙상블(sklearn RandomForest / XGBoost) -> NumPy 노드 배열
+
+모든 트리의 노드를 (feature, threshold, left, right, value) 배열 하나로 이어 붙이고
+트리별 루트 위치만 따로 저장한다. 리프는 left = right = 자기 자신이므로 최대 깊이만큼
+반복하면 모든 행이 리프에 도달한다.
+
+    python -m services.compiled_trees --out cache/compiled
+    python -m services.compiled_trees --verify   # 원래 모델과 예측 / 확률이 완전히 같은지 확인
+"""
+import os
+import sys
+import json
+import argparse
+
+import numpy as np
+
+class CompiledEnsemble:
+    """평탄화된 트리 앙상블 (이진 분류)
+
+    kind == "rf" : x <= threshold 이면 왼쪽, 리프 값은 클래스 확률, 트리 평균
+    kind == "xgb": x < threshold 이면 왼쪽, 리프 값은 margin, float32 합산 후 sigmoid
+    """
+
+    def __init__(self, kind, feature, threshold, left, right, default_left, value,
+                 roots, max_depth, classes, base_margin=0.0):
+        self.kind = kind
+        self.feature = np.asarray(feature, dtype=np.int32)
+        self.threshold = np.asarray(threshold, dtype=np.float64)
+        self.left = np.asarray(left, dtype=np.int32)
+        self.right = np.asarray(right, dtype=np.int32)
+        self.default_left = np.asarray(default_left, dtype=bool)
+        self.value = np.asarray(value, dtype=np.float64 if kind == "rf" else np.float32)
+        self.roots = np.asarray(roots, dtype=np.int32)
+        self.max_depth = int(max_depth)
+        self.classes_ = np.asarray(classes)
+        self.base_margin = np.float32(base_margin)
+
+        # 한 행 예측용 파이썬 리스트 (NumPy 인덱싱 오버헤드 회피)
+        self._nodes = list(zip(self.feature.tolist(), self.threshold.tolist(), self.left.tolist(),
+                               self.right.tolist(), self.default_left.tolist()))
+        self._values = self.value.tolist() if kind == "rf" else [np.float32(v) for v in self.value]
+        self._roots = self.roots.tolist()
+
+    def apply(self, X):
+        """(n_rows, n_features) -> 트리별 리프 위치 (n_rows, n_trees)"""
+        X = np.asarray(X)
+        rows = np.arange(X.shape[0])[:, None]
+        nodes = np.broadcast_to(self.roots, (X.shape[0], len(self.roots))).copy()
+        for _ in range(self.max_depth):
+            x = X[rows, self.feature[nodes]]
+            if self.kind == "rf":
+                go_left = x <= self.threshold[nodes]
+            else:
+                go_left = x < self.threshold[nodes]
+            missing = np.isnan(x)
+            if missing.any():
+                go_left = np.where(missing, self.default_left[nodes], go_left)
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return nodes
+
+    def predict_proba(self, X):
+        leaves = self.apply(X)
+        if self.kind == "rf":
+            # sklearn과 같은 순서로 트리별 확률을 더한 뒤 트리 수로 나눔
+            proba = np.zeros((leaves.shape[0], self.value.shape[1]), dtype=np.float64)
+            for t in range(leaves.shape[1]):
+                proba += self.value[leaves[:, t]]
+            proba /= leaves.shape[1]
+            return proba
+        margin = np.full(leaves.shape[0], self.base_margin, dtype=np.float32)
+        for t in range(leaves.shape[1]):
+            margin += self.value[leaves[:, t]]
+        positive = np.float32(1) / (np.float32(1) + np.exp(-margin))
+        return np.vstack((1 - positive, positive)).T
+
+    def predict(self, X):
+        return self.predict_from_proba(self.predict_proba(X))
+
+    def predict_from_proba(self, proba):
+        """predict_proba 결과 -> 클래스 (rf: 최대 확률, xgb: 양성 확률 > 0.5)"""
+        proba = np.asarray(proba)
+        if self.kind == "rf":
+            return self.classes_.take(np.argmax(proba, axis=1))
+        return self.classes_.take((proba[:, 1] > 0.5).astype(int))
+
+    def _leaf(self, row, node):
+        nodes = self._nodes
+        while True:
+            feature, threshold, left, right, default_left = nodes[node]
+            if left == node:
+                return node
+            x = row[feature]
+            if x != x:  # NaN
+                node = left if default_left else right
+            elif (x <= threshold) if self.kind == "rf" else (x < threshold):
+                node = left
+            else:
+                node = right
+
+    def predict_proba_one(self, row):
+        """한 행 예측 (배열 생성 없이 노드 리스트를 직접 순회) -> 클래스별 확률 리스트"""
+        row = row.tolist() if hasattr(row, "tolist") else list(row)
+        if self.kind == "rf":
+            proba = [0.0] * len(self._values[0])
+            for root in self._roots:
+                for i, v in enumerate(self._values[self._leaf(row, root)]):
+                    proba[i] += v
+            return [p / len(self._roots) for p in proba]
+        margin = self.base_margin
+        for root in self._roots:
+            margin = margin + self._values[self._leaf(row, root)]
+        positive = np.float32(1) / (np.float32(1) + np.exp(-margin))
+        return [float(1 - positive), float(positive)]
+
+    def predict_one(self, row):
+        return self.predict_from_proba([self.predict_proba_one(row)])[0]
+
+    def save(self, path):
+        np.savez(
+            path, kind=self.kind, feature=self.feature, threshold=self.threshold, left=self.left,
+            right=self.right, default_left=self.default_left, value=self.value, roots=self.roots,
+            max_depth=self.max_depth, classes=self.classes_, base_margin=self.base_margin,
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                str(data["kind"]), data["feature"], data["threshold"], data["left"], data["right"],
+                data["default_left"], data["value"], data["roots"], int(data["max_depth"]),
+                data["classes"], float(data["base_margin"]),
+            )
+
+def _tree_depth(left, right, root):
+    depth = 0
+    level = [root]
+    while True:
+        level = [child for node in level if left[node] != node for child in (left[node], right[node])]
+        if not level:
+            return depth
+        depth += 1
+
+def compile_forest(model):
+    """sklearn RandomForestClassifier -> CompiledEnsemble"""
+    feature, threshold, left, right, default_left, value, roots = [], [], [], [], [], [], []
+    max_depth = 0
+    offset = 0
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        n_nodes = tree.node_count
+        ids = np.arange(n_nodes)
+        is_leaf = tree.children_left == -1
+        # 리프 확률은 DecisionTreeClassifier.predict_proba와 같은 방식으로 정규화
+        proba = np.array(tree.value[:, 0, :], dtype=np.float64)
+        normalizer = proba.sum(axis=1)[:, np.newaxis]
+        normalizer[normalizer == 0.0] = 1.0
+        proba /= normalizer
+
+        tree_left = np.where(is_leaf, ids, tree.children_left) + offset
+        tree_right = np.where(is_leaf, ids, tree.children_right) + offset
+        feature.append(np.where(is_leaf, 0, tree.feature))
+        threshold.append(np.where(is_leaf, np.inf, tree.threshold))
+        left.append(tree_left)
+        right.append(tree_right)
+        default_left.append(getattr(tree, "missing_go_to_left", np.zeros(n_nodes, dtype=np.uint8)).astype(bool))
+        value.append(proba)
+        roots.append(offset)
+        max_depth = max(max_depth, tree.max_depth)
+        offset += n_nodes
+    return CompiledEnsemble(
+        "rf", np.concatenate(feature), np.concatenate(threshold), np.concatenate(left),
+        np.concatenate(right), np.concatenate(default_left), np.concatenate(value),
+        roots, max_depth, model.classes_,
+    )
+
+def _parse_base_score(value):
+    # xgboost 2.1부터 "[5E-1]" 형태로 저장됨
+    return float(str(value).strip("[]"))
+
+def compile_xgboost(model):
+    """XGBClassifier (binary:logistic, gbtree) -> CompiledEnsemble"""
+    booster = model.get_booster() if hasattr(model, "get_booster") else model
+    learner = json.loads(bytes(booster.save_raw(raw_format="json")))["learner"]
+    objective = learner["objective"]["name"]
+    if objective != "binary:logistic":
+        raise ValueError(f"지원하지 않는 objective: {objective}")
+    if learner["gradient_booster"]["name"] != "gbtree":
+        raise ValueError("gbtree 부스터만 지원합니다")
+
+    base_score = np.float32(_parse_base_score(learner["learner_model_param"]["base_score"]))
+    base_margin = np.float32(-np.log(np.float32(1) / base_score - np.float32(1)))
+
+    feature, threshold, left, right, default_left, value, roots = [], [], [], [], [], [], []
+    max_depth = 0
+    offset = 0
+    for tree in learner["gradient_booster"]["model"]["trees"]:
+        tree_left = np.asarray(tree["left_children"], dtype=np.int64)
+        tree_right = np.asarray(tree["right_children"], dtype=np.int64)
+        conditions = np.asarray(tree["split_conditions"], dtype=np.float32)
+        n_nodes = len(tree_left)
+        ids = np.arange(n_nodes)
+        is_leaf = tree_left == -1
+        tree_left = np.where(is_leaf, ids, tree_left)
+        tree_right = np.where(is_leaf, ids, tree_right)
+
+        feature.append(np.where(is_leaf, 0, tree["split_indices"]))
+        # 리프 노드의 split_conditions에는 리프 값이 저장됨
+        threshold.append(np.where(is_leaf, np.inf, conditions.astype(np.float64)))
+        left.append(tree_left + offset)
+        right.append(tree_right + offset)
+        default_left.append(np.asarray(tree["default_left"], dtype=bool))
+        value.append(np.where(is_leaf, conditions, np.float32(0)).astype(np.float32))
+        roots.append(offset)
+        max_depth = max(max_depth, _tree_depth(tree_left.tolist(), tree_right.tolist(), 0))
+        offset += n_nodes
+
+    classes = getattr(model, "classes_", np.array([0, 1]))
+    return CompiledEnsemble(
+        "xgb", np.concatenate(feature), np.concatenate(threshold), np.concatenate(left),
+        np.concatenate(right), np.concatenate(default_left), np.concatenate(value),
+        roots, max_depth, classes, base_margin,
+    )
+
+def compile_model(model):
+    """지원하는 트리 앙상블이면 CompiledEnsemble, 아니면 None"""
+    if hasattr(model, "get_booster"):
+        return compile_xgboost(model)
+    if hasattr(model, "estimators_") and all(hasattr(e, "tree_") for e in model.estimators_):
+        return compile_forest(model)
+    return None
+
+def random_rows(compiled, n_features, n_rows=1000, seed=0):
+    """특성별 분기 임계값 범위 안팎에서 고르게 뽑은 float32 행"""
+    rng = np.random.default_rng(seed)
+    internal = compiled.left != np.arange(len(compiled.left))
+    rows = np.empty((n_rows, n_features), dtype=np.float32)
+    for j in range(n_features):
+        thresholds = compiled.threshold[internal & (compiled.feature == j)]
+        low, high = (thresholds.min() - 1, thresholds.max() + 1) if len(thresholds) else (0.0, 1.0)
+        rows[:, j] = rng.uniform(low, high, n_rows)
+    return rows
+
+def boundary_rows(compiled, base_rows):
+    """분기마다 해당 특성만 임계값 바로 아래 / 같은 값 / 바로 위(float32)로 바꾼 행"""
+    base_rows = np.asarray(base_rows, dtype=np.float32)
+    internal = compiled.left != np.arange(len(compiled.left))
+    splits = sorted(set(zip(compiled.feature[internal].tolist(), compiled.threshold[internal].tolist())))
+    rows = []
+    for i, (feature, threshold) in enumerate(splits):
+        threshold = np.float32(threshold)
+        for value in (np.nextafter(threshold, np.float32(-np.inf)), threshold, np.nextafter(threshold, np.float32(np.inf))):
+            row = base_rows[i % len(base_rows)].copy()
+            row[feature] = value
+            rows.append(row)
+    return np.array(rows, dtype=np.float32).reshape(-1, base_rows.shape[1])
+
+def verify_compiled(model, compiled, X, columns=None, n_single=200):
+    """원래 모델과 완전히 같은 결과인지 비교 -> 항목별 불일치 행 수
+
+    predict는 np.array_equal, 양성 확률은 배치 경로와 한 행 경로 모두 값이 정확히 같아야 한다.
+    """
+    X = np.ascontiguousarray(X, dtype=np.float32)
+    features = X
+    if columns is not None:
+        import pandas as pd
+        features = pd.DataFrame(X, columns=columns, copy=False)
+    expected = np.asarray(model.predict(features))
+    expected_proba = np.asarray(model.predict_proba(features))[:, 1]
+
+    proba = compiled.predict_proba(X)
+    single = np.array([compiled.predict_proba_one(row)[1] for row in X[:n_single]], dtype=expected_proba.dtype)
+    return {
+        "rows": len(X),
+        "predict": int(np.sum(np.asarray(compiled.predict_from_proba(proba)) != expected)),
+        "proba": int(np.sum(proba[:, 1] != expected_proba)),
+        "proba_one": int(np.sum(single != expected_proba[:len(single)])),
+    }
+
+def is_exact(result):
+    return result["predict"] == 0 and result["proba"] == 0 and result["proba_one"] == 0
+
+def dataset_rows(name, datasets_dir):
+    """학습 데이터셋(datasets/*.csv)을 학습 때와 같은 방식으로 모델 입력 행렬로 변환 (없으면 None)"""
+    import pandas as pd
+
+    if name == "sleep":
+        data = pd.read_csv(os.path.join(datasets_dir, "Sleep_Data.csv"))
+        blood_pressure = data["Blood Pressure"].str.split("/", expand=True).astype(float)
+        bmi = data["BMI Category"].map({"Normal Weight": 1, "Normal": 2, "Overweight": 3, "Obese": 4})
+        return np.column_stack([bmi, data["Age"], data["Sleep Duration"], blood_pressure[0], blood_pressure[1],
+                                data["Daily Steps"]]).astype(np.float32)
+    if name == "cardio":
+        data = pd.read_csv(os.path.join(datasets_dir, "Cardio_Data.csv"), sep=";")
+        return np.column_stack([data["ap_hi"], data["ap_lo"], data["age"] // 365, data["weight"]]).astype(np.float32)
+    return None
+
+def verification_rows(name, compiled, n_features, datasets_dir=None, n_random=2000):
+    """데이터셋 행(있으면) + 무작위 행 + 분기 경계 행"""
+    parts = [random_rows(compiled, n_features, n_random)]
+    if datasets_dir is not None:
+        rows = dataset_rows(name, datasets_dir)
+        if rows is not None:
+            parts.insert(0, rows)
+    parts.append(boundary_rows(compiled, np.concatenate(parts)))
+    return np.concatenate(parts)
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from services.features import MODEL_COLUMNS
+    from services.risk import COMPILED_MODELS, load_risk_models
+
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    parser = argparse.ArgumentParser(description="트리 앙상블 모델을 NumPy 노드 배열로 내보내기 / 원래 모델과 결과 비교")
+    parser.add_argument("--out", default=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "compiled"))
+    parser.add_argument("--verify", action="store_true", help="내보내지 않고 datasets/*.csv와 분기 경계 행으로 결과 비교")
+    parser.add_argument("--datasets", default=os.path.join(root, "datasets"))
+    args = parser.parse_args()
+    if not args.verify:
+        os.makedirs(args.out, exist_ok=True)
+
+    models = load_risk_models()
+    failed = False
+    for name in COMPILED_MODELS:
+        if name not in models:
+            continue
+        compiled = compile_model(models[name])
+        if compiled is None:
+            print(f"{name}: 지원하지 않는 모델 형식 ({type(models[name]).__name__})")
+            continue
+        if args.verify:
+            X = verification_rows(name, compiled, len(MODEL_COLUMNS[name]), args.datasets)
+            result = verify_compiled(models[name], compiled, X, MODEL_COLUMNS[name])
+            failed = failed or not is_exact(result)
+            print(f"{name}: {'OK' if is_exact(result) else 'MISMATCH'} {result}")
+            continue
+        path = os.path.join(args.out, f"{name}.npz")
+        compiled.save(path)
+        print(f"{name}: 트리 {len(compiled.roots)}개, 노드 {len(compiled.feature)}개 -> {path}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,18 @@
+from sqlalchemy import select, func
+from models import Detail
+
+def latest_detail(db, user_id):
+    """사용자의 가장 최근 상세 정보 (ix_DETAIL_user_id_detail_id 사용)"""
+    return (
+        db.query(Detail)
+        .filter(Detail.user_id == user_id)
+        .order_by(Detail.detail_id.desc())
+        .first()
+    )
+
+def latest_detail_ids(user_ids=None):
+    """사용자별 최신 detail_id 서브쿼리 (user_id, detail_id)"""
+    query = select(Detail.user_id, func.max(Detail.detail_id).label("detail_id"))
+    if user_ids is not None:
+        query = query.where(Detail.user_id.in_(user_ids))
+    return query.group_by(Detail.user_id).subquery()
@@ -0,0 +1,179 @@
+import os
+import json
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from collections import OrderedDict
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없음
+    fcntl = None
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "EMBEDDING_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "cache", "embeddings"),
+)
+DEFAULT_CAPACITY = 4096
+
+def content_hash(text):
+    """스니펫 텍스트 해시 (텍스트가 바뀌면 캐시 무효화)"""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+class EmbeddingStore:
+    """videoId + 텍스트 해시 기준 디스크 임베딩 캐시
+
+    임베딩은 float32 memmap 행렬(capacity x dim)에, 위치 정보는 index.json에 저장한다.
+    index는 최근 사용 순서를 유지하며, 자리가 없으면 가장 오래 쓰지 않은 항목을 덮어쓴다.
+    여러 프로세스가 같은 폴더를 쓰므로 index.lock으로 잠그고, 잠근 뒤 index.json을 다시 읽는다.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, capacity=DEFAULT_CAPACITY):
+        self.cache_dir = cache_dir
+        self.capacity = capacity
+        self.matrix_path = os.path.join(cache_dir, "embeddings.f32")
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.lock_path = os.path.join(cache_dir, "index.lock")
+        self.dim = None
+        self._matrix = None
+        self._index = OrderedDict()  # video_id -> (slot, hash)
+        self._free_slots = []
+        self._index_stamp = None  # 마지막으로 읽거나 쓴 index.json (inode, mtime)
+        self._lock = threading.Lock()
+        with self._lock, self._file_lock(exclusive=False):
+            self._sync()
+
+    @contextmanager
+    def _file_lock(self, exclusive):
+        """프로세스 간 잠금 (API 워커와 카탈로그 수집 프로세스가 같은 캐시 폴더를 씀)"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self.lock_path, "a") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _stamp(self):
+        try:
+            stat = os.stat(self.index_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def _sync(self):
+        """다른 프로세스가 index.json을 바꿨으면 다시 읽음 (파일 잠금 안에서 호출)"""
+        stamp = self._stamp()
+        if stamp == self._index_stamp:
+            return
+        self._index_stamp = stamp
+        self._index.clear()
+        self._free_slots = []
+        if stamp is None or not os.path.exists(self.matrix_path):
+            self.dim = None
+            self._matrix = None
+            return
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data["capacity"] != self.capacity:
+                logging.warning("임베딩 캐시 용량이 달라 캐시를 초기화합니다.")
+                self.dim = None
+                self._matrix = None
+                return
+            if self._matrix is None or self.dim != data["dim"]:
+                self.dim = data["dim"]
+                self._matrix = np.memmap(self.matrix_path, dtype=np.float32, mode="r+",
+                                         shape=(self.capacity, self.dim))
+            for video_id, slot, text_hash in data["entries"]:
+                self._index[video_id] = (slot, text_hash)
+            used = {slot for slot, _ in self._index.values()}
+            self._free_slots = [slot for slot in range(self.capacity - 1, -1, -1) if slot not in used]
+        except Exception as e:
+            logging.error(f"임베딩 캐시 로딩 실패, 새로 생성합니다: {str(e)}")
+            self.dim = None
+            self._matrix = None
+            self._index.clear()
+
+    def _create(self, dim):
+        self.dim = dim
+        self._matrix = np.memmap(self.matrix_path, dtype=np.float32, mode="w+",
+                                 shape=(self.capacity, dim))
+        self._index.clear()
+        self._free_slots = list(range(self.capacity - 1, -1, -1))
+
+    def get_many(self, video_ids, texts):
+        """캐시 조회 -> (임베딩 리스트(없으면 None), 미스 위치 리스트)"""
+        results = [None] * len(video_ids)
+        misses = []
+        # 읽는 동안 다른 프로세스가 자리를 재할당하지 못하도록 공유 잠금
+        with self._lock, self._file_lock(exclusive=False):
+            self._sync()
+            for i, (video_id, text) in enumerate(zip(video_ids, texts)):
+                entry = self._index.get(video_id)
+                if entry is None or self._matrix is None:
+                    misses.append(i)
+                    continue
+                slot, text_hash = entry
+                if text_hash != content_hash(text):
+                    # 제목/설명이 바뀐 영상은 다시 인코딩
+                    misses.append(i)
+                    continue
+                self._index.move_to_end(video_id)
+                results[i] = np.array(self._matrix[slot])
+        return results, misses
+
+    def put_many(self, video_ids, texts, embeddings):
+        """임베딩 저장 (LRU 방식으로 자리 확보)"""
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if len(video_ids) == 0:
+            return
+        with self._lock, self._file_lock(exclusive=True):
+            # 다른 프로세스가 할당한 자리를 덮어쓰지 않도록 최신 index를 읽은 뒤 자리 할당
+            self._sync()
+            if self._matrix is None or self.dim != embeddings.shape[1]:
+                self._create(embeddings.shape[1])
+            for video_id, text, embedding in zip(video_ids, texts, embeddings):
+                entry = self._index.pop(video_id, None)
+                if entry is not None:
+                    slot = entry[0]
+                elif self._free_slots:
+                    slot = self._free_slots.pop()
+                else:
+                    _, (slot, _) = self._index.popitem(last=False)
+                self._matrix[slot] = embedding
+                self._index[video_id] = (slot, content_hash(text))
+            self._flush()
+
+    def _flush(self):
+        self._matrix.flush()
+        data = {
+            "capacity": self.capacity,
+            "dim": self.dim,
+            "entries": [[video_id, slot, text_hash] for video_id, (slot, text_hash) in self._index.items()],
+        }
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.index_path)
+        self._index_stamp = self._stamp()
+
+    def __len__(self):
+        return len(self._index)
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_embedding_store():
+    """프로세스 공유 임베딩 캐시 반환"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = EmbeddingStore()
+    return _store
@@ -0,0 +1,37 @@
+import time
+import logging
+import threading
+
+DEFAULT_MODEL_NAME = "all-MiniLM-L6-v2"
+
+# 프로세스 전역 인코더 저장소 (모델 이름 -> SentenceTransformer)
+_encoders = {}
+_lock = threading.Lock()
+
+def get_encoder(model_name=DEFAULT_MODEL_NAME):
+    """공유 SentenceTransformer 반환 (최초 호출 시 한 번만 로딩)"""
+    encoder = _encoders.get(model_name)
+    if encoder is not None:
+        return encoder
+
+    with _lock:
+        # 다른 스레드가 먼저 로딩했을 수 있으므로 다시 확인
+        encoder = _encoders.get(model_name)
+        if encoder is None:
+            from sentence_transformers import SentenceTransformer
+
+            start_time = time.time()
+            encoder = SentenceTransformer(model_name)
+            _encoders[model_name] = encoder
+            logging.info(f"인코더 로딩 완료: {model_name} (소요 시간: {time.time() - start_time:.2f}초)")
+    return encoder
+
+def warm_up(model_names=(DEFAULT_MODEL_NAME,)):
+    """서버 시작 시 인코더를 미리 로딩하고 한 번 인코딩해 둠"""
+    for model_name in model_names:
+        get_encoder(model_name).encode("warm up")
+
+def clear_encoders():
+    """로딩된 인코더 전부 해제"""
+    with _lock:
+        _encoders.clear()
@@ -0,0 +1,25 @@
+import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# 모델 추론 전용 스레드 수와 대기 가능한 최대 요청 수
+INFERENCE_WORKERS = int(os.environ.get("INFERENCE_WORKERS", "2"))
+INFERENCE_QUEUE_SIZE = int(os.environ.get("INFERENCE_QUEUE_SIZE", "32"))
+
+_executor = ThreadPoolExecutor(max_workers=INFERENCE_WORKERS, thread_name_prefix="inference")
+_slots = None
+
+async def run_inference(func, *args, **kwargs):
+    """이벤트 루프를 막지 않도록 모델 연산을 전용 스레드 풀에서 실행
+
+    실행 중 + 대기 중인 작업이 INFERENCE_QUEUE_SIZE를 넘으면 자리가 날 때까지 기다린다.
+    """
+    global _slots
+    if _slots is None:
+        _slots = asyncio.Semaphore(INFERENCE_QUEUE_SIZE)
+    async with _slots:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_executor, lambda: func(*args, **kwargs))
+
+def shutdown_executor():
+    _executor.shutdown(wait=False)
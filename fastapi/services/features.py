@@ -0,0 +1,85 @@
+import numpy as np
+
+# BMI 구간 경계: 1 (저체중) < 18.5 <= 2 (정상) < 25 <= 3 (과체중) < 30 <= 4 (비만)
+BMI_BINS = np.array([18.5, 25, 30])
+
+# 요청 필드 -> 학습 데이터 컬럼명
+FEATURE_FIELDS = {
+    "age": "Age",
+    "gender": "Gender",
+    "height": "Height",
+    "weight": "Weight",
+    "alco": "Alco",
+    "smoke": "Smoke",
+    "sleep_duration": "Sleep Duration",
+    "tired": "Tired",
+    "systolic": "Systolic",
+    "diastolic": "Diastolic",
+    "daily_steps": "Daily Steps",
+    "col": "Col",
+}
+
+# 모델별 입력 컬럼 (학습 시 순서 그대로)
+MODEL_COLUMNS = {
+    "sleep": ['BMI Encoded', 'Age', 'Sleep Duration', 'Systolic', 'Diastolic', 'Daily Steps'],
+    "cardio": ['Systolic', 'Diastolic', 'Age', 'Weight'],
+    "diabetes": ["Gender", "Age", "Hyper", "BMI Encoded", "Smoke", "Col", "Alco"],
+    "liver": ['Age', 'Gender', 'BMI Encoded', 'Alco', 'Smoke', 'Daily Steps', 'Hyper'],
+    "lung": ['Gender', 'Age', 'Smoke', 'Tired', 'Alco'],
+}
+
+def as_array(column, dtype=np.float64):
+    """list / numpy / pandas Series / pyarrow Array·ChunkedArray -> numpy 배열"""
+    if hasattr(column, "to_numpy"):
+        try:
+            # pyarrow는 null이 있으면 복사가 필요하므로 zero_copy_only=False
+            column = column.to_numpy(zero_copy_only=False)
+        except TypeError:
+            column = column.to_numpy()
+    return np.asarray(column, dtype=dtype)
+
+def bmi_category(height, weight):
+    """키(cm)·몸무게(kg) 열 -> BMI 구간 열 (1~4)"""
+    height = as_array(height)
+    bmi = as_array(weight) / (height / 100) ** 2
+    return np.digitize(bmi, BMI_BINS) + 1
+
+def hypertension(systolic, diastolic):
+    """수축기 140 이상 또는 이완기 90 이상이면 1 (고혈압)"""
+    return np.where((as_array(systolic) >= 140) | (as_array(diastolic) >= 90), 1, 0)
+
+def columns_from_records(records):
+    """요청 필드 dict 리스트 -> 학습 컬럼명 기준 열 dict"""
+    return {
+        column: np.fromiter((record[field] for record in records), dtype=np.float64, count=len(records))
+        for field, column in FEATURE_FIELDS.items()
+    }
+
+def columns_from_table(table):
+    """pandas DataFrame / pyarrow Table / 열 dict (요청 필드명 또는 학습 컬럼명) -> 열 dict"""
+    names = list(table.column_names) if hasattr(table, "column_names") else list(table.keys())
+    columns = {}
+    for field, column in FEATURE_FIELDS.items():
+        name = field if field in names else column
+        columns[column] = as_array(table[name])
+    return columns
+
+def add_derived_columns(columns):
+    """'BMI Encoded', 'Hyper' 파생 컬럼 추가"""
+    columns['BMI Encoded'] = bmi_category(columns['Height'], columns['Weight'])
+    columns['Hyper'] = hypertension(columns['Systolic'], columns['Diastolic'])
+    return columns
+
+def model_matrix(columns, model_columns):
+    """모델 입력 컬럼 순서대로 C-연속 float32 행렬 생성"""
+    n_rows = len(next(iter(columns.values())))
+    matrix = np.empty((n_rows, len(model_columns)), dtype=np.float32, order="C")
+    for j, name in enumerate(model_columns):
+        matrix[:, j] = columns[name]
+    return matrix
+
+def build_feature_matrices(columns, model_names=None):
+    """열 dict -> {모델 이름: float32 특성 행렬}"""
+    columns = add_derived_columns(dict(columns))
+    model_names = list(MODEL_COLUMNS) if model_names is None else model_names
+    return {name: model_matrix(columns, MODEL_COLUMNS[name]) for name in model_names}
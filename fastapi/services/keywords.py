@@ -0,0 +1,44 @@
+from itertools import combinations
+
+CATEGORY_KEYWORDS = {
+    "수면장애": ["불규칙적 수면 패턴", "잠 잘 드는 꿀팁"],
+    "심혈관질환": ["가슴통증", "간단한 운동"],
+    "당뇨": ["심한 식곤증", "식단 관리"],
+    "간암": ["임상이 피로", "과도한 음주"],
+    "폐암": ["잦은 기침", "잦은 흡연"]
+} # 하나만
+
+YOUTUBE_SEARCH_KEYWORDS = {
+    "불규칙적 수면 패턴": ["수면장애"],
+    "잠 잘 드는 꿀팁": ["불면증", "예방"],
+    "가슴통증": ["심혈관 질환", "증상"],
+    "간단한 운동": ["노인", "간단한 운동"],
+    "심한 식곤증": ["당뇨", "식곤증"],
+    "식단 관리": ["혈당관리", "식단"],
+    "임상이 피로": ["간암", "피로"],
+    "과도한 음주": ["간", "음주"],
+    "잦은 기침": ["폐암", "기침"],
+    "잦은 흡연": ["폐", "기침"]
+}
+
+def build_search_keywords(categories):
+    """사용자 카테고리 -> YouTube 검색 키워드"""
+    keywords = []
+    for category in categories:
+        if category in CATEGORY_KEYWORDS:
+            keywords.extend(CATEGORY_KEYWORDS[category])
+
+    search_keywords = []
+    for keyword in keywords:
+        if keyword in YOUTUBE_SEARCH_KEYWORDS:
+            search_keywords.extend(YOUTUBE_SEARCH_KEYWORDS[keyword])
+    return search_keywords
+
+def reachable_search_keywords():
+    """가능한 모든 카테고리 조합의 검색 키워드 목록"""
+    results = []
+    categories = list(CATEGORY_KEYWORDS)
+    for size in range(1, len(categories) + 1):
+        for combo in combinations(categories, size):
+            results.append(build_search_keywords(combo))
+    return results
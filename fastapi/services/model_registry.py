@@ -0,0 +1,218 @@
+"""
+버전별 모델 아티팩트 레지스트리
+
+    model_registry/
+        sleep/
+            CURRENT                 # 현재 버전 이름
+            20250115093000/
+                model.joblib        # 압축 없이 저장 (mmap_mode 로딩 가능)
+                manifest.json       # 입력 컬럼 순서, 임계값, 라이브러리 버전, sha256
+
+    python -m services.model_registry import-legacy   # APP.PY-LEGACY 모델 등록
+    python -m services.model_registry list
+"""
+import os
+import sys
+import json
+import time
+import pickle
+import hashlib
+import logging
+import argparse
+import threading
+import warnings
+from datetime import datetime
+from importlib import metadata
+
+import joblib
+
+REGISTRY_DIR = os.environ.get(
+    "MODEL_REGISTRY_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "model_registry"),
+)
+MMAP_MODE = os.environ.get("MODEL_MMAP_MODE", "r") or None
+
+ARTIFACT_FILE = "model.joblib"
+MANIFEST_FILE = "manifest.json"
+CURRENT_FILE = "CURRENT"
+LIBRARIES = ("scikit-learn", "xgboost", "lightgbm", "joblib", "numpy")
+
+def library_versions():
+    versions = {}
+    for library in LIBRARIES:
+        try:
+            versions[library] = metadata.version(library)
+        except metadata.PackageNotFoundError:
+            pass
+    return versions
+
+def file_checksum(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def load_legacy_file(path):
+    """기존 .pkl / .joblib 파일 로딩 (등록용)"""
+    if path.endswith(".pkl"):
+        with open(path, 'rb') as file:
+            return pickle.load(file)
+    return joblib.load(path)
+
+def _write_atomic(path, text):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        file.write(text)
+    os.replace(tmp_path, path)
+
+def register_model(name, model, feature_columns, threshold=0.5, version=None, source=None, registry_dir=REGISTRY_DIR):
+    """모델을 새 버전 디렉터리에 저장하고 CURRENT를 새 버전으로 변경 -> 매니페스트"""
+    version = version or datetime.now().strftime("%Y%m%d%H%M%S")
+    version_dir = os.path.join(registry_dir, name, version)
+    os.makedirs(version_dir)
+    path = os.path.join(version_dir, ARTIFACT_FILE)
+    joblib.dump(model, path)  # 압축하면 mmap_mode 로딩이 안 되므로 압축 없이 저장
+
+    manifest = {
+        "name": name,
+        "version": version,
+        "artifact": ARTIFACT_FILE,
+        "model_type": f"{type(model).__module__}.{type(model).__name__}",
+        "feature_columns": list(feature_columns),
+        "threshold": threshold,
+        "library_versions": library_versions(),
+        "sha256": file_checksum(path),
+        "source": source,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    _write_atomic(os.path.join(version_dir, MANIFEST_FILE), json.dumps(manifest, ensure_ascii=False, indent=2))
+    _write_atomic(os.path.join(registry_dir, name, CURRENT_FILE), version)
+    return manifest
+
+class ModelRegistry:
+    """모델별 지연 로딩 + 핫 리로드 + 로딩 시간 기록"""
+
+    def __init__(self, registry_dir=REGISTRY_DIR, mmap_mode=MMAP_MODE):
+        self.registry_dir = registry_dir
+        self.mmap_mode = mmap_mode
+        self._entries = {}  # name -> (version, model, manifest)
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def names(self):
+        if not os.path.isdir(self.registry_dir):
+            return []
+        return sorted(
+            name for name in os.listdir(self.registry_dir)
+            if os.path.isfile(os.path.join(self.registry_dir, name, CURRENT_FILE))
+        )
+
+    def current_version(self, name):
+        path = os.path.join(self.registry_dir, name, CURRENT_FILE)
+        if not os.path.isfile(path):
+            return None
+        with open(path, encoding="utf-8") as file:
+            return file.read().strip()
+
+    def manifest(self, name, version=None):
+        version = version or self.current_version(name)
+        if version is None:
+            raise FileNotFoundError(f"등록되지 않은 모델: {name}")
+        with open(os.path.join(self.registry_dir, name, version, MANIFEST_FILE), encoding="utf-8") as file:
+            return json.load(file)
+
+    def _load(self, name, version):
+        manifest = self.manifest(name, version)
+        path = os.path.join(self.registry_dir, name, version, manifest["artifact"])
+
+        start_time = time.time()
+        checksum = file_checksum(path)
+        if checksum != manifest["sha256"]:
+            raise ValueError(f"{name} {version} 체크섬 불일치 (manifest {manifest['sha256'][:12]}, 파일 {checksum[:12]})")
+        checksum_seconds = time.time() - start_time
+
+        installed = library_versions()
+        for library, trained in manifest.get("library_versions", {}).items():
+            if installed.get(library) != trained:
+                logging.warning(f"{name} {version}: {library} 버전 불일치 (저장 {trained}, 설치 {installed.get(library)})")
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            model = joblib.load(path, mmap_mode=self.mmap_mode)
+        for warning in caught:
+            logging.warning(f"{name} {version} 로딩 경고: {warning.message}")
+
+        load_seconds = time.time() - start_time
+        self._metrics[name] = {
+            "version": version,
+            "load_seconds": round(load_seconds, 4),
+            "checksum_seconds": round(checksum_seconds, 4),
+            "size_bytes": os.path.getsize(path),
+            "warnings": len(caught),
+            "loaded_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        logging.info(f"{name} 모델 {version} 로딩 완료 (소요 시간: {load_seconds:.2f}초)")
+        return version, model, manifest
+
+    def get(self, name):
+        """현재 버전 모델과 매니페스트 (처음 요청할 때 로딩) -> (model, manifest)"""
+        entry = self._entries.get(name)
+        if entry is None:
+            with self._lock:
+                entry = self._entries.get(name)
+                if entry is None:
+                    version = self.current_version(name)
+                    if version is None:
+                        raise FileNotFoundError(f"등록되지 않은 모델: {name}")
+                    entry = self._entries[name] = self._load(name, version)
+        return entry[1], entry[2]
+
+    def reload(self, names=None):
+        """CURRENT가 바뀐 모델만 새로 로딩 후 교체 -> 교체된 모델 이름 리스트
+
+        새 버전 로딩에 실패하면 기존 모델을 그대로 사용한다.
+        """
+        changed = []
+        for name in names or list(self._entries):
+            version = self.current_version(name)
+            entry = self._entries.get(name)
+            if version is None or (entry is not None and entry[0] == version):
+                continue
+            try:
+                loaded = self._load(name, version)
+            except Exception as e:
+                logging.error(f"{name} 모델 {version} 리로드 실패, 기존 버전 유지: {str(e)}")
+                continue
+            with self._lock:
+                self._entries[name] = loaded
+            changed.append(name)
+        return changed
+
+    def metrics(self):
+        return {name: dict(values) for name, values in self._metrics.items()}
+
+registry = ModelRegistry()
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from services.features import MODEL_COLUMNS
+    from services.risk import MODEL_DIR, MODEL_FILES
+
+    parser = argparse.ArgumentParser(description="모델 레지스트리 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    legacy_parser = subparsers.add_parser("import-legacy", help="APP.PY-LEGACY 모델을 새 버전으로 등록")
+    legacy_parser.add_argument("--model-dir", default=MODEL_DIR)
+    legacy_parser.add_argument("--version", default=None)
+    subparsers.add_parser("list", help="등록된 모델과 현재 버전 출력")
+    args = parser.parse_args()
+
+    if args.command == "import-legacy":
+        for name, filename in MODEL_FILES.items():
+            path = os.path.join(args.model_dir, filename)
+            manifest = register_model(name, load_legacy_file(path), MODEL_COLUMNS[name], version=args.version, source=path)
+            print(f"{name}: {manifest['version']} ({manifest['model_type']}, sha256 {manifest['sha256'][:12]})")
+    else:
+        for name in registry.names():
+            manifest = registry.manifest(name)
+            print(f"{name}: {manifest['version']} ({manifest['model_type']}, 생성 {manifest['created_at']})")
@@ -0,0 +1,47 @@
+from models import User, Detail
+from serializers import row_mapper
+from services.detail_query import latest_detail_ids
+
+user_to_dict = row_mapper(User)
+detail_to_dict = row_mapper(Detail, exclude=("user_id",))
+
+def load_user_with_latest_detail(db, user_id):
+    """사용자와 최신 상세 정보를 한 번의 조인 쿼리로 조회 -> (user, detail)
+
+    상세 이력 전체를 불러오지 않도록 details 관계 대신 최신 행 하나만 조인한다.
+    """
+    row = (
+        db.query(User, Detail)
+        .outerjoin(Detail, Detail.user_id == User.user_id)
+        .filter(User.user_id == user_id)
+        .order_by(Detail.detail_id.desc())
+        .first()
+    )
+    if row is None:
+        return None, None
+    return row
+
+def load_users_with_latest_details(db, user_ids):
+    """여러 사용자를 한 번에 조회 -> {user_id: (user, detail)}"""
+    user_ids = list(set(user_ids))
+    if not user_ids:
+        return {}
+    latest = latest_detail_ids(user_ids)
+    rows = (
+        db.query(User, Detail)
+        .outerjoin(latest, latest.c.user_id == User.user_id)
+        .outerjoin(Detail, Detail.detail_id == latest.c.detail_id)
+        .filter(User.user_id.in_(user_ids))
+        .all()
+    )
+    return {user.user_id: (user, detail) for user, detail in rows}
+
+def load_profile(db, user_id):
+    """프로필 응답 dict (사용자가 없으면 None)"""
+    user, detail = load_user_with_latest_detail(db, user_id)
+    if user is None:
+        return None
+    return {
+        "user": user_to_dict(user),
+        "detail": detail_to_dict(detail) if detail else None,
+    }
@@ -0,0 +1,93 @@
+import threading
+from abc import ABC, abstractmethod
+from services.response_cache import TTLCache
+
+PROFILE_CACHE_TTL = 300  # 초
+PROFILE_CACHE_SIZE = 10000
+
+class CacheBackend(ABC):
+    """프로필 캐시 저장소 인터페이스 (테스트용 가짜 저장소: scripts/check_profile_cache.py)"""
+
+    @abstractmethod
+    def get(self, key):
+        """없으면 None"""
+
+    @abstractmethod
+    def set(self, key, value):
+        pass
+
+    @abstractmethod
+    def delete(self, key):
+        pass
+
+class MemoryBackend(CacheBackend):
+    """프로세스 내 LRU + TTL 저장소"""
+
+    def __init__(self, maxsize=PROFILE_CACHE_SIZE, ttl=PROFILE_CACHE_TTL):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, key):
+        return self._cache.get(key)
+
+    def set(self, key, value):
+        self._cache.set(key, value)
+
+    def delete(self, key):
+        self._cache.delete(key)
+
+class ProfileCache:
+    """사용자/상세 정보 응답 read-through 캐시"""
+
+    def __init__(self, backend=None):
+        self.backend = backend or MemoryBackend()
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0, "stale_skips": 0}
+        self._generations = {}  # key -> 무효화 횟수
+        self._lock = threading.Lock()
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def get_or_load(self, kind, user_id, loader):
+        """캐시에 없으면 loader() 결과 저장 (None은 저장하지 않음)"""
+        key = f"{kind}:{user_id}"
+        value = self.backend.get(key)
+        if value is not None:
+            self._count("hits")
+            return value
+        self._count("misses")
+        generation = self._generations.get(key, 0)
+        value = loader()
+        if value is not None:
+            with self._lock:
+                # 읽는 동안 수정/삭제로 무효화됐으면 이전 값을 저장하지 않음
+                if self._generations.get(key, 0) != generation:
+                    self.stats["stale_skips"] += 1
+                else:
+                    self.backend.set(key, value)
+        return value
+
+    def invalidate(self, kind, user_id):
+        key = f"{kind}:{user_id}"
+        with self._lock:
+            self.stats["invalidations"] += 1
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self.backend.delete(key)
+
+    def invalidate_user(self, user_id):
+        """사용자와 관련된 모든 캐시 항목 삭제"""
+        for kind in ("user", "detail", "profile"):
+            self.invalidate(kind, user_id)
+
+    def hit_ratio(self):
+        total = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / total if total else 0.0
+
+    def report(self):
+        return {**self.stats, "hit_ratio": round(self.hit_ratio(), 4)}
+
+profile_cache = ProfileCache()
+
+def set_backend(backend):
+    """캐시 저장소 교체"""
+    profile_cache.backend = backend
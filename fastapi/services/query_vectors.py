@@ -0,0 +1,54 @@
+import logging
+import threading
+from services.encoder import get_encoder
+from services.keywords import reachable_search_keywords
+
+# 검색 키워드 문자열 -> 쿼리 임베딩 / TF-IDF 벡터
+_query_embeddings = {}
+_query_tfidf = {}
+_query_tfidf_version = None
+_lock = threading.Lock()
+
+def query_text(user_keywords):
+    return " ".join(user_keywords)
+
+def precompute_query_embeddings(model=None):
+    """모든 카테고리 조합의 쿼리 임베딩을 한 번에 계산해 둠"""
+    model = model or get_encoder()
+    texts = sorted({query_text(keywords) for keywords in reachable_search_keywords()})
+    embeddings = model.encode(texts)
+    with _lock:
+        _query_embeddings.update(zip(texts, embeddings))
+    logging.info(f"쿼리 임베딩 사전 계산 완료: {len(texts)}개")
+
+def get_query_embedding(user_keywords, model=None):
+    """쿼리 임베딩 조회 (표에 없는 조합만 인코딩)"""
+    text = query_text(user_keywords)
+    embedding = _query_embeddings.get(text)
+    if embedding is None:
+        embedding = (model or get_encoder()).encode(text)
+        with _lock:
+            _query_embeddings[text] = embedding
+    return embedding
+
+def precompute_query_tfidf(model):
+    """모든 카테고리 조합의 쿼리 TF-IDF 벡터 계산 (모델이 갱신되면 다시 계산)"""
+    global _query_tfidf_version
+    texts = sorted({query_text(keywords) for keywords in reachable_search_keywords()})
+    matrix = model.transform(texts)
+    with _lock:
+        _query_tfidf.clear()
+        _query_tfidf.update((text, matrix[i]) for i, text in enumerate(texts))
+        _query_tfidf_version = model.version
+
+def get_query_tfidf(user_keywords, model):
+    """쿼리 TF-IDF 벡터 조회"""
+    if _query_tfidf_version != model.version:
+        precompute_query_tfidf(model)
+    text = query_text(user_keywords)
+    vector = _query_tfidf.get(text)
+    if vector is None:
+        vector = model.transform([text])
+        with _lock:
+            _query_tfidf[text] = vector
+    return vector
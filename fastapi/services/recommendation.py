@@ -1,47 +1,43 @@
-from services.youtube import search_youtube_videos, get_video_details
+from services.youtube import search_youtube_videos, get_videos
 from services.similarity import calculate_similarity_tfidf, calculate_similarity_nlp
+from services.keywords import CATEGORY_KEYWORDS, YOUTUBE_SEARCH_KEYWORDS, build_search_keywords
+from services.query_vectors import get_query_embedding
+from services.catalog import get_catalog, video_text
+from services.tfidf_model import get_tfidf_model
+from services.executor import run_inference
 
-CATEGORY_KEYWORDS = {
-    "수면장애": ["불규칙적 수면 패턴", "잠 잘 드는 꿀팁"],
-    "심혈관질환": ["가슴통증", "간단한 운동"],
-    "당뇨": ["심한 식곤증", "식단 관리"],
-    "간암": ["임상이 피로", "과도한 음주"],
-    "폐암": ["잦은 기침", "잦은 흡연"]
-} # 하나만
+MAX_RESULTS = 10
 
-YOUTUBE_SEARCH_KEYWORDS = {
-    "불규칙적 수면 패턴": ["수면장애"],
-    "잠 잘 드는 꿀팁": ["불면증", "예방"],
-    "가슴통증": ["심혈관 질환", "증상"],
-    "간단한 운동": ["노인", "간단한 운동"],
-    "심한 식곤증": ["당뇨", "식곤증"],
-    "식단 관리": ["혈당관리", "식단"],
-    "임상이 피로": ["간암", "피로"],
-    "과도한 음주": ["간", "음주"],
-    "잦은 기침": ["폐암", "기침"],
-    "잦은 흡연": ["폐", "기침"]
-}
+def score_catalog(catalog, search_keywords):
+    """로컬 카탈로그에서 최근접 영상 검색 후 점수 계산"""
+    rows, nlp_scores = catalog.nearest(get_query_embedding(search_keywords), k=MAX_RESULTS)
+    video_details = [catalog.videos[i] for i in rows]
+    texts = [video_text(video) for video in video_details]
+    tfidf_model = get_tfidf_model()
+    doc_matrix = catalog.tfidf_rows(tfidf_model, rows) if tfidf_model is not None else None
+    tfidf_scores = calculate_similarity_tfidf(texts, search_keywords, doc_matrix)
+    return video_details, tfidf_scores, nlp_scores
 
-def recommend_videos(categories):
-    # 사용자 카테고리에 따라 키워드 생성
-    keywords = []
-    for category in categories:
-        if category in CATEGORY_KEYWORDS:
-            keywords.extend(CATEGORY_KEYWORDS[category])
-
-    search_keywords = []
-    for keyword in keywords:
-        if keyword in YOUTUBE_SEARCH_KEYWORDS:
-            search_keywords.extend(YOUTUBE_SEARCH_KEYWORDS[keyword])
+def score_videos(video_details, search_keywords):
+    """YouTube 검색 결과 점수 계산"""
+    texts = [video_text(video) for video in video_details]
+    tfidf_scores = calculate_similarity_tfidf(texts, search_keywords)
+    nlp_scores = calculate_similarity_nlp(texts, search_keywords, [video["id"] for video in video_details])
+    return tfidf_scores, nlp_scores
 
-    # YouTube 검색 및 유사도 계산
-    search_results = search_youtube_videos(search_keywords)
-    video_ids = [item["id"]["videoId"] for item in search_results]
-    video_details = get_video_details(video_ids)
+async def recommend_videos(categories):
+    # 사용자 카테고리에 따라 키워드 생성
+    search_keywords = build_search_keywords(categories)
 
-    texts = [video["snippet"]["title"] + " " + video["snippet"]["description"] for video in video_details]
-    tfidf_scores = calculate_similarity_tfidf(texts, search_keywords)
-    nlp_scores = calculate_similarity_nlp(texts, search_keywords)
+    catalog = get_catalog()
+    if catalog is not None and len(catalog):
+        video_details, tfidf_scores, nlp_scores = await run_inference(score_catalog, catalog, search_keywords)
+    else:
+        # 카탈로그가 없으면 YouTube 검색 및 유사도 계산
+        search_results = await search_youtube_videos(search_keywords)
+        video_ids = [item["id"]["videoId"] for item in search_results]
+        video_details = await get_videos(video_ids)
+        tfidf_scores, nlp_scores = await run_inference(score_videos, video_details, search_keywords)
 
     # 점수 계산 및 정렬
     recommendations = []
@@ -49,6 +45,6 @@ def recommend_videos(categories):
         recommendations.append({
             "title": video["snippet"]["title"],
             "link": f"https://www.youtube.com/watch?v={video['id']}",
-            "score": 0.5 * tfidf_scores[i] + 0.5 * nlp_scores[i]
+            "score": 0.5 * tfidf_scores[i] + 0.5 * float(nlp_scores[i])
         })
     return sorted(recommendations, key=lambda x: x["score"], reverse=True)
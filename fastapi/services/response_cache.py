@@ -0,0 +1,234 @@
+import os
+import json
+import time
+import asyncio
+import sqlite3
+import threading
+from collections import OrderedDict
+
+class TTLCache:
+    """만료 시간이 있는 메모리 LRU 캐시"""
+
+    def __init__(self, maxsize=1024, ttl=3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (만료 시각, 값)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        with self._lock:
+            self._data[key] = (time.time() + (ttl or self.ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+class SQLiteCache:
+    """프로세스 재시작 후에도 남는 SQLite 디스크 캐시 (값은 JSON)"""
+
+    def __init__(self, path, namespace, ttl=3600):
+        self.path = path
+        self.namespace = namespace
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "namespace TEXT, key TEXT, value TEXT, expires REAL, PRIMARY KEY (namespace, key))"
+        )
+        self._conn.commit()
+
+    def get(self, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires FROM cache WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return json.loads(row[0])
+
+    def set(self, key, value, ttl=None):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, value, expires) VALUES (?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value, ensure_ascii=False), time.time() + (ttl or self.ttl)),
+            )
+            self._conn.commit()
+
+    def delete(self, key):
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE namespace = ? AND key = ?", (self.namespace, key))
+            self._conn.commit()
+
+class ResponseCache:
+    """메모리 LRU + 선택적 SQLite 2단 캐시
+
+    같은 키에 대한 동시 미스는 하나의 fetch만 실행하고 결과를 나눠 받는다.
+    """
+
+    def __init__(self, namespace, ttl=3600, maxsize=1024, db_path=None):
+        self.namespace = namespace
+        self.memory = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.disk = SQLiteCache(db_path, namespace, ttl) if db_path else None
+        self._pending = {}
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "coalesced": 0}
+
+    async def get(self, key):
+        value = self.memory.get(key)
+        if value is not None:
+            self.stats["memory_hits"] += 1
+            return value
+        if self.disk is not None:
+            value = await asyncio.to_thread(self.disk.get, key)
+            if value is not None:
+                self.stats["disk_hits"] += 1
+                self.memory.set(key, value)
+                return value
+        return None
+
+    async def set(self, key, value):
+        self.memory.set(key, value)
+        if self.disk is not None:
+            await asyncio.to_thread(self.disk.set, key, value)
+
+    async def _wait_pending(self, pending):
+        """다른 요청이 진행 중인 fetch 결과 대기 -> (성공 여부, 값)
+
+        shield로 감싸 기다리는 쪽이 취소돼도 공유 future는 취소되지 않게 하고,
+        fetch하던 요청이 취소됐다면 (False, None)을 반환해 직접 조회하게 한다.
+        """
+        self.stats["coalesced"] += 1
+        try:
+            return True, await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise
+            self.stats["coalesced"] -= 1
+            return False, None
+
+    def _start_pending(self, key):
+        self.stats["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        return future
+
+    def _finish_pending(self, key, future):
+        # fetch 도중 취소(CancelledError 등)되면 기다리는 요청이 영원히 멈추지 않도록 future도 취소
+        if not future.done():
+            future.cancel()
+        if self._pending.get(key) is future:
+            del self._pending[key]
+
+    async def get_or_fetch(self, key, fetch):
+        """캐시 조회 후 없으면 fetch() 결과 저장 (None은 저장하지 않음)"""
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        while True:
+            pending = self._pending.get(key)
+            if pending is None:
+                break
+            ok, value = await self._wait_pending(pending)
+            if ok:
+                return value
+
+        future = self._start_pending(key)
+        try:
+            value = await fetch()
+            if value is not None:
+                await self.set(key, value)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 요청이 없으면 예외가 회수되지 않았다는 경고가 뜨므로 미리 회수
+            future.exception()
+            raise
+        finally:
+            self._finish_pending(key, future)
+
+    async def get_many_or_fetch(self, keys, fetch_many, key_of):
+        """여러 키를 한 번에 조회 -> {키: 값}
+
+        캐시에 없고 다른 요청이 조회 중이지도 않은 키만 모아 fetch_many(키 목록)를 한 번 호출한다.
+        fetch_many는 값 리스트를 반환하고, key_of(값)으로 각 값의 키를 구한다.
+        """
+        found = {}
+        for key in dict.fromkeys(keys):
+            value = await self.get(key)
+            if value is not None:
+                found[key] = value
+
+        # 캐시 조회 중 await 사이에 다른 요청이 조회를 시작했을 수 있으므로 여기서 한 번에 나눔
+        waiting, missing = [], []
+        for key in dict.fromkeys(keys):
+            if key not in found:
+                (waiting if key in self._pending else missing).append(key)
+        if missing:
+            futures = {key: self._start_pending(key) for key in missing}
+            try:
+                for value in await fetch_many(missing):
+                    key = key_of(value)
+                    if key in futures and not futures[key].done():
+                        await self.set(key, value)
+                        futures[key].set_result(value)
+                        found[key] = value
+                for future in futures.values():
+                    if not future.done():
+                        future.set_result(None)
+            except Exception as e:
+                for future in futures.values():
+                    if not future.done():
+                        future.set_exception(e)
+                        future.exception()
+                raise
+            finally:
+                for key, future in futures.items():
+                    self._finish_pending(key, future)
+
+        for key in waiting:
+            value = await self.get_or_fetch(key, lambda key=key: self._fetch_one(fetch_many, key_of, key))
+            if value is not None:
+                found[key] = value
+        return found
+
+    @staticmethod
+    async def _fetch_one(fetch_many, key_of, key):
+        for value in await fetch_many([key]):
+            if key_of(value) == key:
+                return value
+        return None
+
+    def hit_ratio(self):
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"] + self.stats["coalesced"]
+        total = hits + self.stats["misses"]
+        return hits / total if total else 0.0
+
+    def report(self):
+        return {**self.stats, "size": len(self.memory), "hit_ratio": round(self.hit_ratio(), 4)}
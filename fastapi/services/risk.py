@@ -0,0 +1,215 @@
+import os
+import time
+import logging
+import threading
+
+import numpy as np
+import pandas as pd
+
+from services.features import MODEL_COLUMNS, columns_from_records, build_feature_matrices
+from services.compiled_trees import compile_model, verification_rows, verify_compiled, is_exact
+from services.model_registry import registry, load_legacy_file
+
+# 학습된 모델 위치 (APP.PY-LEGACY)
+MODEL_DIR = os.environ.get(
+    "RISK_MODEL_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "APP.PY-LEGACY"),
+)
+
+MODEL_FILES = {
+    "sleep": "Sleep_model.pkl",
+    "cardio": "Cardio_model.pkl",
+    "diabetes": "diabetes_model.joblib",
+    "liver": "liver_model.joblib",
+    "lung": "lung_model.joblib",
+}
+
+# NumPy 노드 배열로 변환해 예측하는 트리 앙상블 모델
+# (python -m services.compiled_trees --verify로 원래 모델과 결과가 같은지 확인한 뒤 RISK_COMPILED_TREES=1로 켬)
+COMPILED_MODELS = ("sleep", "cardio", "liver")
+USE_COMPILED = os.environ.get("RISK_COMPILED_TREES", "0") == "1"
+
+# 위험군 -> 추천 카테고리 (services.keywords.CATEGORY_KEYWORDS 키와 동일)
+RISK_CATEGORIES = {
+    "sleep": "수면장애",
+    "cardio": "심혈관질환",
+    "diabetes": "당뇨",
+    "liver": "간암",
+    "lung": "폐암",
+}
+
+_models = {}
+_compiled = {}
+_versions = {}
+_thresholds = {}  # 레지스트리 manifest의 양성 판정 확률 기준 (레거시 파일 모델은 없음 -> model.predict 사용)
+_failed = {}  # 로딩에 실패한 모델 -> 오류 메시지 (요청마다 다시 시도하지 않음)
+_lock = threading.Lock()
+
+def _load_model(name, model_dir):
+    """레지스트리에 등록된 모델을 우선 사용하고, 없으면 레거시 파일 로딩 -> (모델, 버전, 판정 기준)"""
+    if registry.current_version(name) is not None:
+        model, manifest = registry.get(name)
+        if manifest["feature_columns"] != MODEL_COLUMNS[name]:
+            raise ValueError(f"입력 컬럼 불일치: manifest {manifest['feature_columns']}, 서비스 {MODEL_COLUMNS[name]}")
+        return model, manifest["version"], manifest.get("threshold")
+    path = os.path.join(model_dir, MODEL_FILES[name])
+    logging.warning(f"{name} 모델이 레지스트리에 없어 레거시 파일 사용 ({path})")
+    return load_legacy_file(path), "legacy", None
+
+def load_risk_models(model_dir=MODEL_DIR, retry_failed=False):
+    """다섯 개 위험도 모델을 한 번만 로딩
+
+    실패한 모델은 로그와 함께 기록해 두고, 시작 시 또는 reload_risk_models에서만 다시 시도한다.
+    """
+    with _lock:
+        for name in MODEL_FILES:
+            if name in _models or (name in _failed and not retry_failed):
+                continue
+            start_time = time.time()
+            try:
+                model, version, threshold = _load_model(name, model_dir)
+            except Exception as e:
+                logging.error(f"{name} 모델 로딩 실패: {str(e)}")
+                _failed[name] = str(e)
+                continue
+            _failed.pop(name, None)
+            _install(name, model, version, threshold)
+            logging.info(f"{name} 모델 {version} 준비 완료 (소요 시간: {time.time() - start_time:.2f}초)")
+    return _models
+
+def reload_risk_models():
+    """레지스트리에서 CURRENT가 바뀐 모델만 교체하고 로딩에 실패했던 모델은 다시 시도 -> 교체된 모델 이름 리스트"""
+    changed = []
+    if _failed:
+        retried = list(_failed)
+        load_risk_models(retry_failed=True)
+        changed.extend(name for name in retried if name in _models)
+    for name in registry.reload([name for name in MODEL_FILES if registry.current_version(name) is not None]):
+        if name in changed:
+            continue
+        model, manifest = registry.get(name)
+        if manifest["feature_columns"] != MODEL_COLUMNS[name]:
+            logging.error(f"{name} 모델 {manifest['version']} 입력 컬럼 불일치, 기존 모델 유지")
+            continue
+        with _lock:
+            _install(name, model, manifest["version"], manifest.get("threshold"))
+        changed.append(name)
+    return changed
+
+def _install(name, model, version, threshold=None):
+    compiled = _compile(name, model) if USE_COMPILED and name in COMPILED_MODELS else None
+    # 예측 중인 요청이 중간 상태를 보지 않도록 새 dict로 교체
+    global _models, _compiled
+    _models = {**_models, name: model}
+    _compiled = {key: value for key, value in _compiled.items() if key != name}
+    if compiled is not None:
+        _compiled[name] = compiled
+    _versions[name] = version
+    _thresholds[name] = threshold
+
+def _compile(name, model):
+    try:
+        compiled = compile_model(model)
+    except Exception as e:
+        logging.warning(f"{name} 모델 트리 변환 실패, 기존 predict 사용: {str(e)}")
+        return None
+    if compiled is None:
+        return None
+    # 무작위 행과 분기 경계 행으로 원래 모델과 결과가 완전히 같은지 확인한 뒤에만 사용
+    try:
+        X = verification_rows(name, compiled, len(MODEL_COLUMNS[name]))
+        result = verify_compiled(model, compiled, X, MODEL_COLUMNS[name])
+    except Exception as e:
+        logging.warning(f"{name} 모델 트리 변환 검증 실패, 기존 predict 사용: {str(e)}")
+        return None
+    if not is_exact(result):
+        logging.warning(f"{name} 모델 트리 변환 결과 불일치 {result}, 기존 predict 사용")
+        return None
+    logging.info(f"{name} 모델 트리 변환 완료 (트리 {len(compiled.roots)}개, 노드 {len(compiled.feature)}개, 검증 {result['rows']}행)")
+    return compiled
+
+def get_risk_models():
+    # 시작 시 로딩 전이면 한 번만 로딩 (실패한 모델은 reload_risk_models에서만 재시도)
+    if len(_models) + len(_failed) < len(MODEL_FILES):
+        load_risk_models()
+    return _models
+
+def model_status():
+    """모델별 버전, 트리 변환 여부, 레지스트리 로딩 지표"""
+    metrics = registry.metrics()
+    return {
+        name: {
+            "version": _versions.get(name),
+            "loaded": name in _models,
+            "compiled": name in _compiled,
+            "threshold": _thresholds.get(name),
+            "error": _failed.get(name),
+            **metrics.get(name, {}),
+        }
+        for name in MODEL_FILES
+    }
+
+def features_from_profile(user, detail):
+    """USER/DETAIL 행 -> 요청 필드 dict"""
+    return {
+        "age": user.age,
+        "gender": int(bool(user.gender)),
+        "height": user.height,
+        "weight": user.weight,
+        "alco": int(bool(user.drinking_status)),
+        "smoke": int(bool(user.smoking_status)),
+        "sleep_duration": detail.daily_sleep,
+        "tired": int(bool(user.fatigue_status)),
+        "systolic": detail.systolic_bp,
+        "diastolic": detail.diastolic_bp,
+        "daily_steps": detail.daily_steps,
+        "col": int(bool(detail.cholesterol_status)),
+    }
+
+def missing_features(features):
+    """값이 비어 있는(NULL) 필드 이름 리스트"""
+    return [key for key, value in features.items() if value is None]
+
+def score_records(records):
+    """여러 사용자를 모델별로 한 번씩 예측 -> 사용자별 결과 리스트"""
+    if not records:
+        return []
+    models = get_risk_models()
+    compiled_models = _compiled
+    thresholds = dict(_thresholds)
+    matrices = build_feature_matrices(columns_from_records(records), [name for name in MODEL_COLUMNS if name in models])
+
+    predictions = {}
+    probabilities = {}
+    for name, matrix in matrices.items():
+        compiled = compiled_models.get(name)
+        if compiled is not None:
+            if len(records) == 1:
+                proba = np.array([compiled.predict_proba_one(matrix[0])])
+            else:
+                proba = compiled.predict_proba(matrix)
+            predictions[name] = np.asarray(compiled.predict_from_proba(proba)).astype(int)
+            probabilities[name] = proba[:, 1]
+            continue
+        model = models[name]
+        # 학습 시 컬럼명 검증을 통과하도록 행렬을 복사 없이 DataFrame으로 감쌈
+        features = pd.DataFrame(matrix, columns=MODEL_COLUMNS[name], copy=False)
+        predictions[name] = np.asarray(model.predict(features)).astype(int)
+        if hasattr(model, "predict_proba"):
+            probabilities[name] = model.predict_proba(features)[:, 1]
+
+    # manifest에 판정 기준이 있으면 predict 대신 양성 확률 > 기준으로 위험군 판정
+    for name, proba in probabilities.items():
+        threshold = thresholds.get(name)
+        if threshold is not None:
+            predictions[name] = (proba > threshold).astype(int)
+
+    results = []
+    for i in range(len(records)):
+        risks = {name: int(values[i]) for name, values in predictions.items()}
+        results.append({
+            "risks": risks,
+            "probabilities": {name: round(float(values[i]), 4) for name, values in probabilities.items()},
+            "categories": [RISK_CATEGORIES[name] for name, value in risks.items() if value == 1],
+        })
+    return results
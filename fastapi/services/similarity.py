@@ -1,16 +1,41 @@
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
-from sentence_transformers import SentenceTransformer
+from services.encoder import get_encoder
+from services.embedding_store import get_embedding_store
+from services.query_vectors import get_query_embedding, get_query_tfidf
+from services.tfidf_model import get_tfidf_model
 
-# TF-IDF 유사도 계산
-def calculate_similarity_tfidf(texts, user_keywords):
-    vectorizer = TfidfVectorizer()
-    tfidf_matrix = vectorizer.fit_transform(texts + [" ".join(user_keywords)])
-    return cosine_similarity(tfidf_matrix[-1], tfidf_matrix[:-1])[0]
+# TF-IDF 유사도 계산 (카탈로그로 학습된 모델이 있으면 행렬-벡터 곱만 수행)
+def calculate_similarity_tfidf(texts, user_keywords, doc_matrix=None):
+    model = get_tfidf_model()
+    if model is None:
+        vectorizer = TfidfVectorizer()
+        tfidf_matrix = vectorizer.fit_transform(texts + [" ".join(user_keywords)])
+        return cosine_similarity(tfidf_matrix[-1], tfidf_matrix[:-1])[0]
+
+    if doc_matrix is None:
+        doc_matrix = model.transform(texts)
+    query_vector = get_query_tfidf(user_keywords, model)
+    return (doc_matrix @ query_vector.T).toarray().ravel()
+
+# 영상 임베딩 조회 (캐시 미스만 한 번에 인코딩)
+def encode_videos(model, texts, video_ids=None):
+    if video_ids is None:
+        return model.encode(texts)
+
+    store = get_embedding_store()
+    embeddings, misses = store.get_many(video_ids, texts)
+    if misses:
+        miss_texts = [texts[i] for i in misses]
+        miss_embeddings = model.encode(miss_texts)
+        store.put_many([video_ids[i] for i in misses], miss_texts, miss_embeddings)
+        for i, embedding in zip(misses, miss_embeddings):
+            embeddings[i] = embedding
+    return embeddings
 
 # NLP 기반 유사도 계산
-def calculate_similarity_nlp(texts, user_keywords):
-    model = SentenceTransformer('all-MiniLM-L6-v2')
-    user_embedding = model.encode(" ".join(user_keywords))
-    video_embeddings = model.encode(texts)
+def calculate_similarity_nlp(texts, user_keywords, video_ids=None):
+    model = get_encoder()
+    user_embedding = get_query_embedding(user_keywords, model)
+    video_embeddings = encode_videos(model, texts, video_ids)
     return cosine_similarity([user_embedding], video_embeddings)[0]
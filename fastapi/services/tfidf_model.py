@@ -0,0 +1,148 @@
+import os
+import json
+import time
+import logging
+import itertools
+import threading
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+DEFAULT_TFIDF_PATH = os.environ.get(
+    "TFIDF_MODEL_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "cache", "tfidf", "tfidf.json"),
+)
+
+# 모델 버전 (다시 읽은 모델도 이전 모델과 겹치지 않도록 프로세스 전체에서 증가)
+_versions = itertools.count(1)
+
+class CorpusTfidf:
+    """카탈로그 전체로 한 번만 학습하는 TF-IDF
+
+    TfidfVectorizer 기본 설정(smooth_idf, sublinear_tf 없음, l2 정규화)과 같은 값을 내며,
+    문서 빈도(df)를 저장해 두어 새 영상이 들어오면 어휘와 idf만 갱신한다.
+    """
+
+    def __init__(self, vocabulary=None, df=None, n_docs=0, doc_ids=None):
+        self.analyzer = TfidfVectorizer().build_analyzer()
+        self.vocabulary = vocabulary or {}
+        self.df = np.asarray(df if df is not None else [], dtype=np.float64)
+        self.n_docs = n_docs
+        self.doc_ids = set(doc_ids or [])
+        self._lock = threading.Lock()
+        self._update_idf()
+
+    def _update_idf(self):
+        self.idf = np.log((1 + self.n_docs) / (1 + self.df)) + 1
+        self.version = next(_versions)
+
+    def partial_fit(self, texts, doc_ids):
+        """처음 보는 문서만 df에 반영하고 어휘 확장"""
+        added = 0
+        with self._lock:
+            df = list(self.df)
+            for doc_id, text in zip(doc_ids, texts):
+                if doc_id in self.doc_ids:
+                    continue
+                self.doc_ids.add(doc_id)
+                added += 1
+                for term in set(self.analyzer(text)):
+                    index = self.vocabulary.get(term)
+                    if index is None:
+                        index = len(df)
+                        self.vocabulary[term] = index
+                        df.append(0)
+                    df[index] += 1
+            if added:
+                self.df = np.asarray(df, dtype=np.float64)
+                self.n_docs += added
+                self._update_idf()
+        return added
+
+    def transform(self, texts):
+        """텍스트 -> l2 정규화된 TF-IDF 희소 행렬 (어휘 밖 단어는 무시)"""
+        rows, cols, values = [], [], []
+        for row, text in enumerate(texts):
+            counts = {}
+            for term in self.analyzer(text):
+                index = self.vocabulary.get(term)
+                if index is not None:
+                    counts[index] = counts.get(index, 0) + 1
+            rows.extend([row] * len(counts))
+            cols.extend(counts.keys())
+            values.extend(counts.values())
+        matrix = sparse.csr_matrix(
+            (np.asarray(values, dtype=np.float64), (rows, cols)),
+            shape=(len(texts), len(self.vocabulary)),
+        )
+        matrix = matrix.multiply(self.idf).tocsr()
+        norms = np.sqrt(matrix.multiply(matrix).sum(axis=1)).A.ravel()
+        norms[norms == 0] = 1.0
+        return sparse.diags(1 / norms) @ matrix
+
+    def save(self, path=DEFAULT_TFIDF_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = {
+            "vocabulary": self.vocabulary,
+            "df": self.df.tolist(),
+            "n_docs": self.n_docs,
+            "doc_ids": sorted(self.doc_ids),
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path=DEFAULT_TFIDF_PATH):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["vocabulary"], data["df"], data["n_docs"], data["doc_ids"])
+
+RELOAD_CHECK_SECONDS = 5  # 저장된 모델 파일이 바뀌었는지 확인하는 주기
+
+_model = None
+_model_mtime = None
+_checked_at = 0.0
+_model_lock = threading.Lock()
+
+def _model_file_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+def get_tfidf_model(path=DEFAULT_TFIDF_PATH):
+    """저장된 TF-IDF 모델 반환 (학습 전이면 None)
+
+    다른 프로세스(카탈로그 수집)가 모델을 다시 저장하면 파일 수정 시각으로 감지해 다시 읽는다.
+    """
+    global _model, _model_mtime, _checked_at
+    now = time.monotonic()
+    if now - _checked_at < RELOAD_CHECK_SECONDS:
+        return _model
+
+    with _model_lock:
+        _checked_at = now
+        mtime = _model_file_mtime(path)
+        if mtime is not None and mtime != _model_mtime:
+            try:
+                _model = CorpusTfidf.load(path)
+                _model_mtime = mtime
+            except Exception as e:
+                logging.error(f"TF-IDF 모델 로딩 실패: {str(e)}")
+    return _model
+
+def update_tfidf_model(texts, doc_ids, path=DEFAULT_TFIDF_PATH):
+    """새 문서로 TF-IDF 갱신 후 저장"""
+    global _model, _model_mtime
+    model = get_tfidf_model(path)
+    if model is None:
+        model = CorpusTfidf()
+    if model.partial_fit(texts, doc_ids):
+        model.save(path)
+    with _model_lock:
+        _model = model
+        _model_mtime = _model_file_mtime(path)
+    return model
@@ -1,6 +1,49 @@
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 
 class UserRequest(BaseModel):
     categories: List[str]
     userInfo: dict
+
+# 대량 등록 요청의 한 행 (폼 API와 같은 필드)
+class UserCreate(BaseModel):
+    name: str
+    age: int
+    gender: bool
+    weight: float
+    height: float
+    bmi: float
+    drinking_status: bool
+    smoking_status: bool
+    obesity_status: bool
+    fatigue_status: bool
+
+class DetailCreate(BaseModel):
+    user_id: int
+    systolic_bp: int
+    diastolic_bp: int
+    heart_rate: int
+    daily_steps: int
+    cholesterol_status: bool
+    daily_sleep: float
+    hypertension_status: bool
+
+# 위험도 예측 입력 (APP.PY-LEGACY 모델 학습 컬럼과 대응)
+class RiskFeatures(BaseModel):
+    age: int
+    gender: int
+    height: float
+    weight: float
+    alco: int
+    smoke: int
+    sleep_duration: float
+    tired: int
+    systolic: int
+    diastolic: int
+    daily_steps: int
+    col: int
+
+# user_id를 주면 DB의 사용자/최신 상세 정보로, features를 주면 그대로 예측
+class RiskRequest(BaseModel):
+    user_id: Optional[int] = None
+    features: Optional[RiskFeatures] = None
@@ -1,18 +1,27 @@
-import requests
+import os
 import isodate
+from services.youtube_client import get_client
+from services.response_cache import ResponseCache
 
-API_KEY = "YOUR_API_KEY"
+# YOUTUBE_CACHE_DB를 지정하면 메모리 캐시 뒤에 SQLite 캐시를 둠
+CACHE_DB_PATH = os.environ.get("YOUTUBE_CACHE_DB")
+search_cache = ResponseCache("search", ttl=60 * 60, maxsize=256, db_path=CACHE_DB_PATH)
+video_cache = ResponseCache("videos", ttl=6 * 60 * 60, maxsize=4096, db_path=CACHE_DB_PATH)
 
-def search_youtube_videos(keywords):
-    query = "+".join(keywords)
-    url = f"https://www.googleapis.com/youtube/v3/search?part=snippet&q={query}&type=video&maxResults=10&key={API_KEY}"
-    response = requests.get(url).json()
-    return response.get("items", [])
+async def search_youtube_videos(keywords):
+    return await search_cache.get_or_fetch(" ".join(keywords), lambda: get_client().search(keywords))
 
-def get_video_details(video_id):
-    url = f"https://www.googleapis.com/youtube/v3/videos?part=snippet,contentDetails,statistics&id={video_id}&key={API_KEY}"
-    response = requests.get(url).json()
-    video = response.get("items", [])[0]
+async def get_videos(video_ids):
+    """영상 상세 정보 (캐시에 없는 ID만 한 번에 조회, 다른 요청이 조회 중인 ID는 그 결과를 기다림)"""
+    found = await video_cache.get_many_or_fetch(video_ids, get_client().videos, lambda item: item["id"])
+    return [found[video_id] for video_id in video_ids if video_id in found]
+
+async def fetch_video(video_id):
+    items = await get_client().videos([video_id])
+    return items[0] if items else None
+
+async def get_video_details(video_id):
+    video = await video_cache.get_or_fetch(video_id, lambda: fetch_video(video_id))
     if not video:
         return None
     duration = isodate.parse_duration(video["contentDetails"]["duration"]).total_seconds()
@@ -24,6 +33,9 @@ def get_video_details(video_id):
         "totalTime": 0  # Replace with actual value if tracked
     }
 
+def cache_stats():
+    return {"search": search_cache.report(), "videos": video_cache.report()}
+
 def record_watch_time(video_id, watched_time, duration, watch_records):
     if video_id not in watch_records:
         watch_records[video_id] = {"total_time": 0, "duration": duration, "percentage": 0}
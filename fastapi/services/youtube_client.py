@@ -0,0 +1,79 @@
+import os
+import asyncio
+import logging
+
+import httpx
+
+API_KEY = os.environ.get("YOUTUBE_API_KEY", "YOUR_API_KEY")
+BASE_URL = os.environ.get("YOUTUBE_API_BASE_URL", "https://www.googleapis.com/youtube/v3")
+MAX_IDS_PER_REQUEST = 50  # videos?id= 한 번에 보낼 수 있는 최대 ID 수
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+class YouTubeClient:
+    """커넥션 풀을 공유하는 비동기 YouTube Data API 클라이언트"""
+
+    def __init__(self, api_key=API_KEY, base_url=BASE_URL, timeout=5.0,
+                 max_retries=3, backoff=0.5, max_connections=20):
+        self.api_key = api_key
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections),
+        )
+
+    async def _get(self, path, params):
+        params = {**params, "key": self.api_key}
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self._client.get(path, params=params)
+                if response.status_code not in RETRY_STATUS:
+                    response.raise_for_status()
+                    return response.json()
+                error = f"HTTP {response.status_code}"
+            except httpx.TransportError as e:
+                error = str(e) or type(e).__name__
+            if attempt == self.max_retries:
+                raise RuntimeError(f"YouTube API 요청 실패 ({path}): {error}")
+            delay = self.backoff * (2 ** attempt)
+            logging.warning(f"YouTube API 재시도 {attempt + 1}/{self.max_retries} ({path}): {error}")
+            await asyncio.sleep(delay)
+
+    async def search(self, keywords, max_results=10):
+        data = await self._get("/search", {
+            "part": "snippet",
+            "q": " ".join(keywords),  # URL 인코딩 시 공백은 +로 전송됨
+            "type": "video",
+            "maxResults": max_results,
+        })
+        return data.get("items", [])
+
+    async def videos(self, video_ids, part="snippet,contentDetails,statistics"):
+        """영상 상세 정보 (50개씩 나눠 동시에 요청, 입력 순서 유지)"""
+        video_ids = list(video_ids)
+        batches = [video_ids[i:i + MAX_IDS_PER_REQUEST] for i in range(0, len(video_ids), MAX_IDS_PER_REQUEST)]
+        responses = await asyncio.gather(*[
+            self._get("/videos", {"part": part, "id": ",".join(batch)}) for batch in batches
+        ])
+        items = {item["id"]: item for data in responses for item in data.get("items", [])}
+        return [items[video_id] for video_id in video_ids if video_id in items]
+
+    async def aclose(self):
+        await self._client.aclose()
+
+_client = None
+
+def get_client():
+    """프로세스 공유 클라이언트 반환"""
+    global _client
+    if _client is None:
+        _client = YouTubeClient()
+    return _client
+
+async def close_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,100 @@
+"""
+오프라인 부하 테스트용 YouTube Data API 대역 서버
+
+YOUTUBE_API_BASE_URL=http://127.0.0.1:8081/youtube/v3 로 설정하면
+services.youtube_client가 실제 API 대신 이 서버의 녹화된 응답을 사용한다.
+"""
+import os
+import json
+import asyncio
+import logging
+import argparse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+DEFAULT_FIXTURE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "fixtures", "youtube_fixture.json")
+
+def load_fixtures(path=DEFAULT_FIXTURE_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        fixtures = json.load(f)
+    fixtures.setdefault("search", {})
+    fixtures.setdefault("videos", {})
+    return fixtures
+
+def search_item(video):
+    return {"kind": "youtube#searchResult", "id": {"kind": "youtube#video", "videoId": video["id"]},
+            "snippet": video["snippet"]}
+
+def make_handler(fixtures):
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive 지원
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = {key: values[0] for key, values in parse_qs(url.query).items()}
+            if url.path.endswith("/search"):
+                # 녹화되지 않은 검색어는 전체 영상 중 maxResults개를 돌려줌
+                items = fixtures["search"].get(params.get("q", ""))
+                if items is None:
+                    items = [search_item(video) for video in fixtures["videos"].values()]
+                items = items[:int(params.get("maxResults", 10))]
+                self._send(200, {"items": items})
+            elif url.path.endswith("/videos"):
+                ids = [video_id for video_id in params.get("id", "").split(",") if video_id]
+                if len(ids) > 50:
+                    self._send(400, {"error": {"message": "Too many IDs"}})
+                    return
+                items = [fixtures["videos"][video_id] for video_id in ids if video_id in fixtures["videos"]]
+                self._send(200, {"items": items})
+            else:
+                self._send(404, {"error": {"message": "Not found"}})
+
+        def _send(self, status, body):
+            data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            logging.debug(format % args)
+
+    return StubHandler
+
+def make_server(fixture_path=DEFAULT_FIXTURE_PATH, host="127.0.0.1", port=8081):
+    return ThreadingHTTPServer((host, port), make_handler(load_fixtures(fixture_path)))
+
+async def record_fixtures(keyword_lists, path=DEFAULT_FIXTURE_PATH):
+    """실제 API 응답을 녹화해 fixture 파일로 저장"""
+    from services.youtube_client import get_client, close_client
+
+    client = get_client()
+    fixtures = {"search": {}, "videos": {}}
+    for keywords in keyword_lists:
+        items = await client.search(keywords)
+        fixtures["search"][" ".join(keywords)] = items
+        for video in await client.videos([item["id"]["videoId"] for item in items]):
+            fixtures["videos"][video["id"]] = video
+    await close_client()
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(fixtures, f, ensure_ascii=False, indent=2)
+    logging.info(f"fixture 저장 완료: 검색 {len(fixtures['search'])}개, 영상 {len(fixtures['videos'])}개")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description="YouTube Data API 대역 서버")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURE_PATH)
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--record", action="store_true", help="실제 API 응답을 fixture로 녹화")
+    args = parser.parse_args()
+
+    if args.record:
+        from services.keywords import YOUTUBE_SEARCH_KEYWORDS
+        asyncio.run(record_fixtures(list(YOUTUBE_SEARCH_KEYWORDS.values()), args.fixtures))
+    else:
+        server = make_server(args.fixtures, port=args.port)
+        logging.info(f"YouTube 대역 서버 실행: http://127.0.0.1:{args.port}/youtube/v3")
+        server.serve_forever()